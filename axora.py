@@ -6,10 +6,34 @@ Professional desktop application for organizing utility bills
 
 import os
 import re
+import io
+import csv
 import json
+import argparse
+import bisect
+import contextlib
+import copy
+import cProfile
+import errno
+import hashlib
+import heapq
+import multiprocessing
+import pstats
+import random
 import shutil
+import socket
 import sys
+import threading
+import time
+import tracemalloc
+import weakref
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from operator import itemgetter
+from typing import NamedTuple
 
 from PyQt6.QtWidgets import (
     QApplication,
@@ -30,19 +54,4651 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QRadioButton,
+    QCheckBox,
+    QSpinBox,
     QButtonGroup,
     QStatusBar,
     QScrollArea,
     QSplitter,
     QDialog,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
     QDialogButtonBox,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer
 from PyQt6.QtGui import QFont
 
 import pandas as pd
 
 HISTORY_FILE = "axora_history.json"
+SETTINGS_FILE = "axora_settings.json"  # Last-used mapping, source and destination paths
+PROVIDER_RULES_FILE = "axora_providers.json"
+MAPPING_WATCH_INTERVAL_MS = 3000  # How often mapping workbooks are checked for edits
+REPORTS_DIR = "axora_reports"  # Default folder for per-run reports
+SERVICE_PORT = 8765
+COVERAGE_CACHE_FILE = "axora_coverage_cache.json"
+SOURCE_MANIFEST_FILE = "axora_source_manifest.json"
+CHECKSUM_MANIFEST_NAME = ".axora_checksums.json"  # kept in each account folder
+CHECKSUM_CHUNK_SIZE = 1 << 20
+VERIFY_TMP_SUFFIX = ".axora_tmp"  # a verified copy's name until its checksum matches the source
+ARCHIVE_INDEX_NAME = ".axora_archives.json"  # kept in each account folder
+HISTORY_PAGE_SIZE = 200  # History rows rendered at once; search reaches the rest
+IO_SCHEDULE_FILE = "axora_io.json"
+LEASE_FILE_NAME = ".axora_lock"  # kept in an account folder while a workstation changes it
+LEASE_TTL = 60.0  # Seconds before an abandoned lease may be broken
+LEASE_WAIT = 10.0  # Seconds to wait for a busy account before giving up on the file
+SHARDS_DIR = "axora_shards"  # Default folder for the job files of sharded runs
+ACCOUNT_TOKEN_LENGTH = 4  # Trailing account digits in a mapping key, unless a provider rule sets "token_length"
+BATCH_MATCH_MIN = 500  # Runs with at least this many files parse and look up their names in one batch
+
+
+# ------------------------------ Filesystem ------------------------------
+
+class FileSystem:
+    """Filesystem operations used by the organizer.
+
+    The worker and organizer never touch the disk directly; they go through
+    one of these so a run can target the local disk, an in-memory tree, or a
+    wrapper that injects latency and failures.
+    """
+
+    def exists(self, path: str) -> bool:
+        raise NotImplementedError
+
+    def isfile(self, path: str) -> bool:
+        raise NotImplementedError
+
+    def isdir(self, path: str) -> bool:
+        raise NotImplementedError
+
+    def listdir(self, path: str) -> list[str]:
+        raise NotImplementedError
+
+    def scandir(self, path: str) -> list[tuple[str, bool]]:
+        """(name, is_dir) for each entry; backends that can tell cheaply override this"""
+        return [(name, self.isdir(os.path.join(path, name))) for name in self.listdir(path)]
+
+    def makedirs(self, path: str, exist_ok: bool = False) -> None:
+        raise NotImplementedError
+
+    def move(self, src: str, dst: str) -> None:
+        raise NotImplementedError
+
+    def remove(self, path: str) -> None:
+        raise NotImplementedError
+
+    def rmdir(self, path: str) -> None:
+        """Remove an empty directory"""
+        raise NotImplementedError
+
+    def create_exclusive(self, path: str, data: bytes = b"") -> bool:
+        """Create a file only if nothing exists at path; False if something does"""
+        raise NotImplementedError
+
+    def getsize(self, path: str) -> int:
+        raise NotImplementedError
+
+    def getmtime(self, path: str) -> float:
+        raise NotImplementedError
+
+    def stat(self, path: str) -> tuple[int, float]:
+        """(size, mtime) of a file"""
+        return self.getsize(path), self.getmtime(path)
+
+    def file_stats(self, path: str) -> dict[str, tuple[int, float]]:
+        """(size, mtime) of every file in a folder, from one listing where the backend allows"""
+        return {name: self.stat(os.path.join(path, name))
+                for name, is_dir in self.scandir(path) if not is_dir}
+
+    def open(self, path: str, mode: str = "rb"):
+        raise NotImplementedError
+
+
+class LocalFileSystem(FileSystem):
+    """The real disk"""
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def isfile(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def isdir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def listdir(self, path: str) -> list[str]:
+        return os.listdir(path)
+
+    def scandir(self, path: str) -> list[tuple[str, bool]]:
+        with os.scandir(path) as entries:
+            return [(entry.name, entry.is_dir()) for entry in entries]
+
+    def makedirs(self, path: str, exist_ok: bool = False) -> None:
+        os.makedirs(path, exist_ok=exist_ok)
+
+    def move(self, src: str, dst: str) -> None:
+        shutil.move(src, dst)
+
+    def remove(self, path: str) -> None:
+        os.remove(path)
+
+    def rmdir(self, path: str) -> None:
+        os.rmdir(path)
+
+    def create_exclusive(self, path: str, data: bytes = b"") -> bool:
+        # O_EXCL creation is atomic on local disks and SMB/NFSv3+ shares
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return True
+
+    def getsize(self, path: str) -> int:
+        return os.path.getsize(path)
+
+    def getmtime(self, path: str) -> float:
+        return os.path.getmtime(path)
+
+    def stat(self, path: str) -> tuple[int, float]:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime
+
+    def file_stats(self, path: str) -> dict[str, tuple[int, float]]:
+        stats = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    stats[entry.name] = (st.st_size, st.st_mtime)
+        return stats
+
+    def open(self, path: str, mode: str = "rb"):
+        if "b" in mode:
+            return open(path, mode)
+        return open(path, mode, encoding="utf-8")
+
+
+class _MemoryWriter(io.BytesIO):
+    """Buffer that stores its contents in a MemoryFileSystem when closed"""
+
+    def __init__(self, fs, path, initial=b""):
+        super().__init__(initial)
+        self.seek(0, io.SEEK_END)
+        self._fs = fs
+        self._path = path
+
+    def close(self):
+        if not self.closed:
+            self._fs.write_file(self._path, self.getvalue())
+        super().close()
+
+
+class MemoryFileSystem(FileSystem):
+    """In-memory directory tree, used to simulate and benchmark large runs"""
+
+    def __init__(self):
+        self._dirs = {}  # normalized dir path -> set of child names
+        self._files = {}  # normalized file path -> bytes
+        self._mtimes = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _norm(path: str) -> str:
+        return os.path.normpath(path)
+
+    @staticmethod
+    def _parent(path: str) -> str:
+        return os.path.dirname(path) or os.curdir
+
+    def _touch(self, path: str) -> None:
+        self._mtimes[path] = time.time()
+
+    def exists(self, path: str) -> bool:
+        path = self._norm(path)
+        return path in self._files or path in self._dirs
+
+    def isfile(self, path: str) -> bool:
+        return self._norm(path) in self._files
+
+    def isdir(self, path: str) -> bool:
+        return self._norm(path) in self._dirs
+
+    def listdir(self, path: str) -> list[str]:
+        path = self._norm(path)
+        with self._lock:
+            if path in self._dirs:
+                return list(self._dirs[path])
+        if path in self._files:
+            raise NotADirectoryError(errno.ENOTDIR, "Not a directory", path)
+        raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+
+    def makedirs(self, path: str, exist_ok: bool = False) -> None:
+        path = self._norm(path)
+        with self._lock:
+            if path in self._dirs:
+                if not exist_ok:
+                    raise FileExistsError(errno.EEXIST, "File exists", path)
+                return
+            missing = []
+            current = path
+            while current not in self._dirs:
+                if current in self._files:
+                    raise FileExistsError(errno.EEXIST, "File exists", current)
+                missing.append(current)
+                parent = self._parent(current)
+                if parent == current:
+                    break
+                current = parent
+            for d in reversed(missing):
+                self._dirs[d] = set()
+                self._touch(d)
+                parent = self._parent(d)
+                if parent != d and parent in self._dirs:
+                    self._dirs[parent].add(os.path.basename(d))
+                    self._touch(parent)
+
+    def move(self, src: str, dst: str) -> None:
+        src, dst = self._norm(src), self._norm(dst)
+        with self._lock:
+            if src not in self._files:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", src)
+            if dst in self._dirs:
+                dst = os.path.join(dst, os.path.basename(src))
+            dst_parent = self._parent(dst)
+            if dst_parent not in self._dirs:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", dst)
+            self._files[dst] = self._files.pop(src)
+            self._mtimes[dst] = self._mtimes.pop(src, time.time())
+            src_parent = self._parent(src)
+            self._dirs[src_parent].discard(os.path.basename(src))
+            self._dirs[dst_parent].add(os.path.basename(dst))
+            self._touch(src_parent)
+            self._touch(dst_parent)
+
+    def remove(self, path: str) -> None:
+        path = self._norm(path)
+        with self._lock:
+            if path not in self._files:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+            del self._files[path]
+            self._mtimes.pop(path, None)
+            parent = self._parent(path)
+            self._dirs[parent].discard(os.path.basename(path))
+            self._touch(parent)
+
+    def rmdir(self, path: str) -> None:
+        path = self._norm(path)
+        with self._lock:
+            if path not in self._dirs:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+            if self._dirs[path]:
+                raise OSError(errno.ENOTEMPTY, "Directory not empty", path)
+            del self._dirs[path]
+            self._mtimes.pop(path, None)
+            parent = self._parent(path)
+            if parent in self._dirs:
+                self._dirs[parent].discard(os.path.basename(path))
+                self._touch(parent)
+
+    def create_exclusive(self, path: str, data: bytes = b"") -> bool:
+        norm = self._norm(path)
+        with self._lock:
+            if norm in self._files or norm in self._dirs:
+                return False
+            if self._parent(norm) not in self._dirs:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+            self.write_file(norm, data)
+            return True
+
+    def getsize(self, path: str) -> int:
+        path = self._norm(path)
+        if path in self._files:
+            return len(self._files[path])
+        if path in self._dirs:
+            return 0
+        raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+
+    def getmtime(self, path: str) -> float:
+        path = self._norm(path)
+        try:
+            return self._mtimes[path]
+        except KeyError:
+            raise FileNotFoundError(errno.ENOENT, "No such file or directory", path) from None
+
+    def open(self, path: str, mode: str = "rb"):
+        norm = self._norm(path)
+        if "r" in mode and "+" not in mode:
+            if norm not in self._files:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+            raw = io.BytesIO(self._files[norm])
+        else:
+            if self._parent(norm) not in self._dirs:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path)
+            initial = self._files.get(norm, b"") if "a" in mode else b""
+            raw = _MemoryWriter(self, norm, initial)
+        if "b" in mode:
+            return raw
+        return io.TextIOWrapper(raw, encoding="utf-8")
+
+    def write_file(self, path: str, data: bytes = b"") -> None:
+        """Create or replace a file, creating parent folders as needed"""
+        path = self._norm(path)
+        with self._lock:
+            parent = self._parent(path)
+            self.makedirs(parent, exist_ok=True)
+            self._files[path] = bytes(data)
+            self._touch(path)
+            self._dirs[parent].add(os.path.basename(path))
+            self._touch(parent)
+
+
+class LatencyFileSystem(FileSystem):
+    """Wraps another filesystem, adding per-call latency and injected failures.
+
+    ``latency`` is seconds per call, either a single number or a dict keyed by
+    operation name ("listdir", "move", ...). With ``failure_rate`` > 0, calls to
+    the operations in ``fail_ops`` time out (OSError ETIMEDOUT) with that
+    probability, which reproduces a flaky network share.
+    """
+
+    def __init__(self, inner: FileSystem, latency=0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, fail_ops=("move", "makedirs"), seed=None):
+        self.inner = inner
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.fail_ops = frozenset(fail_ops)
+        self._rng = random.Random(seed)
+
+    def _call(self, op: str, *args, **kwargs):
+        delay = self.latency.get(op, 0.0) if isinstance(self.latency, dict) else self.latency
+        if self.jitter:
+            delay += self._rng.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if self.failure_rate and op in self.fail_ops and self._rng.random() < self.failure_rate:
+            raise OSError(errno.ETIMEDOUT, f"Injected {op} failure", args[0] if args else None)
+        return getattr(self.inner, op)(*args, **kwargs)
+
+    def exists(self, path: str) -> bool:
+        return self._call("exists", path)
+
+    def isfile(self, path: str) -> bool:
+        return self._call("isfile", path)
+
+    def isdir(self, path: str) -> bool:
+        return self._call("isdir", path)
+
+    def listdir(self, path: str) -> list[str]:
+        return self._call("listdir", path)
+
+    def scandir(self, path: str) -> list[tuple[str, bool]]:
+        return self._call("scandir", path)
+
+    def makedirs(self, path: str, exist_ok: bool = False) -> None:
+        self._call("makedirs", path, exist_ok=exist_ok)
+
+    def move(self, src: str, dst: str) -> None:
+        self._call("move", src, dst)
+
+    def remove(self, path: str) -> None:
+        self._call("remove", path)
+
+    def rmdir(self, path: str) -> None:
+        self._call("rmdir", path)
+
+    def create_exclusive(self, path: str, data: bytes = b"") -> bool:
+        return self._call("create_exclusive", path, data)
+
+    def getsize(self, path: str) -> int:
+        return self._call("getsize", path)
+
+    def getmtime(self, path: str) -> float:
+        return self._call("getmtime", path)
+
+    def stat(self, path: str) -> tuple[int, float]:
+        return self._call("stat", path)
+
+    def file_stats(self, path: str) -> dict[str, tuple[int, float]]:
+        return self._call("file_stats", path)
+
+    def open(self, path: str, mode: str = "rb"):
+        return self._call("open", path, mode)
+
+
+# ------------------------------ I/O Scheduling ------------------------------
+
+class TokenBucket:
+    """Rate limiter: ``take(n)`` waits until n tokens are available at ``rate`` per second.
+
+    Up to ``burst`` tokens (one second's worth by default) accumulate while
+    idle. A take larger than what is available borrows against future tokens
+    and sleeps off the debt, so one large file is paced rather than refused.
+    A rate of 0 means unlimited.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: float = None):
+        self._lock = threading.Lock()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate: float, burst: float = None):
+        with self._lock:
+            self.rate = max(0.0, float(rate or 0))
+            self.burst = float(burst) if burst else self.rate
+            self.tokens = self.burst
+            self.stamp = time.monotonic()
+
+    def take(self, amount: float = 1.0) -> float:
+        """Consume tokens, sleeping as needed; returns the seconds waited"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class IOProfile(NamedTuple):
+    """I/O budget for a time window; 0 means unlimited"""
+    bytes_per_s: float = 0.0
+    ops_per_s: float = 0.0
+    start: int = 0  # minutes after midnight, local time
+    end: int = 24 * 60  # exclusive; before start means the window runs past midnight
+    days: tuple = (0, 1, 2, 3, 4, 5, 6)  # Monday is 0
+
+
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_CLOCK_RE = re.compile(r"(\d{1,2}):([0-5]\d)")
+
+
+def _parse_clock(value, field: str) -> int:
+    """"8:00", "08:00" or "24:00" -> minutes after midnight"""
+    m = _CLOCK_RE.fullmatch(value.strip()) if isinstance(value, str) else None
+    minutes = int(m.group(1)) * 60 + int(m.group(2)) if m else -1
+    if not 0 <= minutes <= 24 * 60:
+        raise ValueError(f"I/O schedule {field} must be a time from 0:00 to 24:00 such as 8:00 or 18:30, "
+                         f"not {value!r}")
+    return minutes
+
+
+def _parse_days(spec) -> tuple:
+    """"mon-fri", "sat,sun" or a list of day names -> weekday numbers"""
+    if not spec:
+        return tuple(range(7))
+    days = set()
+    for part in (spec.split(",") if isinstance(spec, str) else spec):
+        first, _, last = part.strip().lower().partition("-")
+        start = _WEEKDAYS.index(first[:3])
+        stop = _WEEKDAYS.index(last[:3]) if last else start
+        days.update(range(start, stop + 1) if start <= stop else [*range(start, 7), *range(stop + 1)])
+    return tuple(sorted(days))
+
+
+class IOSchedule:
+    """Picks the I/O budget for the current time of day.
+
+    The first profile whose days and window contain the time wins; outside
+    every window ``default`` applies. Loaded from ``axora_io.json``::
+
+        {"low_priority": true,
+         "default": {"mb_per_s": 0, "ops_per_s": 0},
+         "profiles": [{"days": "mon-fri", "start": "08:00", "end": "18:00",
+                       "mb_per_s": 5, "ops_per_s": 40}]}
+    """
+
+    def __init__(self, profiles=(), default: IOProfile = IOProfile(), low_priority: bool = False):
+        self.profiles = list(profiles)
+        self.default = default
+        self.low_priority = low_priority
+
+    @staticmethod
+    def _profile(data: dict) -> IOProfile:
+        return IOProfile(
+            bytes_per_s=float(data.get("mb_per_s", 0)) * 1e6 + float(data.get("bytes_per_s", 0)),
+            ops_per_s=float(data.get("ops_per_s", 0)),
+            start=_parse_clock(data.get("start", "00:00"), "start"),
+            end=_parse_clock(data.get("end", "24:00"), "end"),
+            days=_parse_days(data.get("days")),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IOSchedule":
+        return cls([cls._profile(p) for p in data.get("profiles", [])],
+                   cls._profile(data.get("default", {})), bool(data.get("low_priority")))
+
+    def current(self, now: datetime = None) -> IOProfile:
+        now = now or datetime.now()
+        clock = now.hour * 60 + now.minute
+        for profile in self.profiles:
+            if profile.start <= profile.end:
+                inside = now.weekday() in profile.days and profile.start <= clock < profile.end
+            else:
+                # Overnight window: the part after midnight belongs to the previous day
+                inside = ((now.weekday() in profile.days and clock >= profile.start)
+                          or ((now.weekday() - 1) % 7 in profile.days and clock < profile.end))
+            if inside:
+                return profile
+        return self.default
+
+    @property
+    def unlimited(self) -> bool:
+        return not self.default.bytes_per_s and not self.default.ops_per_s and not any(
+            p.bytes_per_s or p.ops_per_s for p in self.profiles)
+
+
+def load_io_schedule(path: str = None):
+    """The IOSchedule in ``path`` (default IO_SCHEDULE_FILE), or None if there is none"""
+    path = path or IO_SCHEDULE_FILE
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return IOSchedule.from_dict(json.load(f))
+
+
+def lower_process_priority() -> list[str]:
+    """Run the rest of this process at background CPU and I/O priority; returns what was applied"""
+    applied = []
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_MODE_BACKGROUND_BEGIN lowers CPU, I/O and memory priority together
+        if kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), 0x00100000):
+            applied.append("background mode")
+        return applied
+    try:
+        os.nice(10)
+        applied.append("nice +10")
+    except OSError:
+        pass
+    if sys.platform.startswith("linux") and shutil.which("ionice"):
+        import subprocess
+        result = subprocess.run(["ionice", "-c", "3", "-p", str(os.getpid())], capture_output=True)
+        if result.returncode == 0:
+            applied.append("ionice idle")
+    return applied
+
+
+def scheduled_filesystem(fs: FileSystem, schedule) -> FileSystem:
+    """Apply an IOSchedule: lower this process's priority if asked and pace ``fs``"""
+    if schedule is None:
+        return fs
+    if schedule.low_priority:
+        lower_process_priority()
+    return fs if schedule.unlimited else ThrottledFileSystem(fs, schedule)
+
+
+class _ThrottledFile:
+    """File object whose reads and writes are paced by a ThrottledFileSystem"""
+
+    def __init__(self, raw, fs: "ThrottledFileSystem"):
+        self._raw = raw
+        self._fs = fs
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        self._fs._charge_bytes(len(data))
+        return data
+
+    def readinto(self, buffer):
+        n = self._raw.readinto(buffer)
+        self._fs._charge_bytes(n or 0)
+        return n
+
+    def write(self, data):
+        self._fs._charge_bytes(len(data))
+        return self._raw.write(data)
+
+    def __iter__(self):
+        for line in self._raw:
+            self._fs._charge_bytes(len(line))
+            yield line
+
+    def __enter__(self):
+        self._raw.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._raw.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class ThrottledFileSystem(FileSystem):
+    """Wraps another filesystem, keeping its traffic within an IOSchedule.
+
+    Every call takes an operation token; a move takes the file's size in
+    byte tokens first (a move onto a share is a copy), and files opened
+    through it are paced as they are read or written. The budget follows the
+    schedule's time-of-day profiles, re-checked at most once a minute.
+    """
+
+    RECHECK_SECONDS = 60.0
+
+    def __init__(self, inner: FileSystem, schedule: IOSchedule):
+        self.inner = inner
+        self.schedule = schedule
+        self.bytes_bucket = TokenBucket()
+        self.ops_bucket = TokenBucket()
+        self.profile = None
+        self._checked = 0.0
+
+    def _refresh(self):
+        now = time.monotonic()
+        if now - self._checked < self.RECHECK_SECONDS:
+            return
+        self._checked = now
+        profile = self.schedule.current()
+        if profile != self.profile:
+            self.profile = profile
+            self.bytes_bucket.set_rate(profile.bytes_per_s)
+            self.ops_bucket.set_rate(profile.ops_per_s)
+
+    def _charge_bytes(self, amount: int):
+        if amount:
+            waited = self.bytes_bucket.take(amount)
+            if waited:
+                METRICS.inc("axora_io_throttled_seconds", waited)
+
+    def _call(self, op: str, *args, **kwargs):
+        self._refresh()
+        waited = self.ops_bucket.take()
+        if waited:
+            METRICS.inc("axora_io_throttled_seconds", waited)
+        return getattr(self.inner, op)(*args, **kwargs)
+
+    def exists(self, path: str) -> bool:
+        return self._call("exists", path)
+
+    def isfile(self, path: str) -> bool:
+        return self._call("isfile", path)
+
+    def isdir(self, path: str) -> bool:
+        return self._call("isdir", path)
+
+    def listdir(self, path: str) -> list[str]:
+        return self._call("listdir", path)
+
+    def scandir(self, path: str) -> list[tuple[str, bool]]:
+        return self._call("scandir", path)
+
+    def makedirs(self, path: str, exist_ok: bool = False) -> None:
+        self._call("makedirs", path, exist_ok=exist_ok)
+
+    def move(self, src: str, dst: str) -> None:
+        self._refresh()
+        if self.bytes_bucket.rate:
+            self._charge_bytes(self.inner.getsize(src))
+        self._call("move", src, dst)
+
+    def remove(self, path: str) -> None:
+        self._call("remove", path)
+
+    def rmdir(self, path: str) -> None:
+        self._call("rmdir", path)
+
+    def create_exclusive(self, path: str, data: bytes = b"") -> bool:
+        return self._call("create_exclusive", path, data)
+
+    def getsize(self, path: str) -> int:
+        return self._call("getsize", path)
+
+    def getmtime(self, path: str) -> float:
+        return self._call("getmtime", path)
+
+    def stat(self, path: str) -> tuple[int, float]:
+        return self._call("stat", path)
+
+    def file_stats(self, path: str) -> dict[str, tuple[int, float]]:
+        return self._call("file_stats", path)
+
+    def open(self, path: str, mode: str = "rb"):
+        raw = self._call("open", path, mode)
+        return _ThrottledFile(raw, self) if self.bytes_bucket.rate else raw
+
+
+# ------------------------------ Filename Parsing ------------------------------
+
+class ParsedFilename(NamedTuple):
+    """Everything the organizer needs from a bill's filename"""
+    account_last4: str
+    account_ext: str
+    date: str  # YYYY-MM-DD, or "" when the name has no date
+    year: str
+    final_name: str  # YY-MM-DD plus the original file extension
+
+
+# One scan splits a name into digit runs, whitespace runs, letter runs and
+# single other characters. Each token also gets one character in a signature
+# string ("d" digits, "s" whitespace, the character itself for - _ ( and ),
+# "o" otherwise) so the rules below can locate token patterns with str.find.
+_TOKEN_RE = re.compile(r"\d+|\s+|[^\W\d_]+|.", re.DOTALL)
+_PUNCT_SIG = {"-": "-", "_": "_", "(": "(", ")": ")"}
+
+
+def _token_sig(token: str) -> str:
+    first = token[0]
+    if first.isdecimal():  # what \d matches
+        return "d"
+    if first.isspace():  # what \s matches
+        return "s"
+    return _PUNCT_SIG.get(first, "o")
+
+
+# Signature of every ASCII character, so ASCII names are classified in one translate()
+_ASCII_SIG = str.maketrans({chr(c): _token_sig(chr(c)) for c in range(128)})
+_EXT_CANDIDATE_RE = re.compile(r"[\dA-Za-z]{2,6}")
+
+
+def _tokenize(text: str) -> tuple[str, list[str]]:
+    texts = _TOKEN_RE.findall(text)
+    firsts = "".join(map(itemgetter(0), texts))
+    if firsts.isascii():
+        return firsts.translate(_ASCII_SIG), texts
+    return "".join([_token_sig(t) for t in texts]), texts
+
+
+# Every step below is a constant number of forward scans over the name's
+# tokens, so parsing stays linear in the name's length however it is built.
+# Where runs have to be joined, the pieces are collected and joined once:
+# appending to a growing run one piece at a time would copy it each time.
+
+def _merge_runs(sig, texts: list[str]) -> tuple[str, list[str]]:
+    """Drop emptied tokens and join digit/whitespace runs left adjacent by a removal"""
+    out_s, out_t = [], []
+    for k, t in zip(sig, texts):
+        if not t:
+            continue
+        if out_s and out_s[-1] == k and k in "ds":
+            out_t[-1].append(t)
+        else:
+            out_s.append(k)
+            out_t.append([t])
+    return "".join(out_s), ["".join(pieces) for pieces in out_t]
+
+
+def _splice(sig, texts, keep):
+    """Keep only the [a, b) token ranges listed in ``keep``, as a substitution would.
+
+    Tokens emptied by trimming may only sit at the ends of a range, and runs can
+    only become adjacent where two ranges meet, so that is all that's checked.
+    """
+    out_sig, out_texts, joined = [], [], {}  # joined: output index -> pieces of a merged run
+    last = ""
+    for a, b in keep:
+        while a < b and not texts[a]:
+            a += 1
+        while b > a and not texts[b - 1]:
+            b -= 1
+        if a == b:
+            continue
+        if sig[a] == last and last in "ds":
+            joined.setdefault(len(out_texts) - 1, [out_texts[-1]]).append(texts[a])
+            a += 1
+        if a < b:
+            out_sig.append(sig[a:b])
+            out_texts += texts[a:b]
+            last = sig[b - 1]
+    for i, pieces in joined.items():
+        out_texts[i] = "".join(pieces)
+    return "".join(out_sig), out_texts
+
+
+def _find_dash_date(sig, texts, head_len, exact_head, start=0) -> int:
+    """Index of the first D-DD-DD token group at or after ``start`` whose head run
+    has head_len digits (at least head_len unless exact_head), or -1"""
+    i = sig.find("d-d-d", start)
+    while i >= 0:
+        head = len(texts[i])
+        if ((head == head_len if exact_head else head >= head_len)
+                and len(texts[i + 2]) == 2 and len(texts[i + 4]) >= 2):
+            return i
+        i = sig.find("d-d-d", i + 1)
+    return -1
+
+
+def _date_parts(sig, texts):
+    """(yyyy, mm, dd) using the same priorities as extract_date_targets"""
+    # Priority 1: last "-YYYYMMDD" starting with 19 or 20
+    i = sig.rfind("-d")
+    while i >= 0:
+        run = texts[i + 1]
+        if len(run) >= 8 and run[:2] in ("19", "20"):
+            return run[:4], run[4:6], run[6:8]
+        i = sig.rfind("-d", 0, i)
+    # Priority 2/3: first YYYY-MM-DD, then first YY-MM-DD
+    for head_len in (4, 2):
+        i = _find_dash_date(sig, texts, head_len, False)
+        if i >= 0:
+            head = texts[i][-head_len:]
+            return (head if head_len == 4 else f"20{head}"), texts[i + 2], texts[i + 4][:2]
+    return None
+
+
+def _cut_dash_dates(sig, texts, lead, head_len):
+    """Remove [lead]D{head_len}-DD-DD matches, as re.sub does, over tokens"""
+    i = _find_dash_date(sig, texts, head_len, bool(lead))
+    if i < 0:
+        return sig, texts
+    keep, last = [], 0
+    texts = list(texts)
+    while i >= 0:
+        if lead:
+            if i == 0 or sig[i - 1] != lead:
+                i = _find_dash_date(sig, texts, head_len, True, i + 1)
+                continue
+            keep.append((last, i - 1))
+        else:
+            texts[i] = texts[i][:-head_len]
+            keep.append((last, i + 1))
+        rest = texts[i + 4][2:]
+        if rest:
+            # The match ended inside a digit run; keep scanning from what's left
+            texts[i + 4] = rest
+            last = i + 4
+        else:
+            last = i + 5
+        i = _find_dash_date(sig, texts, head_len, bool(lead), last)
+    if not keep:
+        return sig, texts
+    keep.append((last, len(texts)))
+    return _splice(sig, texts, keep)
+
+
+def _century_cuts(run: str) -> list[str]:
+    """The pieces of ``run`` left around its (19|20)DDDDDD matches, or [] if none.
+
+    Each century's next position is only searched for again once the scan
+    has passed it, so the run is read at most twice.
+    """
+    parts, start, end = [], 0, len(run) - 6
+    p19, p20 = run.find("19", 0, end), run.find("20", 0, end)
+    while p19 >= 0 or p20 >= 0:
+        p = p20 if p19 < 0 else p19 if p20 < 0 else min(p19, p20)
+        parts.append(run[start:p])
+        start = p + 8
+        if 0 <= p19 < start:
+            p19 = run.find("19", start, end)
+        if 0 <= p20 < start:
+            p20 = run.find("20", start, end)
+    if parts:
+        parts.append(run[start:])
+    return parts
+
+
+def _cut_compact_dates(sig, texts):
+    """Remove -DDDDDDDD, then any (19|20)DDDDDD inside digit runs"""
+    i = sig.find("-d")
+    if i >= 0:
+        keep, last = [], 0
+        while i >= 0:
+            if len(texts[i + 1]) >= 8:
+                if not keep:
+                    texts = list(texts)
+                keep.append((last, i))
+                texts[i + 1] = texts[i + 1][8:]
+                last = i + 1
+            i = sig.find("-d", i + 2)
+        if keep:
+            keep.append((last, len(texts)))
+            sig, texts = _splice(sig, texts, keep)
+
+    copied = False
+    for idx, run in enumerate(texts):
+        if len(run) < 8 or sig[idx] != "d":
+            continue
+        parts = _century_cuts(run)
+        if parts:
+            if not copied:
+                texts, copied = list(texts), True
+            texts[idx] = "".join(parts)
+    if copied:
+        return _merge_runs(sig, texts)
+    return sig, texts
+
+
+def _cut_parens(sig, texts):
+    """Remove every (...) group with non-empty contents"""
+    keep, last = [], 0
+    i = sig.find("(")
+    while i >= 0:
+        j = sig.find(")", i + 1)
+        if j < 0:
+            break
+        if j > i + 1:
+            keep.append((last, i))
+            last = j + 1
+        # Every "(" before j closes at j, so resume after it
+        i = sig.find("(", j + 1)
+    if not keep:
+        return sig, texts
+    keep.append((last, len(texts)))
+    return _splice(sig, texts, keep)
+
+
+def _spells(texts, start, word):
+    """Where ``word`` ends if it starts at texts[start]: (token index, characters
+    used from that token), with 0 used when it ends on a token boundary"""
+    pos, i, n = 0, start, len(texts)
+    while pos < len(word) and i < n:
+        t = texts[i]
+        take = min(len(t), len(word) - pos)
+        if t[:take] != word[pos:pos + take]:
+            return None
+        pos += take
+        if take < len(t):
+            return i, take
+        i += 1
+    return (i, 0) if pos == len(word) else None
+
+
+def _cut_ext(sig, texts, ext):
+    """Remove whitespace + ext + "-", then whitespace + ext + optional whitespace"""
+    copied = False
+    for dash in (True, False):
+        keep, last = [], 0
+        i = sig.find("s")
+        while i >= 0:
+            hit = _spells(texts, i + 1, ext)
+            end = i + 1
+            if hit:
+                j, used = hit
+                if dash:
+                    if not used and j < len(sig) and sig[j] == "-":
+                        keep.append((last, i))
+                        last = end = j + 1
+                else:
+                    keep.append((last, i))
+                    if used:
+                        if not copied:
+                            texts, copied = list(texts), True
+                        texts[j] = texts[j][used:]
+                    elif j < len(sig) and sig[j] == "s":
+                        j += 1
+                    last = end = j
+            i = sig.find("s", end)
+        if keep:
+            keep.append((last, len(texts)))
+            sig, texts = _splice(sig, texts, keep)
+    return sig, texts
+
+
+def _account_ext(sig, texts) -> str:
+    # Format 1: extension in parentheses; an invalid one still blocks the other formats
+    i = sig.find("(")
+    while i >= 0:
+        j = sig.find(")", i + 1)
+        if j < 0:
+            break
+        if j > i + 1:
+            candidate = "".join(texts[i + 1:j]).strip()
+            return candidate if _EXT_CANDIDATE_RE.fullmatch(candidate) else ""
+        i = sig.find("(", j + 1)
+    # Format 2: spaces + 2-4 digits + dash
+    i = sig.find("sd-")
+    while i >= 0:
+        if 2 <= len(texts[i + 1]) <= 4:
+            return texts[i + 1]
+        i = sig.find("sd-", i + 1)
+    # Format 3: space-separated 3-4 digits at the end
+    k = len(sig) - (2 if sig.endswith("sds") else 1)
+    if k >= 1 and sig[k - 1:k + 1] == "sd" and 3 <= len(texts[k]) <= 4:
+        return texts[k]
+    return ""
+
+
+def _account_digits(sig, texts) -> str:
+    """The digits of the account number, whose last few are its mapping token"""
+    # Phone numbers: only the first match of each pattern counts, as with re.search
+    for shape in ("dsdsd", "d-d-d"):
+        i = sig.find(shape)
+        while i >= 0:
+            head = texts[i]
+            if len(head) >= 3 and len(texts[i + 2]) == 3 and len(texts[i + 4]) >= 4:
+                if len(head) == 3 and (i == 0 or not texts[i - 1][-1].isalnum()):
+                    return head + texts[i + 2] + texts[i + 4][:4]
+                break
+            i = sig.find(shape, i + 1)
+    for width in (10, 9):
+        for i, run in enumerate(texts):
+            if len(run) >= width and sig[i] == "d":
+                if i == 0 or not texts[i - 1][-1].isalnum():
+                    return run[:width]
+                break
+
+    # Account numbers: 7-10 digit chunks, longest then rightmost
+    best = None
+    for i, run in enumerate(texts):
+        if len(run) < 7 or sig[i] != "d":
+            continue
+        pos = 0
+        while len(run) - pos >= 7:
+            size = min(10, len(run) - pos)
+            if pos or i == 0 or not texts[i - 1][-1].isalpha():
+                if best is None or (size, i, pos) > best:
+                    best = (size, i, pos)
+            pos += size
+    if best:
+        size, i, pos = best
+        return texts[i][pos:pos + size]
+
+    # Fallback: the last run of 4+ digits that isn't a bare year
+    for i in range(len(texts) - 1, -1, -1):
+        run = texts[i]
+        if len(run) < 4 or sig[i] != "d":
+            continue
+        if len(run) == 4 and run[:2] in ("19", "20"):
+            continue
+        if i > 0 and texts[i - 1][-1].isalpha():
+            continue
+        return run
+    return ""
+
+
+def _account_token(digits: str, token_length: int) -> str:
+    return digits[-token_length:] if len(digits) >= token_length else ""
+
+
+def parse_filename(file_name: str, token_length: int = ACCOUNT_TOKEN_LENGTH) -> ParsedFilename:
+    """Parse a bill filename in one scan.
+
+    Returns the same account tokens as BillOrganizer.extract_account_tokens and
+    the same date targets as BillOrganizer.extract_date_targets (which are kept
+    as the reference implementation), but tokenizes the name once and works on
+    the tokens instead of running a chain of regex searches and substitutions.
+    ``account_last4`` holds the last ``token_length`` digits of the account.
+    """
+    base, file_ext = os.path.splitext(file_name)
+    sig, texts = _tokenize(base)
+
+    parts = _date_parts(sig, texts)
+    if parts:
+        yyyy, mm, dd = parts
+        date, year, final_name = f"{yyyy}-{mm}-{dd}", yyyy, f"{yyyy[2:]}-{mm}-{dd}{file_ext}"
+    else:
+        date = year = final_name = ""
+
+    ext = _account_ext(sig, texts)
+
+    work = sig, texts
+    for lead, head_len in ((("_", 4), ("_", 2), (None, 4), (None, 2)) if "d-d-d" in sig else ()):
+        if "d-d-d" in work[0]:
+            work = _cut_dash_dates(*work, lead, head_len)
+    work = _cut_compact_dates(*work)
+    if ext:
+        work = _cut_parens(*work)
+        work = _cut_ext(*work, ext)
+
+    return ParsedFilename(_account_token(_account_digits(*work), token_length), ext, date, year, final_name)
+
+
+
+# The names most inboxes are made of, which parse_filename is known to read as:
+# last4 = last 4 digits of the 7-10 digit account, no extension, the date from
+# whichever date group matched. Anything else, or an account the compact-date
+# rule would cut into ((19|20) and 6 more digits inside it), is parsed per name.
+_BATCH_NAME_RE = re.compile(r"(?:[A-Za-z]+(?: |_| - ))?(\d{7,10})"
+                            r"(?:(?:[_-](\d{4})|_(\d{2}))-(\d{2})-(\d{2})|-((?:19|20)\d{2})(\d{2})(\d{2}))?"
+                            r"(\.[Pp][Dd][Ff])\Z")
+_BATCH_CUT_RE = re.compile(r"\d{0,2}(?:19|20)\d{6}")
+
+
+def _batch_parsed(groups, token_length: int) -> ParsedFilename:
+    account, yyyy, yy, mm, dd, cyyyy, cmm, cdd, file_ext = groups
+    token = _account_token(account, token_length)
+    if yy:
+        yyyy = "20" + yy
+    elif cyyyy:
+        yyyy, mm, dd = cyyyy, cmm, cdd
+    if not yyyy:
+        return ParsedFilename(token, "", "", "", "")
+    return ParsedFilename(token, "", f"{yyyy}-{mm}-{dd}", yyyy, f"{yyyy[2:]}-{mm}-{dd}{file_ext}")
+
+
+def parse_filenames(names) -> pd.DataFrame:
+    """Parse a whole scan's worth of bill filenames at once.
+
+    Returns one row per name, in order: "name" and the ParsedFilename
+    fields, equal to parse_filename on every name. One pass of a single
+    compiled pattern sorts out the common shapes, whose fields need no
+    tokenizing; only the rest go through parse_filename.
+    """
+    names = list(names)
+    return _parsed_table(names, _parse_batch(names))
+
+
+def _parse_batch(names: list[str], token_length: int = ACCOUNT_TOKEN_LENGTH) -> list[ParsedFilename]:
+    return [_batch_parsed(m.groups(), token_length) if m is not None and not _BATCH_CUT_RE.match(m.group(1))
+            else parse_filename(name, token_length)
+            for name, m in zip(names, map(_BATCH_NAME_RE.match, names))]
+
+
+def _parsed_table(names: list[str], parsed: list[ParsedFilename]) -> pd.DataFrame:
+    columns = list(zip(*parsed)) if parsed else [()] * len(ParsedFilename._fields)
+    table = pd.DataFrame(dict(zip(ParsedFilename._fields, columns)), columns=ParsedFilename._fields)
+    table.insert(0, "name", names)
+    return table
+
+# ------------------------------ Provider Rules ------------------------------
+
+# Used when there is no rules file. Order is lookup priority when a filename
+# doesn't name its provider. "filename_patterns" are optional regexes that
+# recognize a provider's own filename format; a named group "account" (and
+# optionally "ext") supplies the tokens. "token_length" (default 4) is how many
+# trailing account digits key the provider's accounts, in the mapping and in
+# bill names alike.
+DEFAULT_PROVIDER_RULES = {
+    "providers": [
+        {"name": "BELL", "folder": "Bell", "aliases": ["BELL"]},
+        {"name": "TELUS", "folder": "Telus", "aliases": ["TELUS"]},
+        {"name": "ROGERS", "folder": "Rogers", "aliases": ["ROGERS"]},
+        {"name": "VIDEOTRON", "folder": "Videotron", "aliases": ["VIDEOTRON"],
+         "filename_patterns": [r"vid[eé]otron[\s_-]*(?P<account>\d{6,12})"]},
+        {"name": "FIDO", "folder": "Fido", "aliases": ["FIDO"],
+         "filename_patterns": [r"fido[\s_-]*(?P<account>\d{6,12})"]},
+        {"name": "ENBRIDGE", "folder": "Enbridge", "aliases": ["ENBRIDGE", "ENBRIDGE GAS"],
+         "filename_patterns": [r"enbridge[\s_-]*(?P<account>\d{6,12})"]},
+        {"name": "HYDRO ONE", "folder": "Hydro One", "aliases": ["HYDRO ONE", "HYDRO-ONE", "HYDROONE"],
+         "filename_patterns": [r"hydro[\s_-]?one[\s_-]*(?P<account>\d{6,12})"]},
+    ]
+}
+
+# A named group, named backreference or named conditional in a rule pattern,
+# not preceded by an escaping backslash: (?P<name>, (?P=name) and (?(name)
+_RULE_GROUP_RE = re.compile(r"(?<!\\)((?:\\\\)*)\((\?P[<=]|\?\()(\w+)")
+# A numbered backreference or conditional, which would point at another rule's group once combined
+_RULE_NUMBERED_REF_RE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
+
+class ProviderRules:
+    """Provider definitions compiled once for fast per-file dispatch.
+
+    All providers' filename patterns are folded into a single alternation, so
+    recognizing a provider-specific filename costs one regex search no matter
+    how many providers are configured. The outer group that matched is looked
+    up in ``dispatch`` to find the provider and its token settings.
+    """
+
+    def __init__(self, config: dict):
+        providers = config.get("providers") or []
+        if not providers:
+            raise ValueError("Provider rules must define at least one provider")
+
+        names, folders, aliases, token_lengths, dispatch, alternatives = [], {}, {}, {}, {}, []
+        for idx, rule in enumerate(providers):
+            name = str(rule["name"]).strip().upper()
+            if not name or name in folders:
+                raise ValueError(f"Duplicate or empty provider name: {rule.get('name')!r}")
+            names.append(name)
+            folders[name] = str(rule.get("folder") or name.title())
+            for alias in [name] + list(rule.get("aliases", [])):
+                aliases[str(alias).strip().upper()] = name
+
+            try:
+                token_length = int(rule.get("token_length", ACCOUNT_TOKEN_LENGTH))
+            except (TypeError, ValueError):
+                token_length = 0
+            if token_length < 1:
+                raise ValueError(f"token_length for {name} must be a positive whole number: "
+                                 f"{rule.get('token_length')!r}")
+            token_lengths[name] = token_length
+            for pidx, pattern in enumerate(rule.get("filename_patterns", [])):
+                try:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                except re.error as e:
+                    raise ValueError(f"Invalid filename pattern for {name}: {pattern!r} ({e})") from e
+                if "account" not in compiled.groupindex:
+                    raise ValueError(f"Filename pattern for {name} needs an (?P<account>...) group: {pattern!r}")
+                if compiled.groups != len(compiled.groupindex) or _RULE_NUMBERED_REF_RE.search(pattern):
+                    raise ValueError(f"Filename pattern for {name} may only use named groups: {pattern!r}")
+                # Every group gets the rule's prefix, so rules may reuse names
+                group = f"r{idx}_{pidx}"
+                renamed = _RULE_GROUP_RE.sub(lambda m: f"{m.group(1)}({m.group(2)}{group}_{m.group(3)}", pattern)
+                try:
+                    renamed_groups = set(re.compile(renamed, re.IGNORECASE).groupindex)
+                except re.error:
+                    renamed_groups = None
+                if renamed_groups != {f"{group}_{n}" for n in compiled.groupindex}:
+                    raise ValueError(f"Filename pattern for {name} could not be combined with the others: "
+                                     f"{pattern!r}")
+                alternatives.append((f"(?P<{group}>{renamed})", name, pattern))
+                dispatch[group] = (name, token_length, f"{group}_account",
+                                   f"{group}_ext" if "ext" in compiled.groupindex else None)
+
+        self.providers = tuple(names)
+        self.folders = folders
+        self.header_aliases = aliases
+        self.token_lengths = token_lengths
+        self.dispatch = dispatch
+        self.filename_matcher = _combine_rule_patterns(alternatives) if alternatives else None
+
+    @classmethod
+    def default(cls) -> "ProviderRules":
+        return cls(DEFAULT_PROVIDER_RULES)
+
+    def folder_for(self, provider: str) -> str:
+        return self.folders.get(provider, provider.capitalize())
+
+    def match_filename(self, base: str):
+        """Return (provider, last4, ext) if a provider-specific pattern matches, else None"""
+        if self.filename_matcher is None:
+            return None
+        m = self.filename_matcher.search(base)
+        if m is None:
+            return None
+        provider, token_length, account_group, ext_group = self.dispatch[m.lastgroup]
+        digits = re.sub(r"\D", "", m.group(account_group) or "")
+        ext = (m.group(ext_group) or "").strip() if ext_group else ""
+        return provider, digits[-token_length:] if len(digits) >= token_length else "", ext
+
+
+def _combine_rule_patterns(alternatives: list[tuple[str, str, str]]):
+    """One pattern for all (renamed pattern, provider, original) rules, naming the rule that breaks it"""
+    try:
+        return re.compile("|".join(renamed for renamed, _, _ in alternatives), re.IGNORECASE)
+    except re.error as e:
+        for end in range(1, len(alternatives) + 1):
+            try:
+                re.compile("|".join(renamed for renamed, _, _ in alternatives[:end]), re.IGNORECASE)
+            except re.error:
+                _, name, pattern = alternatives[end - 1]
+                raise ValueError(f"Filename pattern for {name} could not be combined with the others: "
+                                 f"{pattern!r} ({e})") from e
+        raise ValueError(f"Filename patterns could not be combined ({e})") from e
+
+
+def load_provider_rules(path: str = None) -> ProviderRules:
+    """Load provider rules from a JSON file, falling back to the built-in defaults"""
+    path = path or PROVIDER_RULES_FILE
+    if not os.path.exists(path):
+        return ProviderRules.default()
+    with open(path, "r", encoding="utf-8") as f:
+        return ProviderRules(json.load(f))
+
+
+# ------------------------------ Mapping Sources ------------------------------
+
+MAPPING_COLUMNS = ("provider", "corp", "account")  # the three workbook columns a mapping uses
+MAPPING_TABLE = "mapping"  # table read from SQLite mapping files
+MAPPING_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".sqlite": "sqlite",
+    ".db": "sqlite",
+    ".xlsx": "xlsx",
+    ".xlsm": "xlsx",
+}
+FAST_MAPPING_EXTENSION = ".csv"  # What convert-mapping writes by default: the quickest to load
+MAPPING_PROGRESS_ROWS = 1000  # Workbook rows between progress reports (and cancel checks)
+MAPPING_FILE_FILTER = "Mapping files (*.xlsx *.xlsm *.xls *.csv *.parquet *.sqlite *.db);;All files (*.*)"
+
+
+class MappingLoadCancelled(Exception):
+    """Raised inside a mapping load once its cancel event is set"""
+
+
+def mapping_format(path: str) -> str:
+    """Mapping file format by extension; anything unknown goes through pandas' Excel reader"""
+    return MAPPING_FORMATS.get(os.path.splitext(path)[1].lower(), "excel")
+
+
+def _frame_rows(df) -> list[tuple[str, str, str]]:
+    """First three columns of a frame as stripped strings, '' for missing cells"""
+    columns = []
+    for i in range(3):
+        if i < df.shape[1]:
+            values = df.iloc[:, i].tolist()
+            columns.append(["" if pd.isna(v) else str(v).strip() for v in values])
+        else:
+            columns.append([""] * len(df))
+    return list(zip(*columns))
+
+
+def _xlsx_mapping_rows(path: str, on_progress=None, cancel_event=None) -> list[tuple[str, str, str]]:
+    """Stream the first sheet's first three columns.
+
+    Cells are converted and typed the way ``pd.read_excel(header=None)``
+    does it (a corp column of numbers with gaps still reads as "1001.0"),
+    but only columns A-C are kept and no frame of the whole sheet is built.
+    """
+    from openpyxl import load_workbook
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+    from pandas.io.parsers import TextParser
+
+    def convert(cell):
+        if cell.value is None:
+            return ""
+        if cell.data_type == TYPE_ERROR:
+            return float("nan")
+        if cell.data_type == TYPE_NUMERIC:
+            value = int(cell.value)
+            return value if value == cell.value else float(cell.value)
+        return cell.value
+
+    book = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = book.worksheets[0]
+        total = sheet.max_row or 0  # from the sheet's dimension tag; only an estimate
+        sheet.reset_dimensions()
+        data = []
+        for row in sheet.iter_rows(max_col=3):
+            values = [convert(cell) for cell in row]
+            values += [""] * (3 - len(values))
+            data.append(values)
+            if len(data) % MAPPING_PROGRESS_ROWS == 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise MappingLoadCancelled(path)
+                if on_progress:
+                    on_progress(len(data), max(total, len(data)))
+    finally:
+        book.close()
+    while data and data[-1] == ["", "", ""]:
+        data.pop()
+    if not data:
+        return []
+    return _frame_rows(TextParser(data, header=None).read())
+
+
+def _csv_mapping_rows(path: str) -> list[tuple[str, str, str]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return [
+            tuple((row[i].strip() if i < len(row) else "") for i in range(3))
+            for row in csv.reader(f)
+        ]
+
+
+def _sqlite_mapping_rows(path: str) -> list[tuple[str, str, str]]:
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(
+            f"SELECT {', '.join(MAPPING_COLUMNS)} FROM {MAPPING_TABLE} ORDER BY rowid"
+        )
+        return [
+            tuple(("" if v is None else str(v).strip()) for v in row)
+            for row in cursor
+        ]
+    finally:
+        conn.close()
+
+
+def read_mapping_rows(path: str, on_progress=None, cancel_event=None) -> list[tuple[str, str, str]]:
+    """The (provider, corp, account) cells of a mapping file, in file order.
+
+    Only workbooks report on_progress(rows read, rows expected) while they
+    load; the other formats read in well under a second.
+    """
+    fmt = mapping_format(path)
+    if fmt == "xlsx":
+        return _xlsx_mapping_rows(path, on_progress, cancel_event)
+    if fmt == "csv":
+        return _csv_mapping_rows(path)
+    if fmt == "sqlite":
+        return _sqlite_mapping_rows(path)
+    if fmt == "parquet":
+        # Needs pyarrow or fastparquet; pandas raises an ImportError naming them otherwise
+        return _frame_rows(pd.read_parquet(path, columns=list(MAPPING_COLUMNS)))
+    return _frame_rows(pd.read_excel(path, header=None))
+
+
+def write_mapping_rows(rows, path: str) -> int:
+    """Write mapping cells to a CSV, SQLite or Parquet file; returns the rows written.
+
+    Blank rows are dropped; everything else is kept in order, so the file
+    loads into exactly the index its source did.
+    """
+    rows = [tuple(row) for row in rows if any(row)]
+    fmt = mapping_format(path)
+    tmp = path + ".tmp"
+    if fmt == "csv":
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(MAPPING_COLUMNS)
+            writer.writerows(rows)
+    elif fmt == "sqlite":
+        import sqlite3
+
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        conn = sqlite3.connect(tmp)
+        try:
+            conn.execute(
+                f"CREATE TABLE {MAPPING_TABLE} ({', '.join(c + ' TEXT' for c in MAPPING_COLUMNS)})"
+            )
+            conn.executemany(f"INSERT INTO {MAPPING_TABLE} VALUES (?, ?, ?)", rows)
+            conn.commit()
+        finally:
+            conn.close()
+    elif fmt == "parquet":
+        pd.DataFrame(rows, columns=list(MAPPING_COLUMNS), dtype=object).to_parquet(tmp, index=False)
+    else:
+        raise ValueError(f"Cannot write mapping files of type {os.path.splitext(path)[1] or path}")
+    os.replace(tmp, path)
+    return len(rows)
+
+
+class MappingIndex:
+    """Merges several mapping workbooks into one live (provider, token) index.
+
+    Sources are kept in precedence order: when two sources map the same key,
+    the one listed first wins. ``refresh()`` re-parses only the sources whose
+    file changed on disk and applies the difference to ``index`` in place, so
+    an organizer holding a reference to it sees the update immediately.
+    Files are parsed without holding the lock; it only guards the swap.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader  # path -> {(provider, token): entry}
+        self.sources = []
+        self.index = {}
+        self.errors = {}  # path -> last reload error
+        self._parsed = {}  # path -> mapping parsed from that source
+        self._stamps = {}  # path -> (mtime, size) when last parsed
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _stamp(path: str) -> tuple[float, int]:
+        st = os.stat(path)
+        return st.st_mtime, st.st_size
+
+    def _load(self, path: str, **options) -> dict:
+        started = time.perf_counter()
+        entries = self.loader(path, **options)
+        METRICS.observe("axora_mapping_load_seconds", time.perf_counter() - started)
+        return entries
+
+    @staticmethod
+    def _options(path, on_progress, cancel_event) -> dict:
+        """Loader keyword arguments for one source: progress as (path, done, total), cancel event"""
+        options = {}
+        if cancel_event is not None:
+            options["cancel_event"] = cancel_event
+        if on_progress:
+            options["on_progress"] = lambda done, total: on_progress(path, done, total)
+        return options
+
+    def _resolve(self, key):
+        for path in self.sources:
+            entries = self._parsed.get(path)
+            if entries is not None and key in entries:
+                return entries[key]
+        return None
+
+    def _apply(self, keys) -> None:
+        for key in keys:
+            entry = self._resolve(key)
+            if entry is None:
+                self.index.pop(key, None)
+            else:
+                self.index[key] = entry
+
+    def set_sources(self, paths, on_progress=None, cancel_event=None) -> None:
+        """Replace the source list. Only sources not already loaded are parsed.
+
+        With on_progress(path, done, total) or cancel_event, both are passed on
+        to the loader. A cancelled load raises MappingLoadCancelled and leaves
+        the index as it was.
+        """
+        paths = list(dict.fromkeys(os.path.abspath(p) for p in paths))
+        with self._lock:
+            known = set(self._parsed)
+        loaded = {}
+        for path in paths:
+            if path not in known:
+                stamp = self._stamp(path)
+                loaded[path] = (self._load(path, **self._options(path, on_progress, cancel_event)), stamp)
+
+        with self._lock:
+            affected = set()
+            for path in set(self._parsed) - set(paths):
+                affected.update(self._parsed.pop(path))
+                self._stamps.pop(path, None)
+                self.errors.pop(path, None)
+            for path, (entries, stamp) in loaded.items():
+                if path in self._parsed:
+                    affected.update(self._parsed[path])
+                self._parsed[path] = entries
+                self._stamps[path] = stamp
+                affected.update(entries)
+            if paths != self.sources:
+                # Precedence may have changed, so every key is a candidate
+                for entries in self._parsed.values():
+                    affected.update(entries)
+            self.sources = paths
+            self._apply(affected)
+
+    def snapshot(self) -> dict:
+        """A copy of the index that later reloads leave alone"""
+        with self._lock:
+            return dict(self.index)
+
+    def reparse(self, on_progress=None, cancel_event=None) -> list:
+        """Parse the sources changed on disk since they were loaded, leaving the index alone.
+
+        Returns what apply_reloads() needs to swap them in. Unreadable files
+        are recorded in ``errors`` and keep their old entries.
+        """
+        with self._lock:
+            sources, stamps = list(self.sources), dict(self._stamps)
+        pending = []
+        for path in sources:
+            try:
+                stamp = self._stamp(path)
+            except OSError as e:
+                with self._lock:
+                    self.errors[path] = str(e)
+                continue
+            if stamp == stamps.get(path):
+                continue
+            try:
+                entries = self._load(path, **self._options(path, on_progress, cancel_event))
+            except MappingLoadCancelled:
+                raise
+            except Exception as e:
+                # Usually a workbook caught mid-save; keep the old data and retry later
+                with self._lock:
+                    self.errors[path] = str(e)
+                continue
+            pending.append((path, stamps.get(path), stamp, entries))
+        return pending
+
+    def apply_reloads(self, pending) -> list[tuple[str, int, int, int]]:
+        """Swap sources parsed by reparse() into the index; returns (path, added, removed, changed) each"""
+        changes = []
+        with self._lock:
+            for path, previous, stamp, entries in pending:
+                if path not in self.sources or self._stamps.get(path) != previous:
+                    continue  # dropped or reloaded again since it was parsed
+                self.errors.pop(path, None)
+
+                old = self._parsed.get(path, {})
+                added = entries.keys() - old.keys()
+                removed = old.keys() - entries.keys()
+                changed = {k for k in entries.keys() & old.keys() if entries[k] != old[k]}
+
+                self._parsed[path] = entries
+                self._stamps[path] = stamp
+                self._apply(added | removed | changed)
+                changes.append((path, len(added), len(removed), len(changed)))
+        return changes
+
+    def refresh(self) -> list[tuple[str, int, int, int]]:
+        """Reload changed sources; returns (path, added, removed, changed) per reload"""
+        return self.apply_reloads(self.reparse())
+
+
+# ------------------------------ Leases ------------------------------
+
+class LeaseBusy(OSError):
+    """Raised when a lease is still held by someone else after waiting"""
+
+    def __str__(self):
+        return self.strerror
+
+
+class LeaseLost(OSError):
+    """Raised by renew() once the lease has been broken and taken by someone else"""
+
+    def __str__(self):
+        return self.strerror
+
+
+def _lease_record(data):
+    """A parsed lock file if it looks like one of ours, else None (corrupt or foreign)"""
+    if isinstance(data, dict) and isinstance(data.get("expires"), (int, float)):
+        return data
+    return None
+
+
+class LeaseLock:
+    """Cross-workstation lock on one folder, held as a lock file inside it.
+
+    The lock file is created with an exclusive create, so only one holder on
+    any machine can own it, and records the owner and when the lease expires.
+    A lease past its expiry (plus ``grace`` for clocks that disagree between
+    machines) belongs to a crashed or disconnected holder and is broken: the
+    stale file is renamed aside, which only one contender can do, and checked
+    before it is deleted. Waiting backs off exponentially with jitter and
+    gives up with LeaseBusy after ``wait`` seconds. Leases are meant to be
+    held for one change to the folder, well under ``ttl``; a longer holder
+    calls renew() well within each ``ttl``.
+    """
+
+    def __init__(self, fs: FileSystem, folder: str, ttl: float = LEASE_TTL, wait: float = LEASE_WAIT,
+                 grace: float = 5.0):
+        self.fs = fs
+        self.folder = folder
+        self.path = os.path.join(folder, LEASE_FILE_NAME)
+        self.ttl = ttl
+        self.wait = wait
+        self.grace = grace
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}:{os.urandom(4).hex()}"
+
+    def _read(self):
+        try:
+            with self.fs.open(self.path, "r") as f:
+                return _lease_record(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _break(self, stale: dict) -> None:
+        aside = f"{self.path}.stale-{os.urandom(4).hex()}"
+        try:
+            self.fs.move(self.path, aside)
+        except OSError:
+            return  # Someone else broke it first
+        try:
+            with self.fs.open(aside, "r") as f:
+                moved = _lease_record(json.load(f))
+        except (OSError, ValueError):
+            moved = None
+        if moved is not None and moved.get("token") != stale.get("token"):
+            # The lease was renewed between reading and renaming: give it back
+            with self.fs.open(aside, "rb") as f:
+                self.fs.create_exclusive(self.path, f.read())
+        self.fs.remove(aside)
+
+    def acquire(self) -> "LeaseLock":
+        deadline = time.monotonic() + self.wait
+        delay = 0.005
+        holder = None
+        while True:
+            record = json.dumps({"token": self.token, "expires": time.time() + self.ttl}).encode()
+            try:
+                if self.fs.create_exclusive(self.path, record):
+                    return self
+            except FileNotFoundError:
+                # A new account: its folder is created under the lease
+                self.fs.makedirs(self.folder, exist_ok=True)
+                continue
+            holder = self._read()
+            if holder is None:
+                # Unreadable: mid-write, corrupt or written by something else; judge it by age
+                try:
+                    holder = {"token": "", "expires": self.fs.getmtime(self.path) + self.ttl}
+                except OSError:
+                    continue  # Released meanwhile
+            if time.time() > holder.get("expires", 0) + self.grace:
+                self._break(holder)
+                continue
+            if time.monotonic() >= deadline:
+                owner = str(holder.get("token", "")).split(":", 1)[0] or "another workstation"
+                raise LeaseBusy(errno.EAGAIN, f"Account folder is locked by {owner}")
+            time.sleep(delay * random.uniform(0.5, 1.5))
+            delay = min(delay * 2, 0.5)
+
+    def renew(self) -> None:
+        """Push the expiry another ``ttl`` out, for a holder that needs longer.
+
+        Raises LeaseLost if the lock file is no longer ours: the lease expired
+        and another holder broke it, and the caller must stop using the folder.
+        """
+        holder = self._read()
+        if holder is None or holder.get("token") != self.token:
+            raise LeaseLost(errno.ENOLCK, f"Lost the lease on {self.folder}")
+        record = {"token": self.token, "expires": time.time() + self.ttl}
+        with self.fs.open(self.path, "w") as f:
+            json.dump(record, f)
+
+    def release(self) -> None:
+        holder = self._read()
+        if holder is not None and holder.get("token") == self.token:
+            try:
+                self.fs.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+# ------------------------------ Organizer ------------------------------
+
+class DestinationIndex:
+    """Year folders already known to exist in an organized account folder.
+
+    A long-lived organizer (the service) consults it to skip the makedirs and
+    listdir work it would otherwise repeat for every bill bound for the same
+    account. Entries are dropped when a move into them fails.
+    """
+
+    def __init__(self):
+        self._ready = set()
+        self._archives = {}  # account dir -> (index mtime, {relative path: archive})
+
+    def __contains__(self, year_dir: str) -> bool:
+        return year_dir in self._ready
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def add(self, year_dir: str):
+        self._ready.add(year_dir)
+
+    def discard(self, year_dir: str):
+        self._ready.discard(year_dir)
+
+    def clear(self):
+        self._ready.clear()
+        self._archives.clear()
+
+    def archived(self, fs: FileSystem, account_dir: str) -> dict:
+        """archived_names() for the account, re-read only when its archive index changes"""
+        try:
+            mtime = fs.getmtime(os.path.join(account_dir, ARCHIVE_INDEX_NAME))
+        except OSError:
+            self._archives.pop(account_dir, None)
+            return {}
+        cached = self._archives.get(account_dir)
+        if cached is None or cached[0] != mtime:
+            # Archiving removes year folders, so they must be prepared again
+            prefix = account_dir + os.sep
+            self._ready.difference_update([d for d in list(self._ready) if d.startswith(prefix)])
+            cached = (mtime, archived_names(fs, account_dir))
+            self._archives[account_dir] = cached
+        return cached[1]
+
+
+class FileOutcome:
+    """What happened to one source file.
+
+    Built once by BillOrganizer.process_single_file and passed as-is to the
+    GUI, reports and the Excel update. Uses __slots__ since a large run keeps
+    one per moved file.
+    """
+
+    __slots__ = ("source", "status", "target", "token", "provider", "provider_folder",
+                 "corp", "date", "reason", "elapsed", "checksum", "size")
+
+    def __init__(self, source: str, status: str = "not_found", reason: str = ""):
+        self.source = source
+        self.status = status  # "moved", "skipped", "not_found" or "failed" (a verified copy did not match)
+        self.target = ""
+        self.token = ""
+        self.provider = ""
+        self.provider_folder = ""
+        self.corp = ""
+        self.date = ""  # YYYY-MM-DD
+        self.reason = reason
+        self.elapsed = 0.0  # seconds
+        self.checksum = ""  # sha256 of the moved bill, when moves are verified
+        self.size = 0  # bytes
+
+    @property
+    def moved(self) -> bool:
+        return self.status == "moved"
+
+    @property
+    def file_name(self) -> str:
+        return os.path.basename(self.source)
+
+    @property
+    def year(self) -> str:
+        return self.date[:4]
+
+    @property
+    def month(self) -> str:
+        """Full month name of the bill date, e.g. "September" """
+        try:
+            return datetime.strptime(self.date, "%Y-%m-%d").strftime("%B")
+        except ValueError:
+            return ""
+
+    def as_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "target": self.target,
+            "token": self.token,
+            "provider": self.provider,
+            "corp": self.corp,
+            "date": self.date,
+            "status": self.status,
+            "reason": self.reason,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "sha256": self.checksum,
+            "bytes": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "FileOutcome":
+        """Rebuild an outcome from a JSON report row"""
+        outcome = cls(row["source"], row["status"], row.get("reason", ""))
+        outcome.target = row.get("target", "")
+        outcome.token = row.get("token", "")
+        outcome.provider = row.get("provider", "")
+        outcome.corp = row.get("corp", "")
+        outcome.date = row.get("date", "")
+        outcome.elapsed = row.get("elapsed_ms", 0) / 1000
+        outcome.checksum = row.get("sha256", "")
+        outcome.size = row.get("bytes", 0)
+        if outcome.target:
+            # corp / provider folder / account / year / name
+            outcome.provider_folder = os.path.basename(os.path.dirname(os.path.dirname(os.path.dirname(outcome.target))))
+        return outcome
+
+    def hierarchy(self) -> list[str]:
+        """Corp, provider folder, account, year and final name of the target"""
+        return [self.corp, self.provider_folder, self.token, self.year, os.path.basename(self.target)]
+
+
+class BillOrganizer:
+    """Maps bill filenames to the Utilities tree and moves them there"""
+
+    def __init__(self, fs=None, rules=None, dest_index=None):
+        self.fs = fs if fs is not None else LocalFileSystem()
+        self.rules = rules if rules is not None else ProviderRules.default()
+        self.mapping = {}
+        self.mapping_index = None  # MappingIndex keeping self.mapping current, if any
+        self.dest_index = dest_index  # optional DestinationIndex
+        self.verify_moves = False  # checksum each bill before and after its move
+        self.use_leases = False  # lock account folders against other workstations too
+        self._archived = None  # account dir -> archived_names(), read once per run
+        self._account_locks = {}
+        self._account_locks_guard = threading.Lock()
+
+    def use_mapping(self, index: MappingIndex) -> None:
+        """Look accounts up in ``index``, following its reloads"""
+        self.mapping_index = index
+        self.mapping = index.index
+
+    def for_run(self) -> "BillOrganizer":
+        """This organizer with its mapping frozen for one run.
+
+        Reloads change the live index in place; a run looks every file up in
+        (and fingerprints) a snapshot instead, so it never sees half a reload.
+        Locks, filesystem and destination index are shared with the original;
+        account archive indexes are read at most once by the run.
+        """
+        run = copy.copy(self)
+        run.mapping = self.mapping_index.snapshot() if self.mapping_index is not None else dict(self.mapping)
+        run._archived = {}
+        return run
+
+    def fingerprint(self) -> str:
+        """Hash of everything besides the filename that decides where a bill goes"""
+        digest = hashlib.sha1()
+        digest.update(repr(sorted((k, sorted(v.items())) for k, v in self.mapping.items())).encode())
+        digest.update(repr((self.rules.providers, sorted(self.rules.folders.items()),
+                            sorted(self.rules.token_lengths.items()),
+                            self.rules.filename_matcher.pattern if self.rules.filename_matcher else "",
+                            sorted(self.rules.dispatch.items()))).encode())
+        return digest.hexdigest()
+
+    def account_lock(self, account_dir: str) -> threading.Lock:
+        """Serializes the check-then-move for one account folder across threads"""
+        lock = self._account_locks.get(account_dir)
+        if lock is None:
+            with self._account_locks_guard:
+                lock = self._account_locks.setdefault(account_dir, threading.Lock())
+        return lock
+
+    def account_lease(self, account_dir: str):
+        """Lease on the account folder when other workstations may share the tree"""
+        return LeaseLock(self.fs, account_dir) if self.use_leases else contextlib.nullcontext()
+
+    def archived_in(self, account_dir: str) -> dict:
+        """archived_names() for the account, from the destination index or cached for the run"""
+        if self.dest_index is not None:
+            return self.dest_index.archived(self.fs, account_dir)
+        if self._archived is None:
+            return archived_names(self.fs, account_dir)
+        names = self._archived.get(account_dir)
+        if names is None:
+            names = self._archived[account_dir] = archived_names(self.fs, account_dir)
+        return names
+
+    # ---------- Mapping ----------
+
+    def build_mapping_from_excel(self, excel_path: str, on_progress=None, cancel_event=None) -> dict:
+        """Load a mapping file: .xlsx (streamed), .csv, .parquet, .sqlite or any Excel format"""
+        rows = read_mapping_rows(excel_path, on_progress, cancel_event)
+        if cancel_event is not None and cancel_event.is_set():
+            raise MappingLoadCancelled(excel_path)
+        return self.build_mapping_from_rows(rows)
+
+    def build_mapping_from_rows(self, rows) -> dict:
+        """Index (provider, corp, account) cells; provider header rows open each section"""
+        mapping = {}
+        current_provider = None
+
+        for cell0, cell1, cell2 in rows:
+            if cell1 == "nan":
+                cell1 = ""
+            if cell2 == "nan":
+                cell2 = ""
+
+            header_provider = self.rules.header_aliases.get(cell0.upper())
+            if header_provider and not cell1 and not cell2:
+                current_provider = header_provider
+                continue
+
+            if current_provider is None:
+                continue
+
+            if not cell1 or not cell2:
+                continue
+
+            corp = cell1
+            account_str = cell2
+
+            # First, extract extension
+            ext = ""
+            ext_match = re.search(r"\(([^)]+)\)", account_str)
+            if ext_match:
+                ext_str = ext_match.group(1).strip()
+                if re.match(r"^[\dA-Za-z]{2,6}$", ext_str):
+                    ext = ext_str
+                    account_str = re.sub(r"\([^)]+\)", "", account_str)
+            else:
+                space_ext = re.search(r"\s+(\d{3,4})\s*$", account_str)
+                if space_ext:
+                    ext = space_ext.group(1)
+                    account_str = re.sub(r"\s+" + re.escape(ext) + r"\s*$", "", account_str)
+
+            # The provider's accounts are keyed on their last token_length digits
+            phone_match = re.search(r"(\d{3}[-\s]?\d{3}[-\s]?\d{4})", account_str)
+            if phone_match and len(re.sub(r"\D", "", phone_match.group(1))) == 10:
+                digits = re.sub(r"\D", "", phone_match.group(1))
+            else:
+                digits = re.sub(r"\D", "", account_str)
+            token = _account_token(digits, self.rules.token_lengths.get(current_provider, ACCOUNT_TOKEN_LENGTH))
+
+            entry = {
+                "provider": current_provider,
+                "corp": corp,
+                "account_last4": token,
+                "account_ext": ext,
+            }
+
+            if token:
+                mapping[(current_provider, token)] = entry
+            if ext:
+                mapping[(current_provider, ext)] = entry
+
+        return mapping
+
+    # ---------- Processing ----------
+
+    def match_account(self, file_name: str):
+        """Parse a bill name and look its account up in the mapping.
+
+        Returns (parsed, last4, ext, map_entry, matched_token); map_entry is
+        None when neither token is mapped.
+        """
+        return self._match_parsed(file_name, parse_filename(file_name))
+
+    def _match_parsed(self, file_name: str, parsed: ParsedFilename, accounts: dict = None):
+        # Account tokens and date targets come from a single parse of the name.
+        # A provider-specific filename format pins the provider; otherwise try
+        # providers in rule order, each with as many account digits as its
+        # mapping keys hold. ``accounts`` is {token_length: account token} for
+        # lengths other than the default that were already parsed.
+        rule_match = self.rules.match_filename(os.path.splitext(file_name)[0])
+        if rule_match:
+            provider_order = (rule_match[0],)
+            last4, ext = rule_match[1], rule_match[2]
+            accounts = {self.rules.token_lengths[rule_match[0]]: last4}
+        else:
+            provider_order = self.rules.providers
+            last4, ext = parsed.account_last4, parsed.account_ext
+            accounts = {**(accounts or {}), ACCOUNT_TOKEN_LENGTH: last4}
+
+        # Try matching: first the account, then the extension
+        if last4:
+            for prov in provider_order:
+                length = self.rules.token_lengths[prov]
+                token = accounts.get(length)
+                if token is None:
+                    token = accounts[length] = parse_filename(file_name, length).account_last4
+                map_entry = self.mapping.get((prov, token)) if token else None
+                if map_entry is not None:
+                    return parsed, token, ext, map_entry, token
+        if ext:
+            for prov in provider_order:
+                map_entry = self.mapping.get((prov, ext))
+                if map_entry is not None:
+                    return parsed, last4, ext, map_entry, ext
+        return parsed, last4, ext, None, None
+
+    def match_batch(self, names: list[str]) -> dict:
+        """{name: match_account(name)} for a whole scan.
+
+        The names are parsed together by _parse_batch, whose single pattern
+        handles the common shapes without tokenizing; the lookups are the
+        same dict probes match_account makes.
+        """
+        others = {length: [parsed.account_last4 for parsed in _parse_batch(names, length)]
+                  for length in set(self.rules.token_lengths.values()) - {ACCOUNT_TOKEN_LENGTH}}
+        if not others:
+            return {name: self._match_parsed(name, parsed) for name, parsed in zip(names, _parse_batch(names))}
+        return {name: self._match_parsed(name, parsed, {length: tokens[i] for length, tokens in others.items()})
+                for i, (name, parsed) in enumerate(zip(names, _parse_batch(names)))}
+
+    def account_key(self, file_name: str, match: tuple = None) -> str:
+        """Account folder (corp/provider/account) a bill would go to, or "" if unmapped"""
+        _, _, _, map_entry, token = match or self.match_account(file_name)
+        if map_entry is None:
+            return ""
+        return "/".join((str(map_entry["corp"]).strip(), self.rules.folder_for(map_entry["provider"]), token))
+
+    def process_single_file(self, source_dir: str, dest_root: str, file_name: str,
+                            match: tuple = None) -> "FileOutcome":
+        """Process a single file and return its outcome.
+
+        ``match`` is the file's match_account result when it was already
+        worked out for the whole batch.
+        """
+        src_path = os.path.join(source_dir, file_name)
+        outcome = FileOutcome(src_path)
+        stage_started = time.perf_counter()
+
+        parsed, last4, ext, map_entry, matched_token = match or self.match_account(file_name)
+        if not last4 and not ext:
+            outcome.reason = "No account number in filename"
+            return outcome
+
+        if map_entry is None:
+            outcome.token = last4 or ext
+            outcome.reason = "Account not found in Excel"
+            return outcome
+
+        provider = map_entry["provider"]
+        outcome.token = matched_token
+        outcome.provider = provider
+        outcome.provider_folder = provider_folder = self.rules.folder_for(provider)
+        outcome.corp = corp = str(map_entry["corp"]).strip()
+
+        if not parsed.date:
+            outcome.reason = "No date in filename"
+            return outcome
+        outcome.date = parsed.date
+        year_folder = parsed.year
+
+        # Build destination path
+        account_dir = os.path.join(dest_root, corp, provider_folder, matched_token)
+        year_dir = os.path.join(account_dir, year_folder)
+        index = self.dest_index
+        now = time.perf_counter()
+        METRICS.observe("axora_stage_seconds", now - stage_started, (("stage", "lookup"),))
+        stage_started = now
+
+        with self.account_lock(account_dir), self.account_lease(account_dir):
+            # Bills of archived years live in account/YEAR.zip; check its index, not the zip
+            archive = self.archived_in(account_dir).get(f"{year_folder}/{parsed.final_name}")
+            if archive:
+                outcome.target = os.path.join(year_dir, parsed.final_name)
+                outcome.status = "skipped"
+                outcome.reason = f"Target already exists in archive {archive}"
+                return outcome
+
+            if index is None or year_dir not in index:
+                self.fs.makedirs(account_dir, exist_ok=True)
+
+                # Ensure account organized by year
+                self.ensure_year_organized(account_dir)
+
+                self.fs.makedirs(year_dir, exist_ok=True)
+                if index is not None:
+                    index.add(year_dir)
+
+            outcome.target = dest_file_path = os.path.join(year_dir, parsed.final_name)
+            if self.fs.exists(dest_file_path):
+                outcome.status = "skipped"
+                outcome.reason = "Target already exists"
+                return outcome
+
+            now = time.perf_counter()
+            METRICS.observe("axora_stage_seconds", now - stage_started, (("stage", "prepare"),))
+            stage_started = now
+            try:
+                if self.verify_moves:
+                    verified = self.move_verified(src_path, dest_file_path)
+                else:
+                    self.fs.move(src_path, dest_file_path)
+            except OSError:
+                # The folder may have been removed behind our back; re-check next time
+                if index is not None:
+                    index.discard(year_dir)
+                raise
+            METRICS.observe("axora_stage_seconds", time.perf_counter() - stage_started,
+                            (("stage", "verify" if self.verify_moves else "move"),))
+            if self.verify_moves:
+                if verified is None:
+                    outcome.status = "failed"
+                    outcome.reason = "Checksum mismatch after copying; the bill was left in the source"
+                    return outcome
+                outcome.checksum, outcome.size = verified
+                try:
+                    self.fs.remove(src_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    outcome.reason = f"Verified copy in place, but the source could not be removed: {e}"
+        outcome.status = "moved"
+        return outcome
+
+    def move_verified(self, src_path: str, dest_path: str):
+        """Copy a bill next to ``dest_path`` under a temporary name and check it before it counts.
+
+        The source is hashed as it is copied and the copy is hashed again once
+        written; only when they agree is the copy renamed into place. Returns
+        (sha256, size), or None on a mismatch, in which case the bad copy has
+        been removed. The source is never touched; the caller removes it.
+        """
+        tmp_path = dest_path + VERIFY_TMP_SUFFIX
+        digest = hashlib.sha256()
+        buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+        view = memoryview(buffer)
+        size = 0
+        try:
+            with self.fs.open(src_path, "rb") as src, self.fs.open(tmp_path, "wb") as dst:
+                while True:
+                    n = src.readinto(buffer)
+                    if not n:
+                        break
+                    digest.update(view[:n])
+                    dst.write(view[:n])
+                    size += n
+            if file_checksum(self.fs, tmp_path) != (digest.hexdigest(), size):
+                self.fs.remove(tmp_path)
+                return None
+            self.fs.move(tmp_path, dest_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                self.fs.remove(tmp_path)
+            raise
+        return digest.hexdigest(), size
+
+    # ---------- Reference Parsers ----------
+    # parse_filename() must agree with these exactly; tests/test_parser.py
+    # compares the two over a golden corpus.
+
+    def extract_account_tokens(self, file_name: str) -> tuple[str, str]:
+        base = os.path.splitext(file_name)[0]
+
+        # Extract extension first - try multiple formats
+        ext = ""
+        
+        # Format 1: Extension in parentheses (xxx)
+        ext_match = re.search(r"\(([^)]+)\)", base)
+        if ext_match:
+            ext_candidate = ext_match.group(1).strip()
+            if re.match(r"^[\dA-Za-z]{2,6}$", ext_candidate):
+                ext = ext_candidate
+        else:
+            # Format 2: Spaces + digits + dash (e.g., "   877-", "   190-")
+            space_dash_ext = re.search(r"\s+(\d{2,4})-", base)
+            if space_dash_ext:
+                ext_candidate = space_dash_ext.group(1).strip()
+                if re.match(r"^\d{2,4}$", ext_candidate):
+                    ext = ext_candidate
+            else:
+                # Format 3: Space-separated extension at end
+                space_ext = re.search(r"\s+(\d{3,4})\s*$", base)
+                if space_ext:
+                    ext = space_ext.group(1)
+
+        # Remove date patterns (including YYYYMMDD format)
+        base_for_last4 = re.sub(r"_\d{4}-\d{2}-\d{2}", "", base)
+        base_for_last4 = re.sub(r"_\d{2}-\d{2}-\d{2}", "", base_for_last4)
+        base_for_last4 = re.sub(r"\d{4}-\d{2}-\d{2}", "", base_for_last4)
+        base_for_last4 = re.sub(r"\d{2}-\d{2}-\d{2}", "", base_for_last4)
+        # Remove YYYYMMDD format (dates that start with 19 or 20)
+        base_for_last4 = re.sub(r"-(\d{4})(\d{2})(\d{2})", "", base_for_last4)  # Remove dash + YYYYMMDD
+        base_for_last4 = re.sub(r"(19|20)\d{6}", "", base_for_last4)  # Remove dates starting with 19xx or 20xx
+
+        if ext:
+            base_for_last4 = re.sub(r"\([^)]+\)", "", base_for_last4)
+            # Remove extension with spaces and dash format
+            base_for_last4 = re.sub(r"\s+" + re.escape(ext) + r"-", "", base_for_last4)
+            base_for_last4 = re.sub(r"\s+" + re.escape(ext) + r"\s*", "", base_for_last4)
+
+        # Find phone numbers (10 digits or 9 digits)
+        phone_patterns = [
+            r"(\d{3}\s+\d{3}\s+\d{4})",
+            r"(\d{3}-\d{3}-\d{4})",
+            r"(\d{10})",
+            r"(\d{9})",  # Support 9-digit phone numbers
+        ]
+        for pattern in phone_patterns:
+            phone_match = re.search(pattern, base_for_last4)
+            if phone_match:
+                phone_str = phone_match.group(1)
+                phone_digits = re.sub(r"\D", "", phone_str)
+                if len(phone_digits) in [9, 10]:
+                    match_start = phone_match.start()
+                    if match_start == 0 or not base_for_last4[match_start - 1].isalnum():
+                        return phone_digits[-4:], ext
+
+        # Find account numbers
+        digit_sequences = re.finditer(r"(\d{7,10})", base_for_last4)
+        candidates = []
+        for match in digit_sequences:
+            seq = match.group(1)
+            start_pos = match.start()
+            if start_pos > 0 and base_for_last4[start_pos - 1].isalpha():
+                continue
+            if start_pos > 0 and base_for_last4[start_pos - 1].upper() == 'X':
+                continue
+            seq_len = len(seq)
+            if 7 <= seq_len <= 10:
+                candidates.append((seq, start_pos))
+
+        if candidates:
+            best = max(candidates, key=lambda x: (len(x[0]), x[1]))
+            return best[0][-4:], ext
+
+        # Fallback
+        digit_sequences = re.finditer(r"(\d{4,})", base_for_last4)
+        candidates = []
+        for match in digit_sequences:
+            seq = match.group(1)
+            start_pos = match.start()
+            if len(seq) == 4 and (seq.startswith("19") or seq.startswith("20")):
+                continue
+            if start_pos > 0 and base_for_last4[start_pos - 1].isalpha():
+                continue
+            candidates.append((seq, start_pos))
+
+        if candidates:
+            best = max(candidates, key=lambda x: x[1])
+            return best[0][-4:], ext
+
+        return "", ext
+
+    def extract_date_targets(self, file_name: str) -> tuple[str, str, str]:
+        name, ext = os.path.splitext(file_name)
+
+        # Priority 1: Date after LAST dash in YYYYMMDD format (8 digits after dash, starting with 19 or 20)
+        # Format 1: "4163627475  136-20251025" or Format 2: "532892345-20251025"
+        # Find all matches and use the last one (date should be at the end)
+        all_dash_matches = list(re.finditer(r"-(19|20)(\d{2})(\d{2})(\d{2})", name))
+        if all_dash_matches:
+            m_dash_compact = all_dash_matches[-1]  # Use the last match (date should be at the end)
+            yyyy_prefix, yy, mm, dd = m_dash_compact.group(1), m_dash_compact.group(2), m_dash_compact.group(3), m_dash_compact.group(4)
+            yyyy = f"{yyyy_prefix}{yy}"
+        else:
+            # Priority 2: Try YYYY-MM-DD format (with dashes)
+            m_full = re.search(r"(\d{4})-(\d{2})-(\d{2})", name)
+            if m_full:
+                yyyy, mm, dd = m_full.group(1), m_full.group(2), m_full.group(3)
+            else:
+                # Priority 3: Try YY-MM-DD format
+                m_short = re.search(r"(\d{2})-(\d{2})-(\d{2})", name)
+                if m_short:
+                    yy, mm, dd = m_short.group(1), m_short.group(2), m_short.group(3)
+                    yyyy = f"20{yy}"
+                else:
+                    return "", "", ""
+
+        final_name = f"{yyyy[2:]}-{mm}-{dd}{ext}"
+        return f"{yyyy}-{mm}-{dd}", yyyy, final_name
+
+    def ensure_year_organized(self, account_dir: str) -> None:
+        fs = self.fs
+        entries = [e for e in fs.listdir(account_dir) if fs.isdir(os.path.join(account_dir, e))]
+        if any(re.fullmatch(r"\d{4}", e) for e in entries):
+            return
+
+        files = [f for f in fs.listdir(account_dir) if fs.isfile(os.path.join(account_dir, f))]
+        for f in files:
+            year_folder = parse_filename(f).year
+            if not year_folder:
+                continue
+            year_dir = os.path.join(account_dir, year_folder)
+            fs.makedirs(year_dir, exist_ok=True)
+            try:
+                fs.move(os.path.join(account_dir, f), os.path.join(year_dir, f))
+            except Exception:
+                pass
+
+
+class OrganizeError(Exception):
+    """Raised when a run cannot start, e.g. a missing source or no PDFs"""
+
+
+def list_source_pdfs(fs: FileSystem, source_path: str) -> list[tuple[str, str]]:
+    """Return (source_dir, file_name) pairs for the PDFs at source_path"""
+    if not fs.exists(source_path):
+        raise OrganizeError(f"Source path does not exist: {source_path}")
+    try:
+        if fs.isfile(source_path):
+            if source_path.lower().endswith('.pdf'):
+                return [(os.path.dirname(source_path) or ".", os.path.basename(source_path))]
+            return []
+        if fs.isdir(source_path):
+            return [(source_path, f) for f, is_dir in fs.scandir(source_path)
+                    if not is_dir and f.lower().endswith('.pdf')]
+    except Exception as e:
+        raise OrganizeError(f"Error reading source path: {str(e)}") from e
+    return []
+
+
+# errno values (and Windows error codes) that usually clear up on their own: a
+# PDF still open in a viewer (a sharing violation), an antivirus scan, a busy
+# account, a share hiccup. Plain EACCES, ENOENT and EIO fail at once: a missing
+# permission or path, or a failing disk, is not fixed by waiting.
+TRANSIENT_ERRNOS = frozenset(filter(None, (
+    errno.EAGAIN, errno.EBUSY, errno.EINTR, errno.ETIMEDOUT,
+    errno.ECONNRESET, errno.ECONNABORTED, errno.ENETUNREACH, errno.EHOSTUNREACH,
+    getattr(errno, "ETXTBSY", None), getattr(errno, "ESTALE", None),
+)))
+TRANSIENT_WINERRORS = frozenset((32, 33, 53, 64, 121, 1231, 1236))  # sharing/lock violation, network
+
+
+def classify_error(exc: BaseException) -> str:
+    """Whether an error is worth retrying later ("transient") or not ("permanent")"""
+    if isinstance(exc, (TimeoutError, ConnectionError, LeaseBusy)):
+        return "transient"
+    if isinstance(exc, OSError) and (getattr(exc, "winerror", None) in TRANSIENT_WINERRORS
+                                     or exc.errno in TRANSIENT_ERRNOS):
+        return "transient"
+    return "permanent"
+
+
+class RetryQueue:
+    """Files waiting to be retried, ordered by when they are due.
+
+    The n-th retry of a file waits ``base_delay * 2**(n-1)`` seconds (capped
+    at ``max_delay``, with +/-20% jitter so files locked together do not
+    retry in lockstep). A file gets at most ``max_attempts`` attempts.
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._heap = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, item, attempts: int) -> float:
+        """Queue ``item`` after its ``attempts``-th failure; returns the delay"""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1)) * random.uniform(0.8, 1.2)
+        self._seq += 1
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._seq, item))
+        return delay
+
+    def next_due(self) -> float:
+        """Seconds until the next retry is due (0 if one is due now)"""
+        return max(0.0, self._heap[0][0] - time.monotonic()) if self._heap else 0.0
+
+    def pop_due(self) -> list:
+        now = time.monotonic()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def drain(self) -> list:
+        items = [entry[2] for entry in sorted(self._heap)]
+        self._heap.clear()
+        return items
+
+
+def source_stamps(fs: FileSystem, source_dirs) -> dict:
+    """{path: (size, mtime)} of the source folders' files, from one listing per folder rather than a stat per file"""
+    stamps = {}
+    for source_dir in source_dirs:
+        try:
+            stamps.update((os.path.join(source_dir, name), stat)
+                          for name, stat in fs.file_stats(source_dir).items())
+        except OSError:
+            pass
+    return stamps
+
+
+def organize_files(organizer: BillOrganizer, source_path: str, dest_root: str,
+                   on_progress=None, on_result=None, report=None, cancel_event=None,
+                   manifest=None, meter=None, retries: RetryQueue = None, files: list = None) -> dict:
+    """Organize every PDF at source_path into dest_root.
+
+    Shared by the GUI worker and headless runs. ``on_progress(idx, total,
+    file_name)`` is called before each file and ``on_result(outcome)`` with
+    its FileOutcome after it. Each outcome is also written to ``report`` (a
+    RunReportWriter) if given. Setting ``cancel_event`` stops the run before
+    the next file. With a SourceManifest, files left behind by an earlier run
+    and unchanged since are not processed again. Throughput is tracked in
+    ``meter`` (a ThroughputMeter, created if not given) and its averages are
+    returned under "metrics" with the run totals.
+
+    A file that fails with a transient error (see classify_error) is put on
+    ``retries`` (a RetryQueue, created if not given) and retried with backoff
+    between the remaining files, then after them; its outcome is reported
+    once, when it is final. Files that needed a retry are counted as
+    "retried". Checksums of verified moves that could not be added to their
+    account manifest (the account stayed locked) are counted as "unrecorded".
+
+    ``files`` takes (source_dir, file_name) pairs already picked from
+    source_path, as for one shard of a sharded run.
+    """
+    pdf_files = list_source_pdfs(organizer.fs, source_path) if files is None else files
+    total = len(pdf_files)
+    if total == 0:
+        raise OrganizeError("No PDF files found in source.")
+    organizer = organizer.for_run()
+
+    counts = {"moved": 0, "skipped": 0, "not_found": 0, "failed": 0}
+    fs = organizer.fs
+    verified = []  # (target, sha256, size) of verified moves, for the account manifests
+    source_dirs = {source_dir for source_dir, _ in pdf_files}
+    stamps = source_stamps(fs, source_dirs)
+    if manifest is not None:
+        fingerprint = organizer.fingerprint()
+        manifest.retain(source_dirs,
+                        {os.path.join(source_dir, file_name) for source_dir, file_name in pdf_files})
+        counts["unchanged"] = 0
+    if meter is None:
+        meter = ThroughputMeter()
+    meter.start(total, sum(stamps[os.path.join(d, f)][0] for d, f in pdf_files
+                           if os.path.join(d, f) in stamps))
+    if retries is None:
+        retries = RetryQueue()
+    counts["retried"] = 0
+    matches = organizer.match_batch([name for _, name in pdf_files]) if total >= BATCH_MATCH_MIN else {}
+
+    def finish(outcome, stamp, started):
+        outcome.elapsed = time.perf_counter() - started
+        outcome.size = outcome.size or (stamp[0] if stamp else 0)
+        meter.file_finished(stamp[0] if stamp else 0)
+        record_outcome_metrics(outcome, outcome.size)
+        counts[outcome.status] += 1
+        if outcome.checksum:
+            verified.append((outcome.target, outcome.checksum, outcome.size))
+        if report is not None:
+            report.write(outcome)
+        if on_result:
+            on_result(outcome)
+
+    def attempt(source_dir, file_name, stamp, attempts):
+        started = time.perf_counter()
+        src_path = os.path.join(source_dir, file_name)
+        try:
+            outcome = organizer.process_single_file(source_dir, dest_root, file_name, matches.get(file_name))
+            if manifest is not None and stamp is not None:
+                manifest.record(outcome, stamp, dest_root, fingerprint)
+        except Exception as ex:
+            if manifest is not None:
+                manifest.forget(src_path)
+            if (classify_error(ex) == "transient" and attempts < retries.max_attempts
+                    and fs.exists(src_path)):
+                if attempts == 1:
+                    counts["retried"] += 1
+                retries.schedule((source_dir, file_name, stamp, attempts + 1, str(ex)), attempts)
+                return
+            reason = str(ex) if attempts == 1 else f"{ex} (gave up after {attempts} attempts)"
+            outcome = FileOutcome(src_path, "skipped", reason)
+        finish(outcome, stamp, started)
+
+    for idx, (source_dir, file_name) in enumerate(pdf_files, start=1):
+        if cancel_event is not None and cancel_event.is_set():
+            counts["cancelled"] = True
+            break
+        for retry_dir, retry_name, retry_stamp, attempts, _ in retries.pop_due():
+            attempt(retry_dir, retry_name, retry_stamp, attempts)
+        if on_progress:
+            on_progress(idx, total, file_name)
+        started = time.perf_counter()
+        meter.file_started()
+        src_path = os.path.join(source_dir, file_name)
+        stamp = stamps.get(src_path)
+        if manifest is not None:
+            outcome = manifest.replay(fs, src_path, stamp, dest_root, fingerprint)
+            if outcome is not None:
+                counts["unchanged"] += 1
+                finish(outcome, stamp, started)
+                continue
+        attempt(source_dir, file_name, stamp, 1)
+
+    # Files still waiting for a retry once the batch is done
+    while retries:
+        delay = retries.next_due()
+        if cancel_event is not None:
+            if cancel_event.wait(delay):
+                counts["cancelled"] = True
+                break
+        elif delay:
+            time.sleep(delay)
+        for source_dir, file_name, stamp, attempts, _ in retries.pop_due():
+            attempt(source_dir, file_name, stamp, attempts)
+    for source_dir, file_name, stamp, attempts, error in retries.drain():
+        finish(FileOutcome(os.path.join(source_dir, file_name), "skipped", f"Cancelled before retry: {error}"),
+               stamp, time.perf_counter())
+
+    if verified:
+        unrecorded = record_checksums(organizer, verified)
+        if unrecorded:
+            counts["unrecorded"] = unrecorded
+    counts["total"] = total
+    counts["metrics"] = meter.summary()
+    return counts
+
+
+def simulate_run(file_count: int = 10000, account_count: int = 500, latency: float = 0.0,
+                 failure_rate: float = 0.0, seed: int = 0) -> dict:
+    """Run the organizer against a synthetic in-memory inbox and Utilities tree.
+
+    Builds ``file_count`` bills spread over ``account_count`` accounts, then
+    organizes them on a MemoryFileSystem (wrapped in a LatencyFileSystem when
+    latency or failures are requested). Returns the run totals plus timing.
+    """
+    if not 0 < account_count <= 10000:
+        raise ValueError("account_count must be between 1 and 10000")
+
+    rng = random.Random(seed)
+    memory_fs = MemoryFileSystem()
+    inbox, dest_root = os.path.abspath("inbox"), os.path.abspath("Utilities")
+    memory_fs.makedirs(dest_root)
+
+    providers = ("BELL", "TELUS", "ROGERS")
+    organizer = BillOrganizer(fs=memory_fs)
+    for n in range(account_count):
+        last4 = f"{n:04d}"
+        provider = providers[n % len(providers)]
+        organizer.mapping[(provider, last4)] = {
+            "provider": provider,
+            "corp": f"{1000 + n % 50}",
+            "account_last4": last4,
+            "account_ext": "",
+        }
+
+    for _ in range(file_count):
+        n = rng.randrange(account_count)
+        year, month, day = rng.randint(2015, 2025), rng.randint(1, 12), rng.randint(1, 28)
+        if rng.random() < 0.5:
+            name = f"416555{n:04d}_{year}-{month:02d}-{day:02d}.pdf"
+        else:
+            name = f"416 555 {n:04d}-{year}{month:02d}{day:02d}.pdf"
+        memory_fs.write_file(os.path.join(inbox, name))
+
+    if latency or failure_rate:
+        organizer.fs = LatencyFileSystem(memory_fs, latency=latency,
+                                         failure_rate=failure_rate, seed=seed)
+
+    started = time.perf_counter()
+    # Injected failures are retried like a real share's, on a compressed backoff
+    results = organize_files(organizer, inbox, dest_root, retries=RetryQueue(base_delay=0.01, max_delay=0.1))
+    results["elapsed"] = time.perf_counter() - started
+    return results
+
+
+def check_parser(names: list[str]) -> dict:
+    """Compare parse_filename against the reference parsers over ``names``.
+
+    Returns the mismatches as (name, reference, parsed) triples and the
+    per-filename cost of each implementation in microseconds. The batch
+    parser is checked against parse_filename the same way.
+    """
+    reference = BillOrganizer()
+    started = time.perf_counter()
+    expected = [(*reference.extract_account_tokens(n), *reference.extract_date_targets(n)) for n in names]
+    reference_us = (time.perf_counter() - started) * 1e6
+
+    started = time.perf_counter()
+    parsed = [parse_filename(n) for n in names]
+    parsed_us = (time.perf_counter() - started) * 1e6
+
+    started = time.perf_counter()
+    table = parse_filenames(names)
+    batch_us = (time.perf_counter() - started) * 1e6
+    batch = zip(*(table[field].tolist() for field in ParsedFilename._fields))
+
+    mismatches = [(n, e, tuple(p)) for n, e, p in zip(names, expected, parsed) if e != tuple(p)]
+    batch_mismatches = [(n, tuple(p), b) for n, p, b in zip(names, parsed, batch) if tuple(p) != b]
+    count = max(len(names), 1)
+    return {
+        "total": len(names),
+        "mismatches": mismatches,
+        "batch_mismatches": batch_mismatches,
+        "reference_us": reference_us / count,
+        "parsed_us": parsed_us / count,
+        "batch_us": batch_us / count,
+    }
+
+
+# ------------------------------ Source Manifest ------------------------------
+
+class SourceManifest:
+    """Decisions for files left in a source folder, keyed by path, size and mtime.
+
+    A file that was skipped or not found stays in the inbox, so the next run
+    over the same folder would parse and check it again. The manifest records
+    each such decision together with the file's size and mtime, the
+    destination root and the organizer fingerprint (mapping and provider
+    rules). ``replay`` returns the recorded outcome while all of those are
+    unchanged; a "Target already exists" skip is also re-checked with one stat
+    of its target. Moved files and errors are never replayed.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.entries = {}  # source path -> dict
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    @staticmethod
+    def _dest_key(dest_root: str) -> str:
+        return os.path.normcase(os.path.abspath(dest_root))
+
+    def replay(self, fs: FileSystem, source: str, stamp, dest_root: str, fingerprint: str):
+        """The recorded outcome for an unchanged file, or None if it must be processed"""
+        if stamp is None:
+            return None
+        entry = self.entries.get(source)
+        if (entry is None or entry["size"] != stamp[0] or entry["mtime"] != stamp[1]
+                or entry["fingerprint"] != fingerprint or entry["dest"] != self._dest_key(dest_root)):
+            return None
+        if entry["status"] == "skipped" and not (entry["target"] and fs.exists(entry["target"])):
+            return None
+        outcome = FileOutcome(source, entry["status"], entry["reason"])
+        for field in ("target", "token", "provider", "provider_folder", "corp", "date"):
+            setattr(outcome, field, entry[field])
+        return outcome
+
+    def record(self, outcome: FileOutcome, stamp, dest_root: str, fingerprint: str):
+        if outcome.moved or outcome.status == "failed":
+            self.forget(outcome.source)
+            return
+        with self._lock:
+            self.entries[outcome.source] = {
+                "size": stamp[0], "mtime": stamp[1], "dest": self._dest_key(dest_root),
+                "fingerprint": fingerprint, "status": outcome.status, "reason": outcome.reason,
+                "target": outcome.target, "token": outcome.token, "provider": outcome.provider,
+                "provider_folder": outcome.provider_folder, "corp": outcome.corp, "date": outcome.date,
+            }
+
+    def forget(self, source: str):
+        with self._lock:
+            self.entries.pop(source, None)
+
+    def retain(self, source_dirs: set, present: set):
+        """Drop entries for files that have left the given source folders"""
+        with self._lock:
+            for source in [s for s in self.entries if os.path.dirname(s) in source_dirs and s not in present]:
+                del self.entries[source]
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self.entries)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+
+# ------------------------------ Checksums ------------------------------
+
+def file_checksum(fs: FileSystem, path: str) -> tuple[str, int]:
+    """(sha256 hex, size) of a file, read in CHECKSUM_CHUNK_SIZE blocks into one reused buffer"""
+    with fs.open(path, "rb") as f:
+        return stream_checksum(f)
+
+
+def stream_checksum(f) -> tuple[str, int]:
+    """(sha256 hex, size) of the rest of an open binary file"""
+    digest = hashlib.sha256()
+    buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+    view = memoryview(buffer)
+    size = 0
+    while True:
+        n = f.readinto(buffer)
+        if not n:
+            break
+        digest.update(view[:n])
+        size += n
+    return digest.hexdigest(), size
+
+
+def load_checksum_manifest(fs: FileSystem, account_dir: str) -> dict:
+    """{path relative to the account folder: {"sha256", "size"}}"""
+    path = os.path.join(account_dir, CHECKSUM_MANIFEST_NAME)
+    if not fs.exists(path):
+        return {}
+    with fs.open(path, "r") as f:
+        return json.load(f).get("files", {})
+
+
+def save_checksum_manifest(fs: FileSystem, account_dir: str, files: dict):
+    with fs.open(os.path.join(account_dir, CHECKSUM_MANIFEST_NAME), "w") as f:
+        json.dump({"algorithm": "sha256", "files": files}, f, indent=1, sort_keys=True)
+
+
+def update_checksum_manifest(fs: FileSystem, account_dir: str, change, held: bool = False) -> None:
+    """Read-modify-write an account manifest: ``change(files)`` returns the new files dict.
+
+    Takes a lease on the account folder for the rewrite so other workstations
+    never interleave with it, unless the caller ``held`` one already. An
+    unreadable manifest is started afresh; nothing is written when ``change``
+    returns None.
+    """
+    with contextlib.nullcontext() if held else LeaseLock(fs, account_dir):
+        try:
+            files = load_checksum_manifest(fs, account_dir)
+        except (OSError, ValueError):
+            files = {}
+        files = change(files)
+        if files is not None:
+            save_checksum_manifest(fs, account_dir, files)
+
+
+def _account_of(target: str) -> tuple[str, str]:
+    """(account folder, path relative to it) for a bill at account/year/name"""
+    year_dir, name = os.path.split(target)
+    account_dir, year = os.path.split(year_dir)
+    return account_dir, f"{year}/{name}"
+
+
+def record_checksums(organizer: "BillOrganizer", verified: list, workers: int = 8) -> int:
+    """Add (target, sha256, size) entries to their account manifests, accounts in parallel.
+
+    Each account is updated under the organizer's lock and lease for it, the
+    same ones its moves took. Returns how many entries could not be recorded.
+    """
+    fs = organizer.fs
+    by_account = {}
+    for target, checksum, size in verified:
+        account_dir, rel = _account_of(target)
+        by_account.setdefault(account_dir, {})[rel] = {"sha256": checksum, "size": size}
+
+    def update(item):
+        account_dir, entries = item
+        try:
+            with organizer.account_lock(account_dir), LeaseLock(fs, account_dir):
+                update_checksum_manifest(fs, account_dir, lambda files: {**files, **entries}, held=True)
+        except OSError:
+            return len(entries)
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(by_account)))) as pool:
+        return sum(pool.map(update, by_account.items()))
+
+
+def verify_tree(fs: FileSystem, dest_root: str, workers: int = 8, update: bool = False,
+                on_problem=None) -> dict:
+    """Check every bill of a Utilities tree against its account checksum manifest.
+
+    Accounts are visited one at a time and their files hashed in parallel, so
+    memory stays bounded by the largest account. ``on_problem(status, path,
+    detail)`` is called for each "missing" or "mismatch" file. Bills moved into
+    a year archive are counted as archived. Bills not in a manifest are counted
+    as untracked, and with ``update`` their checksums are added to it.
+    """
+    if not fs.isdir(dest_root):
+        raise OrganizeError(f"Destination folder not found: {dest_root}")
+    totals = {"accounts": 0, "verified": 0, "archived": 0, "missing": 0, "mismatch": 0,
+              "untracked": 0, "recorded": 0}
+
+    def check(task):
+        rel, expected, path = task
+        try:
+            return rel, expected, file_checksum(fs, path)
+        except FileNotFoundError:
+            return rel, expected, None
+        except OSError as e:
+            return rel, expected, e
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for account_dir in list_account_dirs(fs, dest_root):
+            totals["accounts"] += 1
+            try:
+                files = load_checksum_manifest(fs, account_dir)
+            except (OSError, ValueError) as e:
+                if on_problem:
+                    on_problem("unreadable", os.path.join(account_dir, CHECKSUM_MANIFEST_NAME), str(e))
+                continue
+            present = set()
+            for name, is_dir in fs.scandir(account_dir):
+                if is_dir and _YEAR_DIR_RE.fullmatch(name):
+                    present.update(f"{name}/{f}" for f, sub in fs.scandir(os.path.join(account_dir, name))
+                                   if not sub)
+            tasks = [(rel, entry, os.path.join(account_dir, *rel.split("/"))) for rel, entry in files.items()]
+            tasks += [(rel, None, os.path.join(account_dir, *rel.split("/")))
+                      for rel in sorted(present - set(files))]
+
+            recorded = {}
+            archived = archived_names(fs, account_dir)
+            for (rel, expected, path), (_, _, result) in zip(tasks, pool.map(check, tasks)):
+                if expected is not None and result is None and rel in archived:
+                    totals["archived"] += 1
+                elif expected is None:
+                    totals["untracked"] += 1
+                    if update and isinstance(result, tuple):
+                        recorded[rel] = {"sha256": result[0], "size": result[1]}
+                elif result is None:
+                    totals["missing"] += 1
+                    if on_problem:
+                        on_problem("missing", path, "")
+                elif isinstance(result, OSError):
+                    totals["mismatch"] += 1
+                    if on_problem:
+                        on_problem("mismatch", path, f"unreadable: {result}")
+                elif result[0] != expected["sha256"] or result[1] != expected["size"]:
+                    totals["mismatch"] += 1
+                    if on_problem:
+                        on_problem("mismatch", path, f"expected {expected['sha256'][:12]}, found {result[0][:12]}")
+                else:
+                    totals["verified"] += 1
+            if recorded:
+                try:
+                    update_checksum_manifest(fs, account_dir, lambda files: {**files, **recorded})
+                    totals["recorded"] += len(recorded)
+                except OSError as e:
+                    if on_problem:
+                        on_problem("unrecorded", os.path.join(account_dir, CHECKSUM_MANIFEST_NAME), str(e))
+    return totals
+
+
+# ------------------------------ Migration ------------------------------
+
+class MigrationStep(NamedTuple):
+    """One planned move in a bulk year reorganization"""
+    account_dir: str
+    source: str
+    target: str
+    action: str  # "year" (into its year folder), "rename" (same folder) or "conflict"
+    reason: str = ""
+
+
+_YEAR_DIR_RE = re.compile(r"\d{4}")
+
+
+def archived_years(fs: FileSystem, account_dir: str, names=None) -> set:
+    """Years of an account packed into a YEAR.zip, from its archive index and the zips in ``names``
+    (the account folder's listing, read if not given)"""
+    years = {rel.split("/", 1)[0] for rel in archived_names(fs, account_dir)}
+    if names is None:
+        try:
+            names = fs.listdir(account_dir)
+        except OSError:
+            names = []
+    years.update(name[:-4] for name in names if name.endswith(".zip") and _YEAR_DIR_RE.fullmatch(name[:-4]))
+    return years
+
+
+def list_account_dirs(fs: FileSystem, dest_root: str) -> list[str]:
+    """Account folders of a Utilities tree (corp / provider / account)"""
+    found = []
+    for corp in sorted(fs.listdir(dest_root)):
+        corp_dir = os.path.join(dest_root, corp)
+        if not fs.isdir(corp_dir):
+            continue
+        for provider in sorted(fs.listdir(corp_dir)):
+            provider_dir = os.path.join(corp_dir, provider)
+            if not fs.isdir(provider_dir):
+                continue
+            for account in sorted(fs.listdir(provider_dir)):
+                account_dir = os.path.join(provider_dir, account)
+                if fs.isdir(account_dir):
+                    found.append(account_dir)
+    return found
+
+
+def plan_account_migration(fs: FileSystem, account_dir: str) -> list[MigrationStep]:
+    """Steps that put every dated file of one account at YYYY/YY-MM-DD.ext.
+
+    A year already packed into an archive is left alone: its moves are
+    conflicts, since archiving again would have to merge them into the zip.
+    """
+    files = []  # (folder, name)
+    entries = sorted(fs.listdir(account_dir))
+    archived = archived_years(fs, account_dir, entries)
+    for entry in entries:
+        path = os.path.join(account_dir, entry)
+        if fs.isdir(path):
+            if _YEAR_DIR_RE.fullmatch(entry):
+                files += [(path, f) for f in sorted(fs.listdir(path)) if fs.isfile(os.path.join(path, f))]
+        else:
+            files.append((account_dir, entry))
+
+    existing = {os.path.join(folder, name) for folder, name in files}
+    claimed = set()
+    steps = []
+    for folder, name in files:
+        parsed = parse_filename(name)
+        if not parsed.date:
+            continue
+        source = os.path.join(folder, name)
+        target = os.path.join(account_dir, parsed.year, parsed.final_name)
+        if target == source:
+            continue
+        action = "rename" if folder == os.path.dirname(target) else "year"
+        if parsed.year in archived:
+            steps.append(MigrationStep(account_dir, source, target, "conflict",
+                                       f"{parsed.year} is already archived in {parsed.year}.zip"))
+        elif target in claimed:
+            steps.append(MigrationStep(account_dir, source, target, "conflict", "Another file maps to the same name"))
+        elif target in existing or fs.exists(target):
+            steps.append(MigrationStep(account_dir, source, target, "conflict", "Target already exists"))
+        else:
+            claimed.add(target)
+            steps.append(MigrationStep(account_dir, source, target, action))
+    return steps
+
+
+def plan_migration(fs: FileSystem, dest_root: str, workers: int = 8) -> list[MigrationStep]:
+    """Plan the bulk year reorganization of a whole Utilities tree, accounts in parallel"""
+    if not fs.isdir(dest_root):
+        raise OrganizeError(f"Destination folder not found: {dest_root}")
+    accounts = list_account_dirs(fs, dest_root)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return [step for steps in pool.map(lambda d: plan_account_migration(fs, d), accounts) for step in steps]
+
+
+def apply_migration(fs: FileSystem, steps: list[MigrationStep], workers: int = 8) -> dict:
+    """Carry out a migration plan, accounts in parallel and each account in order.
+
+    Each account's steps run under a LeaseLock on its folder, so no organizer,
+    archive run or other workstation changes it meanwhile; an account that
+    stays locked fails its steps. Every move is re-checked first, so a plan
+    that has gone stale (files moved or added since planning) skips the
+    affected steps instead of overwriting, and moves into a year archived
+    since planning are counted as conflicts and left in place.
+    """
+    by_account = {}
+    for step in steps:
+        if step.action != "conflict":
+            by_account.setdefault(step.account_dir, []).append(step)
+
+    def apply_account(account_steps):
+        account_dir = account_steps[0].account_dir
+        moved, failed, conflicts, renamed = 0, [], 0, {}
+        try:
+            lease = LeaseLock(fs, account_dir).acquire()
+        except OSError as e:
+            return 0, [(step, str(e)) for step in account_steps], 0
+        held = True
+        try:
+            archived = archived_years(fs, account_dir)
+            renewed = time.monotonic()
+            for idx, step in enumerate(account_steps):
+                if time.monotonic() - renewed > lease.ttl / 3:
+                    try:
+                        lease.renew()
+                    except LeaseLost as e:
+                        held = False
+                        failed += [(rest, str(e)) for rest in account_steps[idx:]]
+                        break
+                    renewed = time.monotonic()
+                if os.path.basename(os.path.dirname(step.target)) in archived:
+                    conflicts += 1
+                    continue
+                try:
+                    if not fs.isfile(step.source):
+                        raise OSError(errno.ENOENT, "Source no longer exists")
+                    if fs.exists(step.target):
+                        raise OSError(errno.EEXIST, "Target already exists")
+                    fs.makedirs(os.path.dirname(step.target), exist_ok=True)
+                    fs.move(step.source, step.target)
+                    moved += 1
+                    renamed[os.path.relpath(step.source, account_dir).replace(os.sep, "/")] = \
+                        os.path.relpath(step.target, account_dir).replace(os.sep, "/")
+                except OSError as e:
+                    failed.append((step, e.strerror or str(e)))
+            # Keep the account's checksum manifest pointing at the new names
+            def rename(files):
+                if not renamed.keys() & files.keys():
+                    return None
+                return {renamed.get(rel, rel): entry for rel, entry in files.items()}
+            if renamed:
+                try:
+                    update_checksum_manifest(fs, account_dir, rename, held=held)
+                except OSError:
+                    pass
+        finally:
+            if held:
+                lease.release()
+        return moved, failed, conflicts
+
+    results = {"moved": 0, "failed": [], "conflicts": sum(1 for s in steps if s.action == "conflict")}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for moved, failed, conflicts in pool.map(apply_account, by_account.values()):
+            results["moved"] += moved
+            results["failed"] += failed
+            results["conflicts"] += conflicts
+    return results
+
+
+def save_migration_plan(path: str, dest_root: str, steps: list[MigrationStep]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "dest": os.path.abspath(dest_root),
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "steps": [step._asdict() for step in steps],
+        }, f, indent=1)
+
+
+def load_migration_plan(path: str) -> tuple[str, list[MigrationStep]]:
+    with open(path, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+    return plan["dest"], [MigrationStep(**step) for step in plan["steps"]]
+
+
+# ------------------------------ Coverage ------------------------------
+
+def _month_range(first: str, last: str) -> list[str]:
+    """Every "YYYY-MM" from first to last inclusive"""
+    year, month = int(first[:4]), int(first[5:7])
+    end = (int(last[:4]), int(last[5:7]))
+    months = []
+    while (year, month) <= end:
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class CoverageMatrix:
+    """Bills per account per month, with the gaps between them.
+
+    ``accounts`` maps (corp, provider folder, account) to {"YYYY-MM": count}.
+    An account's gaps are the months from its first bill up to the latest
+    month seen anywhere in the tree that have no bill.
+    """
+
+    def __init__(self, accounts: dict):
+        self.accounts = accounts
+        seen = [m for counts in accounts.values() for m in counts]
+        self.months = _month_range(min(seen), max(seen)) if seen else []
+
+    def gaps(self, key) -> list[str]:
+        counts = self.accounts[key]
+        if not counts:
+            return []
+        return [m for m in _month_range(min(counts), self.months[-1]) if m not in counts]
+
+    def rows(self):
+        """One summary dict per account, sorted by corp / provider / account"""
+        for key in sorted(self.accounts):
+            counts = self.accounts[key]
+            yield {
+                "corp": key[0],
+                "provider": key[1],
+                "account": key[2],
+                "bills": sum(counts.values()),
+                "first": min(counts) if counts else "",
+                "last": max(counts) if counts else "",
+                "missing": self.gaps(key),
+            }
+
+    def export(self, path: str):
+        """Write the full account x month matrix (.xlsx, otherwise CSV)"""
+        header = ["Corp", "Provider", "Account", "Bills", "Missing"] + self.months
+        table = []
+        for row in self.rows():
+            counts = self.accounts[(row["corp"], row["provider"], row["account"])]
+            table.append([row["corp"], row["provider"], row["account"], row["bills"],
+                          len(row["missing"])] + [counts.get(m, 0) for m in self.months])
+        if path.lower().endswith((".xlsx", ".xls")):
+            pd.DataFrame(table, columns=header).to_excel(path, index=False)
+            return
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(table)
+
+
+class CoverageScanner:
+    """Builds a CoverageMatrix from an organized Utilities tree.
+
+    Each directory's entries are cached with its mtime (as sub-folders plus
+    the bill months of its files). A re-scan stats every directory but only
+    re-lists the ones whose mtime changed, so an unchanged tree costs one stat
+    per folder. The cache is kept in ``cache_path`` between sessions.
+    """
+
+    def __init__(self, fs: FileSystem = None, cache_path: str = None):
+        self.fs = fs if fs is not None else LocalFileSystem()
+        self.cache_path = cache_path
+        self.cache = {}  # dir -> [mtime, subdirs, months]
+        self.listed = 0  # directories re-listed by the last scan
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError):
+                self.cache = {}
+
+    def _entry(self, path: str) -> list:
+        mtime = self.fs.getmtime(path)
+        entry = self.cache.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry
+        subdirs, months = [], []
+        for name, is_dir in self.fs.scandir(path):
+            if is_dir:
+                subdirs.append(name)
+            elif name == ARCHIVE_INDEX_NAME:
+                # Bills packed into year archives still count
+                for rel in archived_names(self.fs, path):
+                    date = parse_filename(rel.rsplit("/", 1)[-1]).date
+                    if date:
+                        months.append(date[:7])
+            else:
+                date = parse_filename(name).date
+                if date:
+                    months.append(date[:7])
+        self.listed += 1
+        return [mtime, subdirs, months]
+
+    def scan(self, dest_root: str) -> CoverageMatrix:
+        if not self.fs.isdir(dest_root):
+            raise OrganizeError(f"Destination folder not found: {dest_root}")
+        self.listed = 0
+        visited = {}
+        accounts = {}
+        stack = [(dest_root, ())]
+        while stack:
+            path, parts = stack.pop()
+            try:
+                entry = self._entry(path)
+            except OSError:
+                continue
+            visited[path] = entry
+            _, subdirs, months = entry
+            if len(parts) == 3 or len(parts) == 4:
+                counts = accounts.setdefault(parts[:3], {})
+                for month in months:
+                    counts[month] = counts.get(month, 0) + 1
+            for name in subdirs:
+                # corp / provider / account, then only the year folders of an account
+                if len(parts) < 3 or (len(parts) == 3 and _YEAR_DIR_RE.fullmatch(name)):
+                    stack.append((os.path.join(path, name), parts + (name,)))
+        self.cache = visited
+        if self.cache_path:
+            try:
+                with open(self.cache_path, "w", encoding="utf-8") as f:
+                    json.dump(self.cache, f)
+            except OSError:
+                pass
+        return CoverageMatrix(accounts)
+
+
+# ------------------------------ Archives ------------------------------
+
+def load_archive_index(fs: FileSystem, account_dir: str) -> dict:
+    """{archive name: {path relative to the account folder: size}}"""
+    path = os.path.join(account_dir, ARCHIVE_INDEX_NAME)
+    if not fs.exists(path):
+        return {}
+    with fs.open(path, "r") as f:
+        return json.load(f).get("archives", {})
+
+
+def save_archive_index(fs: FileSystem, account_dir: str, archives: dict):
+    path = os.path.join(account_dir, ARCHIVE_INDEX_NAME)
+    with fs.open(path + ".tmp", "w") as f:
+        json.dump({"archives": archives}, f, indent=1, sort_keys=True)
+    fs.move(path + ".tmp", path)
+
+
+def archived_names(fs: FileSystem, account_dir: str) -> dict:
+    """{relative path: archive name} for every bill packed into one of the account's archives"""
+    try:
+        archives = load_archive_index(fs, account_dir)
+    except (OSError, ValueError):
+        return {}
+    return {rel: name for name, files in archives.items() for rel in files}
+
+
+def archive_account_year(fs: FileSystem, account_dir: str, year: str, compress: bool = False) -> dict:
+    """Pack account/YEAR/* into account/YEAR.zip and remove the originals.
+
+    Members are streamed in CHECKSUM_CHUNK_SIZE blocks, so no bill is held in
+    memory. An existing archive for the year is rebuilt with its old members
+    plus the new files; a file whose name is already archived with different
+    contents is left in place as a conflict. The archive is written to a
+    temporary name, read back in full (every member's CRC, and the sha256 of
+    each new one against the file it came from and the account's checksum
+    manifest), and renamed before the index is updated and the originals are
+    deleted, so an interrupted run never loses a bill.
+
+    The account folder is held under a LeaseLock for the whole operation, so
+    no organizer or other workstation moves bills into it meanwhile.
+    """
+    with LeaseLock(fs, account_dir):
+        return _archive_year(fs, account_dir, year, compress)
+
+
+def _archive_year(fs: FileSystem, account_dir: str, year: str, compress: bool) -> dict:
+    year_dir = os.path.join(account_dir, year)
+    archive_name = f"{year}.zip"
+    archive_path = os.path.join(account_dir, archive_name)
+    tmp_path = archive_path + ".tmp"
+    archives = load_archive_index(fs, account_dir)
+    members = dict(archives.get(archive_name, {}))
+
+    on_disk = {name: size for name, (size, _) in fs.file_stats(year_dir).items()}
+    conflicts, duplicates, added = [], [], {}
+    for name, size in sorted(on_disk.items()):
+        rel = f"{year}/{name}"
+        if rel in members:
+            # Already archived by an interrupted run if the size matches
+            (duplicates if members[rel] == size else conflicts).append(rel)
+        else:
+            added[rel] = size
+    if not added and not duplicates:
+        return {"files": 0, "bytes": 0, "conflicts": conflicts}
+
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+    digests = {}
+    with fs.open(tmp_path, "wb") as raw, zipfile.ZipFile(raw, "w", compression=method) as bundle:
+        if members and fs.exists(archive_path):
+            with fs.open(archive_path, "rb") as old_raw, zipfile.ZipFile(old_raw) as old:
+                for info in old.infolist():
+                    with old.open(info) as src, bundle.open(info, "w") as dst:
+                        shutil.copyfileobj(src, dst, CHECKSUM_CHUNK_SIZE)
+        for rel in sorted(added):
+            info = zipfile.ZipInfo(rel, datetime.fromtimestamp(
+                fs.getmtime(os.path.join(account_dir, rel))).timetuple()[:6])
+            info.compress_type = method
+            digest = hashlib.sha256()
+            with fs.open(os.path.join(account_dir, rel), "rb") as src, bundle.open(info, "w") as dst:
+                while True:
+                    n = src.readinto(buffer)
+                    if not n:
+                        break
+                    chunk = memoryview(buffer)[:n]
+                    digest.update(chunk)
+                    dst.write(chunk)
+            digests[rel] = digest.hexdigest()
+
+    members.update(added)
+    try:
+        recorded = load_checksum_manifest(fs, account_dir)
+    except (OSError, ValueError):
+        recorded = {}
+    try:
+        # Reading every member back makes zipfile check its CRC as well
+        with fs.open(tmp_path, "rb") as raw, zipfile.ZipFile(raw) as check:
+            written = {}
+            for info in check.infolist():
+                with check.open(info) as member:
+                    written[info.filename] = stream_checksum(member)
+        for rel, size in members.items():
+            if rel not in written or written[rel][1] != size:
+                raise OSError(errno.EIO, f"Archive check failed for {archive_path}: {rel}")
+        for rel, digest in digests.items():
+            expected = recorded.get(rel, {}).get("sha256", digest)
+            if written[rel][0] != digest or expected != digest:
+                raise OSError(errno.EIO, f"Checksum mismatch archiving {os.path.join(account_dir, rel)}")
+        for rel in list(duplicates):
+            if file_checksum(fs, os.path.join(account_dir, rel))[0] != written[rel][0]:
+                duplicates.remove(rel)
+                conflicts.append(rel)
+    except (OSError, zipfile.BadZipFile):
+        fs.remove(tmp_path)
+        raise
+    fs.move(tmp_path, archive_path)
+    archives[archive_name] = members
+    save_archive_index(fs, account_dir, archives)
+
+    for rel in list(added) + duplicates:
+        fs.remove(os.path.join(account_dir, rel))
+    if not conflicts and not fs.listdir(year_dir):
+        fs.rmdir(year_dir)
+    return {"files": len(added), "bytes": sum(added.values()), "conflicts": conflicts}
+
+
+def archive_tree(fs: FileSystem, dest_root: str, before_year: int, workers: int = 8,
+                 compress: bool = False, dry_run: bool = False, on_problem=None) -> dict:
+    """Archive every year folder older than ``before_year``, accounts in parallel"""
+    if not fs.isdir(dest_root):
+        raise OrganizeError(f"Destination folder not found: {dest_root}")
+    totals = {"accounts": 0, "archives": 0, "files": 0, "bytes": 0, "conflicts": 0, "failed": 0}
+    lock = threading.Lock()
+
+    def archive_account(account_dir):
+        years = sorted(name for name, is_dir in fs.scandir(account_dir)
+                       if is_dir and _YEAR_DIR_RE.fullmatch(name) and int(name) < before_year)
+        if not years:
+            return
+        with lock:
+            totals["accounts"] += 1
+        for year in years:
+            try:
+                if dry_run:
+                    stats = fs.file_stats(os.path.join(account_dir, year))
+                    result = {"files": len(stats), "bytes": sum(size for size, _ in stats.values()),
+                              "conflicts": []}
+                else:
+                    result = archive_account_year(fs, account_dir, year, compress)
+            except (OSError, zipfile.BadZipFile, ValueError) as e:
+                with lock:
+                    totals["failed"] += 1
+                if on_problem:
+                    on_problem("failed", os.path.join(account_dir, year), str(e))
+                continue
+            with lock:
+                totals["archives"] += 1 if result["files"] else 0
+                totals["files"] += result["files"]
+                totals["bytes"] += result["bytes"]
+                totals["conflicts"] += len(result["conflicts"])
+            if on_problem:
+                for rel in result["conflicts"]:
+                    on_problem("conflict", os.path.join(account_dir, rel), "already archived with different contents")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(archive_account, list_account_dirs(fs, dest_root)))
+    return totals
+
+
+# ------------------------------ Throughput ------------------------------
+
+class ThroughputMeter:
+    """Files/s, MB/s, files in progress and a smoothed ETA for a run.
+
+    Updating it costs a lock and a clock read per file. Rates are sampled at
+    most every ``interval`` seconds and smoothed with an exponential moving
+    average so a few large files do not make the ETA jump. When the run's
+    total size is known the ETA follows bytes, otherwise files. Safe to
+    update from several threads. Files finished by other processes are
+    added with file_reported(); such a meter leaves "in_flight" out of its
+    snapshots rather than show a count it cannot know.
+    """
+
+    def __init__(self, total: int = 0, total_bytes: int = 0, interval: float = 0.5, smoothing: float = 0.3):
+        self.total = total
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self.smoothing = smoothing
+        self.done = 0
+        self.bytes = 0
+        self.in_flight = 0
+        self.tracks_in_flight = True  # False once files finished elsewhere are reported
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._sample = (self._started, 0, 0)  # time, files, bytes at the last rate sample
+        self._files_rate = None
+        self._bytes_rate = None
+
+    def start(self, total: int, total_bytes: int = 0):
+        with self._lock:
+            self.total, self.total_bytes = total, total_bytes
+            self._started = time.perf_counter()
+            self._sample = (self._started, self.done, self.bytes)
+
+    def file_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def file_finished(self, size: int = 0):
+        with self._lock:
+            self.in_flight -= 1
+            self._finished(size)
+
+    def file_reported(self, size: int = 0):
+        """A file finished by another process; which files are in progress there is not known"""
+        with self._lock:
+            self.tracks_in_flight = False
+            self._finished(size)
+
+    def _finished(self, size: int):
+        # Called with the lock held
+        self.done += 1
+        self.bytes += size
+        now = time.perf_counter()
+        sampled, done, nbytes = self._sample
+        span = now - sampled
+        if span >= self.interval:
+            self._files_rate = self._smooth(self._files_rate, (self.done - done) / span)
+            self._bytes_rate = self._smooth(self._bytes_rate, (self.bytes - nbytes) / span)
+            self._sample = (now, self.done, self.bytes)
+
+    def _smooth(self, previous, rate):
+        return rate if previous is None else previous + self.smoothing * (rate - previous)
+
+    def snapshot(self) -> dict:
+        """Current rates and ETA in seconds (None until it can be estimated)"""
+        with self._lock:
+            elapsed = time.perf_counter() - self._started
+            files_rate = self._files_rate if self._files_rate is not None else (
+                self.done / elapsed if elapsed > 0 else 0.0)
+            bytes_rate = self._bytes_rate if self._bytes_rate is not None else (
+                self.bytes / elapsed if elapsed > 0 else 0.0)
+            eta = None
+            if self.total_bytes and bytes_rate > 0:
+                eta = max(0.0, self.total_bytes - self.bytes) / bytes_rate
+            elif self.total and files_rate > 0:
+                eta = max(0, self.total - self.done) / files_rate
+            snapshot = {"done": self.done, "total": self.total, "in_flight": self.in_flight,
+                        "bytes": self.bytes, "elapsed_s": round(elapsed, 3),
+                        "files_per_s": round(files_rate, 2), "mb_per_s": round(bytes_rate / 1e6, 3),
+                        "eta_s": None if eta is None else round(eta, 1)}
+            if not self.tracks_in_flight:
+                del snapshot["in_flight"]
+            return snapshot
+
+    def summary(self) -> dict:
+        """Averages over the whole run, for history entries and reports"""
+        with self._lock:
+            elapsed = time.perf_counter() - self._started
+            return {"files": self.done, "bytes": self.bytes, "elapsed_s": round(elapsed, 3),
+                    "files_per_s": round(self.done / elapsed, 2) if elapsed > 0 else 0.0,
+                    "mb_per_s": round(self.bytes / 1e6 / elapsed, 3) if elapsed > 0 else 0.0}
+
+
+def format_throughput(metrics: dict) -> str:
+    """One status line for a ThroughputMeter snapshot (or several summed)"""
+    text = f"{metrics['files_per_s']:.1f} files/s  ·  {metrics['mb_per_s']:.1f} MB/s"
+    eta = metrics.get("eta_s")
+    if eta is not None:
+        minutes, seconds = divmod(int(eta + 0.5), 60)
+        text += f"  ·  ETA {minutes}m {seconds:02d}s" if minutes else f"  ·  ETA {seconds}s"
+    if "in_flight" in metrics:
+        text += f"  ·  {metrics['in_flight']} in progress"
+    return text
+
+
+# ------------------------------ Metrics ------------------------------
+
+class _ShardOwner:
+    """Kept in a thread's local storage; collected, and its shard retired, when the thread exits"""
+    __slots__ = ("__weakref__",)
+
+
+def _merge_values(merged: dict, shard: dict) -> None:
+    """Add a shard's counters and histogram counts to ``merged``, never changing a list in place"""
+    for key, value in list(shard.items()):
+        if isinstance(value, list):
+            total = merged.get(key)
+            merged[key] = list(value) if total is None else [a + b for a, b in zip(total, value)]
+        else:
+            merged[key] = merged.get(key, 0) + value
+
+
+class MetricsRegistry:
+    """Counters, histograms and gauges rendered in OpenMetrics text format.
+
+    Counters and histograms are recorded into a per-thread shard without
+    taking a lock; shards are only merged when the metrics are rendered.
+    When a thread exits its shard is folded into a base total and dropped,
+    so a server handling each request on a new thread keeps one shard per
+    live thread. Gauges are read from callbacks at render time. Labels are
+    a tuple of (name, value) pairs.
+    """
+
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self._families = {}  # name -> (type, help, buckets)
+        self._gauges = {}  # name -> callback returning a number or {labels: number}
+        self._shards = {}  # id -> shard of a live thread
+        self._base = {}  # totals of threads that have exited
+        self._local = threading.local()
+        self._lock = threading.RLock()  # a shard may be retired by a collection run while it is held
+
+    def counter(self, name: str, help_text: str):
+        self._families[name] = ("counter", help_text, None)
+
+    def histogram(self, name: str, help_text: str, buckets=DEFAULT_BUCKETS):
+        self._families[name] = ("histogram", help_text, tuple(buckets))
+
+    def gauge(self, name: str, help_text: str, callback):
+        self._families[name] = ("gauge", help_text, None)
+        self._gauges[name] = callback
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "values", None)
+        if shard is None:
+            shard = self._local.values = {}
+            owner = self._local.owner = _ShardOwner()
+            with self._lock:
+                self._shards[id(shard)] = shard
+            weakref.finalize(owner, self._retire, shard)
+        return shard
+
+    def _retire(self, shard: dict):
+        with self._lock:
+            self._shards.pop(id(shard), None)
+            _merge_values(self._base, shard)
+
+    def inc(self, name: str, value: float = 1, labels: tuple = ()):
+        shard = self._shard()
+        key = (name, labels)
+        shard[key] = shard.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: tuple = ()):
+        shard = self._shard()
+        key = (name, labels)
+        counts = shard.get(key)
+        if counts is None:
+            # One count per bucket plus +Inf, then the running sum
+            counts = shard[key] = [0] * (len(self._families[name][2]) + 2)
+        counts[bisect.bisect_left(self._families[name][2], value)] += 1
+        counts[-1] += value
+
+    def collect(self) -> dict:
+        """Merged {(name, labels): value or histogram counts} across threads"""
+        with self._lock:
+            merged = dict(self._base)
+            shards = list(self._shards.values())
+        for shard in shards:
+            _merge_values(merged, shard)
+        return merged
+
+    @staticmethod
+    def _labels(labels, extra=()) -> str:
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ""
+        escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+        return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+    def render(self) -> str:
+        values = self.collect()
+        lines = []
+        for name, (kind, help_text, buckets) in self._families.items():
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {help_text}")
+            if kind == "gauge":
+                try:
+                    current = self._gauges[name]()
+                except Exception:
+                    continue
+                samples = current.items() if isinstance(current, dict) else [((), current)]
+                lines += [f"{name}{self._labels(labels)} {value}" for labels, value in samples]
+                continue
+            for (sample, labels), value in sorted(values.items(), key=lambda kv: kv[0][1]):
+                if sample != name:
+                    continue
+                if kind == "counter":
+                    lines.append(f"{name}_total{self._labels(labels)} {value}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(list(buckets) + ["+Inf"], value):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{self._labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_count{self._labels(labels)} {cumulative}")
+                lines.append(f"{name}_sum{self._labels(labels)} {value[-1]}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Atomically replace ``path`` with the current metrics"""
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(path + ".tmp", path)
+
+
+class MetricsFileWriter:
+    """Rewrites a metrics file every ``interval`` seconds until stopped"""
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 10.0):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.registry.write(self.path)
+            except OSError:
+                pass
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.registry.write(self.path)
+
+
+METRICS = MetricsRegistry()
+METRICS.counter("axora_files", "Files processed, by outcome")
+METRICS.counter("axora_moved_bytes", "Bytes of bills moved into the Utilities tree")
+METRICS.histogram("axora_stage_seconds", "Time per file in each organize stage")
+METRICS.counter("axora_io_throttled_seconds", "Time spent waiting for the I/O budget")
+METRICS.histogram("axora_mapping_load_seconds", "Time to parse one mapping source",
+                  buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+
+
+def record_outcome_metrics(outcome: "FileOutcome", size: int = 0):
+    METRICS.inc("axora_files", 1, (("outcome", outcome.status),))
+    if outcome.status == "moved" and size:
+        METRICS.inc("axora_moved_bytes", size)
+
+
+# ------------------------------ Run Reports ------------------------------
+
+class RunReportWriter:
+    """Streams one row per processed file to a CSV or JSONL report.
+
+    Rows are written as the run progresses and nothing is kept in memory, so a
+    report can cover any number of files. The format follows the extension:
+    ``.jsonl`` / ``.json`` write JSON lines, anything else writes CSV. With
+    ``flush`` each row reaches the file as soon as it is written, for a
+    reader following the report. With ``append`` rows are added to an
+    existing report instead of starting it over.
+    """
+
+    FIELDS = ("source", "target", "token", "provider", "corp", "date",
+              "status", "reason", "elapsed_ms", "sha256", "bytes")
+
+    def __init__(self, path: str, flush: bool = False, append: bool = False):
+        self.path = path
+        self.flush = flush
+        self.jsonl = os.path.splitext(path)[1].lower() in (".jsonl", ".json")
+        self.rows = 0
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, "a" if append else "w", encoding="utf-8", newline="")
+        if not self.jsonl:
+            self._csv = csv.writer(self._file)
+            if not self._file.tell():
+                self._csv.writerow(self.FIELDS)
+
+    def write(self, outcome: FileOutcome):
+        if self.jsonl:
+            self._file.write(json.dumps(outcome.as_dict(), ensure_ascii=False) + "\n")
+        else:
+            self._csv.writerow((outcome.source, outcome.target, outcome.token, outcome.provider,
+                                outcome.corp, outcome.date, outcome.status, outcome.reason,
+                                round(outcome.elapsed * 1000, 3), outcome.checksum, outcome.size))
+        self.rows += 1
+        if self.flush:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def default_report_path(extension: str = ".csv", label: str = "run") -> str:
+    """Timestamped report file under REPORTS_DIR"""
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(REPORTS_DIR, f"{label}_{stamp}{extension}")
+
+
+# ------------------------------ Sharded Runs ------------------------------
+
+SHARD_JOB_NAME = "job.json"
+SHARD_REPORT_NAME = "report.jsonl"
+SHARD_RESULT_NAME = "result.json"
+SHARD_CANCEL_NAME = "cancel"
+
+
+def shard_of(key: str, shards: int) -> int:
+    """Shard number for a key; stable across processes and machines, unlike hash()"""
+    return zlib.crc32(key.encode("utf-8")) % shards
+
+
+def plan_shards(organizer: BillOrganizer, pdf_files: list, shards: int) -> list[list]:
+    """Split (source_dir, file_name) pairs into ``shards`` lists by target account.
+
+    Every bill bound for one account folder lands in the same shard, so no two
+    shards ever touch the same account. Bills that match no account never
+    reach the tree and are spread by name.
+    """
+    planned = [[] for _ in range(shards)]
+    matches = organizer.match_batch([file_name for _, file_name in pdf_files])
+    for source_dir, file_name in pdf_files:
+        key = organizer.account_key(file_name, matches[file_name])
+        # Lowercased: folder names differing only in case are one folder on Windows
+        planned[shard_of((key or file_name).lower(), shards)].append((source_dir, file_name))
+    return planned
+
+
+def shard_job(excel_paths: list[str], rules_path: str = None, verify: bool = False,
+              use_leases: bool = True, io: dict = None) -> dict:
+    """Settings every shard of a run starts from; paths are made absolute for other processes.
+
+    ``io`` holds the I/O schedule arguments (see io_schedule_from_args); the
+    schedule file defaults to IO_SCHEDULE_FILE here, when it exists.
+    """
+    rules_path = rules_path or PROVIDER_RULES_FILE
+    io = dict({"io_config": None, "max_mb_per_s": 0.0, "max_ops_per_s": 0.0, "low_priority": False}, **(io or {}))
+    io_config = io["io_config"] or IO_SCHEDULE_FILE
+    io["io_config"] = os.path.abspath(io_config) if os.path.exists(io_config) else None
+    return {
+        "excel": [os.path.abspath(path) for path in excel_paths],
+        "rules": os.path.abspath(rules_path) if os.path.exists(rules_path) else None,
+        "verify": verify,
+        "use_leases": use_leases,
+        "io": io,
+    }
+
+
+def _write_json(path: str, data: dict):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)
+
+
+def _read_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_shard_jobs(run_dir: str, planned: list[list], job: dict) -> list[str]:
+    """One folder with a job file per non-empty shard; returns the folders"""
+    folders = []
+    for number, files in enumerate(planned):
+        if not files:
+            continue
+        folder = os.path.join(run_dir, f"shard-{number:03d}")
+        os.makedirs(folder)
+        _write_json(os.path.join(folder, SHARD_JOB_NAME), dict(job, shard=number, files=files))
+        folders.append(folder)
+    return folders
+
+
+def _resume_report(path: str) -> list[dict]:
+    """Rows an earlier, crashed run of a shard reported; drops a half-written last row"""
+    rows, end = _follow_report(path, 0)
+    try:
+        with open(path, "r+b") as f:
+            f.truncate(end)
+    except OSError:
+        pass
+    return rows
+
+
+def run_shard_job(folder: str, cancel_event=None, lost=None) -> dict:
+    """Organize the files of one shard folder, streaming its report; writes and returns its result.
+
+    A shard taken over from a crashed worker carries on after the files its
+    report already covers, appending to it, and those outcomes are counted
+    in the result. Once ``lost`` is set the shard belongs to another worker,
+    so no result is written.
+    """
+    job = _read_json(os.path.join(folder, SHARD_JOB_NAME))
+    result = {"shard": job["shard"], "host": socket.gethostname(), "pid": os.getpid()}
+    report_path = os.path.join(folder, SHARD_REPORT_NAME)
+    try:
+        fs = scheduled_filesystem(LocalFileSystem(), io_schedule_from_args(argparse.Namespace(**job["io"])))
+        organizer = BillOrganizer(fs=fs, rules=load_provider_rules(job["rules"]))
+        organizer.verify_moves = job["verify"]
+        organizer.use_leases = job["use_leases"]
+        index = MappingIndex(organizer.build_mapping_from_excel)
+        index.set_sources(job["excel"])
+        organizer.use_mapping(index)
+        earlier = _resume_report(report_path)
+        reported = {row.get("source") for row in earlier}
+        files = [tuple(pair) for pair in job["files"] if os.path.join(*pair) not in reported]
+        counts = {"moved": 0, "skipped": 0, "not_found": 0, "failed": 0, "retried": 0, "total": 0}
+        if files:
+            with RunReportWriter(report_path, flush=True, append=True) as report:
+                counts = organize_files(organizer, job["source"], job["dest"], report=report,
+                                        cancel_event=cancel_event, files=files)
+        for row in earlier:
+            status = row.get("status", "skipped")
+            counts[status] = counts.get(status, 0) + 1
+        counts["total"] += len(earlier)
+        result.update(counts)
+    except Exception as e:
+        result["error"] = str(e) or type(e).__name__
+    if lost is None or not lost.is_set():
+        _write_json(os.path.join(folder, SHARD_RESULT_NAME), result)
+    return result
+
+
+def _shard_folders(run_dir: str) -> list[str]:
+    try:
+        names = sorted(os.listdir(run_dir))
+    except OSError:
+        return []
+    return [os.path.join(run_dir, name) for name in names if name.startswith("shard-")]
+
+
+def shard_worker(run_dir: str) -> int:
+    """Claim and run the unfinished shards of a run until none are left; returns how many ran here.
+
+    A shard is claimed with a LeaseLock on its folder, renewed while it runs,
+    so any number of processes on any number of machines can work through
+    the same run. A claim left by a crashed worker expires and is taken over.
+    """
+    fs = LocalFileSystem()
+    cancel_path = os.path.join(run_dir, SHARD_CANCEL_NAME)
+    ran = 0
+    for folder in _shard_folders(run_dir):
+        if os.path.exists(cancel_path):
+            break
+        if os.path.exists(os.path.join(folder, SHARD_RESULT_NAME)):
+            continue
+        lease = LeaseLock(fs, folder, wait=0)
+        try:
+            lease.acquire()
+        except LeaseBusy:
+            continue  # Another process or machine is on it
+        cancel_event = threading.Event()
+        lost = threading.Event()
+        stop = threading.Event()
+
+        def heartbeat():
+            renewed = time.monotonic()
+            while not stop.wait(1.0):
+                if os.path.exists(cancel_path):
+                    cancel_event.set()
+                if time.monotonic() - renewed > lease.ttl / 3:
+                    try:
+                        lease.renew()
+                        renewed = time.monotonic()
+                    except LeaseLost:
+                        # Another worker took the shard over; stop and leave it to them
+                        lost.set()
+                        cancel_event.set()
+                        return
+                    except OSError:
+                        pass
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+        try:
+            # Finished by someone else between the check and the claim
+            if not os.path.exists(os.path.join(folder, SHARD_RESULT_NAME)):
+                run_shard_job(folder, cancel_event, lost)
+                ran += 1
+        finally:
+            stop.set()
+            thread.join()
+            lease.release()
+    return ran
+
+
+def _shard_claimable(folder: str) -> bool:
+    """No live claim on the shard: never claimed, released, or expired"""
+    holder = _lease_record(_read_json(os.path.join(folder, LEASE_FILE_NAME)))
+    if holder is None:
+        return not os.path.exists(os.path.join(folder, LEASE_FILE_NAME))
+    return time.time() > holder["expires"] + 5.0
+
+
+def _follow_report(path: str, offset: int) -> tuple[list[dict], int]:
+    """Complete rows appended to a JSONL report since ``offset``, and the new offset"""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < offset:
+                offset = 0  # The report was replaced; rows already passed on are skipped by the caller
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return [], offset
+    end = data.rfind(b"\n") + 1
+    rows = []
+    for line in data[:end].splitlines():
+        try:
+            rows.append(json.loads(line))
+        except ValueError:
+            continue  # blank, or torn by a worker that died mid-write
+    return rows, offset + end
+
+
+def run_sharded(organizer: BillOrganizer, source_path: str, dest_root: str, job: dict, shards: int,
+                processes: int = None, shard_dir: str = SHARDS_DIR, on_progress=None, on_result=None,
+                report=None, cancel_event=None, meter=None) -> dict:
+    """Organize source_path as ``shards`` jobs split by target account (see plan_shards).
+
+    The jobs are written under ``shard_dir`` and worked through by
+    ``processes`` local worker processes (default: one per shard, up to the
+    CPU count) plus any ``shard-worker`` started on other machines against the
+    same folder. ``job`` comes from shard_job(). Outcomes are followed from
+    the shard reports as they are written and passed on like organize_files
+    does; the shard results are merged into one set of totals, with the
+    per-shard totals under "shards". The job folder is removed once every
+    shard has finished cleanly.
+    """
+    pdf_files = list_source_pdfs(organizer.fs, source_path)
+    total = len(pdf_files)
+    if total == 0:
+        raise OrganizeError("No PDF files found in source.")
+    run_dir = os.path.join(os.path.abspath(shard_dir),
+                           f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.urandom(3).hex()}")
+    folders = write_shard_jobs(run_dir, plan_shards(organizer.for_run(), pdf_files, shards),
+                               dict(job, source=os.path.abspath(source_path), dest=os.path.abspath(dest_root)))
+    if processes is None:
+        processes = min(len(folders), os.cpu_count() or 1)
+    context = multiprocessing.get_context("spawn")  # no fork of Qt or running threads
+
+    def spawn():
+        process = context.Process(target=shard_worker, args=(run_dir,), daemon=True)
+        process.start()
+        return process
+
+    workers = [spawn() for _ in range(min(processes, len(folders)))]
+    respawns = len(folders)  # enough for a crash per shard; a worker that cannot start at all stops here
+    if meter is None:
+        meter = ThroughputMeter()
+    stamps = source_stamps(organizer.fs, {source_dir for source_dir, _ in pdf_files})
+    meter.start(total, sum(stamps[os.path.join(d, f)][0] for d, f in pdf_files if os.path.join(d, f) in stamps))
+    offsets = dict.fromkeys(folders, 0)
+    seen = set()  # sources already passed on; a taken-over shard may report a file again
+    pending = set(folders)
+    results = {}
+    done = 0
+    cancelled = False
+    while True:
+        if cancel_event is not None and cancel_event.is_set() and not cancelled:
+            cancelled = True
+            _write_json(os.path.join(run_dir, SHARD_CANCEL_NAME), {"cancelled": time.time()})
+        finished = {folder for folder in pending if os.path.exists(os.path.join(folder, SHARD_RESULT_NAME))}
+        for folder in folders:
+            rows, offsets[folder] = _follow_report(os.path.join(folder, SHARD_REPORT_NAME), offsets[folder])
+            for row in rows:
+                if row.get("source") in seen:
+                    continue
+                seen.add(row.get("source"))
+                outcome = FileOutcome.from_dict(row)
+                done += 1
+                meter.file_reported(outcome.size)
+                record_outcome_metrics(outcome, outcome.size)
+                if report is not None:
+                    report.write(outcome)
+                if on_progress:
+                    on_progress(min(done + 1, total), total, outcome.file_name)
+                if on_result:
+                    on_result(outcome)
+        for folder in finished:
+            results[folder] = _read_json(os.path.join(folder, SHARD_RESULT_NAME)) or {}
+        pending -= finished
+        if not pending:
+            break
+        if not any(worker.is_alive() for worker in workers):
+            claimable = [folder for folder in pending if _shard_claimable(folder)]
+            if cancelled or (claimable and processes and not respawns):
+                # Shards nobody started are not started now
+                for folder in claimable:
+                    results[folder] = {"shard": int(folder.rsplit("-", 1)[1])}
+                    if cancelled:
+                        results[folder]["cancelled"] = True
+                    else:
+                        results[folder]["error"] = "worker processes kept exiting before finishing it"
+                    _write_json(os.path.join(folder, SHARD_RESULT_NAME), results[folder])
+                pending.difference_update(claimable)
+                if not pending:
+                    break
+            elif claimable and processes:
+                # A worker died, or a claim from another machine expired
+                respawns -= 1
+                workers = [spawn()]
+        time.sleep(0.2)
+    for worker in workers:
+        worker.join()
+
+    counts = {"moved": 0, "skipped": 0, "not_found": 0, "failed": 0, "retried": 0, "total": total}
+    errors = []
+    per_shard = []
+    for folder in folders:
+        result = results[folder]
+        for key in ("moved", "skipped", "not_found", "failed", "retried"):
+            counts[key] += result.get(key, 0)
+        if result.get("cancelled"):
+            counts["cancelled"] = True
+        if result.get("error"):
+            errors.append(f"shard {result.get('shard')}: {result['error']}")
+        per_shard.append({key: result[key] for key in ("shard", "host", "pid", "total", "moved", "skipped",
+                                                        "not_found", "failed", "cancelled", "error") if key in result})
+    counts["metrics"] = meter.summary()
+    counts["shards"] = per_shard
+    if errors:
+        counts["errors"] = errors
+        counts["shard_dir"] = run_dir  # kept for a look at the failed shards
+    else:
+        shutil.rmtree(run_dir, ignore_errors=True)
+    return counts
+
+
+# ------------------------------ Profiling ------------------------------
+
+def profile_base(label: str, report_path: str = None) -> str:
+    """Path prefix for a run's profile files: next to its report, else under REPORTS_DIR"""
+    return os.path.splitext(report_path or default_report_path("", label))[0]
+
+
+class RunProfiler:
+    """Profiles the work done inside ``with`` on the calling thread.
+
+    CPU time is captured with cProfile and allocations with tracemalloc. On
+    exit it writes ``<base>.prof`` (open with pstats or snakeviz) and
+    ``<base>_profile.txt``, which holds the wall time, the peak traced memory,
+    the top ``top`` functions by cumulative and by own time, and the allocation
+    sites still holding the most memory. tracemalloc is process-wide, so it
+    stays on while any profiled run is active, and the peak can include runs
+    that overlap.
+    """
+
+    _tracing = 0
+    _tracing_lock = threading.Lock()
+    _owns_tracing = False
+
+    def __init__(self, base: str, top: int = 30):
+        self.profile_path = base + ".prof"
+        self.summary_path = base + "_profile.txt"
+        self.top = top
+        self.peak = 0
+        self._profile = cProfile.Profile()
+
+    def __enter__(self):
+        with RunProfiler._tracing_lock:
+            if RunProfiler._tracing == 0:
+                RunProfiler._owns_tracing = not tracemalloc.is_tracing()
+                if RunProfiler._owns_tracing:
+                    tracemalloc.start(10)
+            tracemalloc.reset_peak()
+            RunProfiler._tracing += 1
+        self._started = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profile.disable()
+        elapsed = time.perf_counter() - self._started
+        with RunProfiler._tracing_lock:
+            self.peak = tracemalloc.get_traced_memory()[1]
+            allocations = tracemalloc.take_snapshot().statistics("lineno")[:self.top]
+            RunProfiler._tracing -= 1
+            if RunProfiler._tracing == 0 and RunProfiler._owns_tracing:
+                tracemalloc.stop()
+        try:
+            self._write(elapsed, allocations, exc)
+        except OSError:
+            pass
+        return False
+
+    def _write(self, elapsed, allocations, exc):
+        folder = os.path.dirname(self.profile_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._profile.dump_stats(self.profile_path)
+        out = io.StringIO()
+        out.write(f"Wall time: {elapsed:.3f}s\n")
+        out.write(f"Peak traced memory: {self.peak / 1e6:.1f} MB\n")
+        if exc is not None:
+            out.write(f"Ended with: {exc!r}\n")
+        stats = pstats.Stats(self._profile, stream=out)
+        for order in ("cumulative", "tottime"):
+            out.write(f"\n---------- Top {self.top} by {order} time ----------\n")
+            stats.sort_stats(order).print_stats(self.top)
+        out.write(f"\n---------- Top {self.top} allocation sites still live at the end ----------\n")
+        for stat in allocations:
+            out.write(f"{stat.size / 1e3:10.1f} KB  {stat.count:8d} blocks  {stat.traceback}\n")
+        with open(self.summary_path, "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+
+
+# ------------------------------ Search ------------------------------
+
+_SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class SearchIndex:
+    """Token -> row ids index for filtering result and history rows as you type.
+
+    Rows are added with named text fields and a date. Every lowercase
+    alphanumeric token is indexed both bare and as ``field:token``, so
+    ``bell 1234`` matches any field while ``corp:1001 status:skip`` matches
+    only those fields. A row matches when each query term is a prefix of one
+    of its tokens. Prefixes are found with bisect over the sorted token list,
+    so a query costs the size of its matches, not of the index. Dates are
+    "YYYY-MM-DD" strings compared by range.
+    """
+
+    def __init__(self):
+        self._postings = {}  # token -> set of row ids
+        self._row_tokens = []  # row id -> frozenset of tokens
+        self._dates = []  # row id -> date
+        self._sorted = []  # tokens in order, rebuilt after adds
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._row_tokens)
+
+    @staticmethod
+    def terms(query: str) -> list[str]:
+        terms = []
+        for word in query.lower().split():
+            field, _, value = word.rpartition(":")
+            tokens = _SEARCH_TOKEN_RE.findall(value)
+            terms += [f"{field}:{t}" if field else t for t in tokens]
+        return terms
+
+    def add(self, fields: dict, date: str = "") -> int:
+        """Index one row; returns its id"""
+        row = len(self._row_tokens)
+        tokens = set()
+        for field, text in fields.items():
+            for token in _SEARCH_TOKEN_RE.findall(str(text or "").lower()):
+                tokens.add(token)
+                tokens.add(f"{field}:{token}")
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                self._postings[token] = {row}
+                self._dirty = True
+            else:
+                ids.add(row)
+        self._row_tokens.append(frozenset(tokens))
+        self._dates.append(date or "")
+        return row
+
+    def _prefix(self, term: str) -> set:
+        if self._dirty:
+            self._sorted = sorted(self._postings)
+            self._dirty = False
+        found = set()
+        i = bisect.bisect_left(self._sorted, term)
+        while i < len(self._sorted) and self._sorted[i].startswith(term):
+            found |= self._postings[self._sorted[i]]
+            i += 1
+        return found
+
+    def search(self, query: str = "", date_from: str = "", date_to: str = ""):
+        """Matching row ids, or None when nothing filters (every row matches)"""
+        terms = self.terms(query)
+        if not terms and not date_from and not date_to:
+            return None
+        if terms:
+            matches = None
+            for term in sorted(terms, key=len, reverse=True):  # longer terms match fewer rows
+                ids = self._prefix(term)
+                matches = ids if matches is None else matches & ids
+                if not matches:
+                    return set()
+        else:
+            matches = range(len(self._row_tokens))
+        if date_from or date_to:
+            return {row for row in matches if self._in_range(self._dates[row], date_from, date_to)}
+        return matches if isinstance(matches, set) else set(matches)
+
+    @staticmethod
+    def _in_range(date: str, date_from: str, date_to: str) -> bool:
+        # A partial bound such as "2024-09" covers the whole month
+        if not date:
+            return False
+        if date_from and date < date_from:
+            return False
+        return not date_to or date[:len(date_to)] <= date_to
+
+    def matches(self, row: int, query: str = "", date_from: str = "", date_to: str = "") -> bool:
+        """Whether one row passes the filter, without a full search"""
+        tokens = self._row_tokens[row]
+        for term in self.terms(query):
+            if term not in tokens and not any(token.startswith(term) for token in tokens):
+                return False
+        return not (date_from or date_to) or self._in_range(self._dates[row], date_from, date_to)
+
+
+def outcome_search_fields(outcome: FileOutcome) -> dict:
+    return {
+        "file": f"{outcome.file_name} {os.path.basename(outcome.target or '')}",
+        "corp": outcome.corp,
+        "account": outcome.token,
+        "provider": f"{outcome.provider} {outcome.provider_folder}",
+        "status": outcome.status,
+        "reason": outcome.reason,
+    }
+
+
+def history_summary(entry: dict) -> str:
+    return (f"{entry['timestamp']}  |  Total: {entry['total']}  |  "
+            f"✓ {entry['successful']}  |  ✗ {entry['failed']}")
+
+
+def history_search_fields(entry: dict) -> dict:
+    return {
+        "source": entry.get("source", ""),
+        "dest": entry.get("destination", ""),
+        "status": entry.get("status", ""),
+        "job": entry.get("job", ""),
+        "report": os.path.basename(entry.get("report", "")),
+    }
+
+
+# ------------------------------ Job Queue ------------------------------
+
+class OrganizeJob:
+    """One queued organize run"""
+
+    def __init__(self, job_id: int, source_path: str, dest_root: str, priority: int = 0,
+                 report_path: str = None):
+        self.id = job_id
+        self.source_path = source_path
+        self.dest_root = dest_root
+        self.priority = priority
+        self.report_path = report_path
+        self.status = "queued"  # queued, running, done, failed, cancelled
+        self.done = 0
+        self.total = 0
+        self.results = None
+        self.error = ""
+        self.meter = ThroughputMeter()
+        self.cancel_event = threading.Event()
+        self.finished_event = threading.Event()
+
+    @property
+    def root_key(self) -> str:
+        return os.path.normcase(os.path.abspath(self.dest_root)).rstrip(os.sep) + os.sep
+
+    def describe(self) -> str:
+        progress = f" {int(self.done / self.total * 100)}%" if self.status == "running" and self.total else ""
+        return (f"#{self.id}  [{self.status}{progress}]  P{self.priority}  "
+                f"{os.path.basename(self.source_path) or self.source_path} → "
+                f"{os.path.basename(self.dest_root) or self.dest_root}")
+
+
+class JobQueue:
+    """Orders organize jobs and decides which may run now.
+
+    Queued jobs are kept in run order; a job is placed ahead of every queued
+    job with a lower priority and can be moved by hand afterwards. Jobs whose
+    destination roots are disjoint run concurrently (up to ``max_running``);
+    jobs on the same root, or on nested roots, run one after another in queue
+    order so two runs never reorganize the same account folders at once.
+    """
+
+    def __init__(self, max_running: int = 4, keep_finished: int = None):
+        self.max_running = max_running
+        self.keep_finished = keep_finished  # finished jobs remembered; None keeps all
+        self.queued = []
+        self.running = []
+        self.finished = []
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def add(self, source_path: str, dest_root: str, priority: int = 0, report_path: str = None) -> OrganizeJob:
+        with self._lock:
+            job = OrganizeJob(self._next_id, source_path, dest_root, priority, report_path)
+            self._next_id += 1
+            self._insert(job)
+            return job
+
+    def _insert(self, job: OrganizeJob):
+        pos = next((i for i, queued in enumerate(self.queued) if queued.priority < job.priority),
+                   len(self.queued))
+        self.queued.insert(pos, job)
+
+    def get(self, job_id: int):
+        with self._lock:
+            return next((j for j in self.queued + self.running + self.finished if j.id == job_id), None)
+
+    def set_priority(self, job_id: int, priority: int) -> bool:
+        with self._lock:
+            for job in self.queued:
+                if job.id == job_id:
+                    self.queued.remove(job)
+                    job.priority = priority
+                    self._insert(job)
+                    return True
+            return False
+
+    def move(self, job_id: int, offset: int) -> bool:
+        """Move a queued job ``offset`` places (negative is earlier)"""
+        with self._lock:
+            for i, job in enumerate(self.queued):
+                if job.id == job_id:
+                    pos = max(0, min(len(self.queued) - 1, i + offset))
+                    self.queued.insert(pos, self.queued.pop(i))
+                    return pos != i
+            return False
+
+    def cancel(self, job_id: int) -> bool:
+        """Drop a queued job, or ask a running one to stop after its current file"""
+        with self._lock:
+            for job in self.queued:
+                if job.id == job_id:
+                    self.queued.remove(job)
+                    job.status = "cancelled"
+                    self._finish(job)
+                    return True
+            for job in self.running:
+                if job.id == job_id:
+                    job.cancel_event.set()
+                    return True
+            return False
+
+    @staticmethod
+    def _overlaps(a: str, b: str) -> bool:
+        return a.startswith(b) or b.startswith(a)
+
+    def take_runnable(self) -> list[OrganizeJob]:
+        """Mark and return the queued jobs that can start now"""
+        with self._lock:
+            started = []
+            claimed = [job.root_key for job in self.running]
+            for job in list(self.queued):
+                if len(self.running) >= self.max_running:
+                    break
+                key = job.root_key
+                blocked = any(self._overlaps(key, other) for other in claimed)
+                # An earlier job waiting on this root keeps its place in line
+                claimed.append(key)
+                if blocked:
+                    continue
+                self.queued.remove(job)
+                job.status = "running"
+                self.running.append(job)
+                started.append(job)
+            return started
+
+    def complete(self, job: OrganizeJob, results: dict = None, error: str = ""):
+        with self._lock:
+            if job not in self.running:
+                return
+            self.running.remove(job)
+            job.results = results
+            job.error = error
+            if error:
+                job.status = "failed"
+            elif job.cancel_event.is_set() or (results or {}).get("cancelled"):
+                job.status = "cancelled"
+            else:
+                job.status = "done"
+            self._finish(job)
+
+    def _finish(self, job: OrganizeJob):
+        self.finished.append(job)
+        if self.keep_finished is not None and len(self.finished) > self.keep_finished:
+            del self.finished[:-self.keep_finished]
+        job.finished_event.set()
+
+    def jobs(self) -> list[OrganizeJob]:
+        """Running jobs, then queued in run order, then finished (newest first)"""
+        with self._lock:
+            return self.running + self.queued + self.finished[::-1]
+
+    def is_idle(self) -> bool:
+        with self._lock:
+            return not self.running and not self.queued
+
+
+# ------------------------------ Service ------------------------------
+
+class OrganizerService:
+    """Long-lived organizer behind the local JSON API.
+
+    The mapping workbooks are parsed once and kept current with incremental
+    reloads, and a DestinationIndex remembers prepared account folders, so a
+    single-file submission only parses the name, looks it up and moves it.
+    Organize jobs go through a JobQueue and run on a thread pool.
+    """
+
+    KEEP_JOB_OUTCOMES = 50
+    KEEP_FINISHED_JOBS = 1000
+
+    def __init__(self, excel_paths: list[str], dest_root: str, rules: ProviderRules = None,
+                 workers: int = 4, fs: FileSystem = None, use_leases: bool = True):
+        self.dest_root = dest_root
+        self.organizer = BillOrganizer(fs=fs, rules=rules, dest_index=DestinationIndex())
+        self.organizer.use_leases = use_leases
+        self.mapping_index = MappingIndex(self.organizer.build_mapping_from_excel)
+        self.mapping_index.set_sources(excel_paths)
+        self.organizer.use_mapping(self.mapping_index)
+        self.jobs = JobQueue(max_running=workers, keep_finished=self.KEEP_FINISHED_JOBS)
+        METRICS.gauge("axora_mapping_entries", "Entries in the loaded account mapping",
+                      lambda: len(self.organizer.mapping))
+        METRICS.gauge("axora_queue_jobs", "Organize jobs waiting or running",
+                      lambda: {(("state", "queued"),): len(self.jobs.queued),
+                               (("state", "running"),): len(self.jobs.running)})
+        self.job_outcomes = {}  # job id -> [FileOutcome]
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="axora-job")
+        self._schedule_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = threading.Thread(target=self._watch_mappings, daemon=True)
+        self._watcher.start()
+
+    def _watch_mappings(self):
+        while not self._stop.wait(MAPPING_WATCH_INTERVAL_MS / 1000.0):
+            try:
+                self.mapping_index.refresh()
+            except Exception:
+                pass
+
+    def close(self):
+        self._stop.set()
+        for job in self.jobs.jobs():
+            self.jobs.cancel(job.id)
+        self._pool.shutdown(wait=True)
+
+    # ---------- Requests ----------
+
+    def health(self) -> dict:
+        return {
+            "status": "ok",
+            "mapping_entries": len(self.organizer.mapping),
+            "sources": list(self.mapping_index.sources),
+            "mapping_errors": dict(self.mapping_index.errors),
+            "prepared_folders": len(self.organizer.dest_index),
+            "dest": self.dest_root,
+        }
+
+    def submit_file(self, path: str, dest_root: str = None) -> dict:
+        """Organize one PDF right away and return its outcome"""
+        if not path.lower().endswith(".pdf"):
+            raise ValueError("Only PDF files can be organized")
+        if not self.organizer.fs.isfile(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        started = time.perf_counter()
+        source_dir, file_name = os.path.split(path)
+        try:
+            outcome = self.organizer.process_single_file(source_dir or ".", dest_root or self.dest_root, file_name)
+        except Exception as ex:
+            outcome = FileOutcome(path, "skipped", str(ex))
+        outcome.elapsed = time.perf_counter() - started
+        record_outcome_metrics(outcome, outcome.size)
+        return outcome.as_dict()
+
+    def submit_job(self, source_path: str, dest_root: str = None, priority: int = 0,
+                   report_path: str = None) -> OrganizeJob:
+        job = self.jobs.add(source_path, dest_root or self.dest_root, priority, report_path)
+        self._schedule()
+        return job
+
+    def job_status(self, job: OrganizeJob, with_outcomes: bool = False) -> dict:
+        status = {
+            "job": job.id,
+            "status": job.status,
+            "source": job.source_path,
+            "dest": job.dest_root,
+            "priority": job.priority,
+            "done": job.done,
+            "total": job.total,
+            "results": job.results,
+            "error": job.error,
+        }
+        if job.status == "running":
+            status["metrics"] = job.meter.snapshot()
+        if with_outcomes:
+            status["outcomes"] = [o.as_dict() for o in self.job_outcomes.get(job.id, ())]
+        return status
+
+    # ---------- Scheduling ----------
+
+    def _schedule(self):
+        with self._schedule_lock:
+            for job in self.jobs.take_runnable():
+                self._pool.submit(self._run_job, job)
+
+    def _run_job(self, job: OrganizeJob):
+        # Another job finishing may schedule this one before submit_job returns
+        outcomes = self.job_outcomes.setdefault(job.id, [])
+
+        def on_progress(idx, total, file_name):
+            job.done, job.total = idx - 1, total
+
+        report = None
+        try:
+            if job.report_path:
+                report = RunReportWriter(job.report_path)
+            results = organize_files(self.organizer, job.source_path, job.dest_root,
+                                     on_progress=on_progress, on_result=outcomes.append,
+                                     report=report, cancel_event=job.cancel_event, meter=job.meter)
+            if not results.get("cancelled"):
+                job.done = results["total"]
+            if report is not None:
+                report.close()
+                results["report"] = job.report_path
+            self.jobs.complete(job, results)
+        except Exception as e:
+            self.jobs.complete(job, error=str(e))
+        finally:
+            if report is not None:
+                report.close()
+        # Only the most recent jobs keep their per-file outcomes
+        jobs = self.jobs.jobs()  # finished ones newest first
+        finished = [j.id for j in jobs if j.status not in ("queued", "running")]
+        keep = {j.id for j in jobs if j.status == "running"}
+        keep.update(finished[:self.KEEP_JOB_OUTCOMES])
+        for job_id in list(self.job_outcomes):
+            if job_id not in keep:
+                self.job_outcomes.pop(job_id, None)
+        self._schedule()
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """JSON endpoints of OrganizerService (see README "Service Mode")"""
+
+    server_version = "Axora"
+
+    @property
+    def service(self) -> OrganizerService:
+        return self.server.service
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload, content_type: str = "application/json"):
+        body = payload.encode("utf-8") if isinstance(payload, str) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    def _refusal(self, method: str) -> str:
+        """Why a request must be refused, or "" for one from a local API client.
+
+        Web pages can send simple cross-origin POSTs and, after DNS rebinding,
+        reach localhost under their own host name. Requiring our own Host and
+        a JSON body on POST keeps both out; browsers can't send the latter
+        cross-origin without a preflight, which this server never answers.
+        """
+        port = self.server.server_address[1]
+        host = (self.headers.get("Host") or "").lower()
+        if host not in (f"127.0.0.1:{port}", f"localhost:{port}"):
+            return f"Host must be 127.0.0.1:{port} or localhost:{port}"
+        if method == "POST":
+            content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+            if content_type != "application/json":
+                return "Content-Type must be application/json"
+        return ""
+
+    def _job(self, path: str):
+        try:
+            return self.service.jobs.get(int(path.rsplit("/", 1)[1]))
+        except ValueError:
+            return None
+
+    def _handle(self, method: str):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        refusal = self._refusal(method)
+        if refusal:
+            return self._send(403, {"error": refusal})
+        try:
+            if method == "GET" and path == "/health":
+                return self._send(200, self.service.health())
+            if method == "GET" and path == "/metrics":
+                return self._send(200, METRICS.render(),
+                                  "application/openmetrics-text; version=1.0.0; charset=utf-8")
+            if method == "POST" and path == "/files":
+                body = self._body()
+                if not body.get("path"):
+                    return self._send(400, {"error": "'path' is required"})
+                return self._send(200, self.service.submit_file(body["path"], body.get("dest")))
+            if method == "POST" and path == "/jobs":
+                body = self._body()
+                if not body.get("source"):
+                    return self._send(400, {"error": "'source' is required"})
+                job = self.service.submit_job(body["source"], body.get("dest"),
+                                              int(body.get("priority", 0)), body.get("report"))
+                if body.get("wait"):
+                    job.finished_event.wait()
+                    return self._send(200, self.service.job_status(job, with_outcomes=True))
+                return self._send(202, self.service.job_status(job))
+            if method == "GET" and path == "/jobs":
+                return self._send(200, [self.service.job_status(j) for j in self.service.jobs.jobs()])
+            if path.startswith("/jobs/"):
+                job = self._job(path)
+                if job is None:
+                    return self._send(404, {"error": "No such job"})
+                if method == "GET":
+                    return self._send(200, self.service.job_status(
+                        job, with_outcomes=job.status not in ("queued", "running")))
+                if method == "DELETE":
+                    self.service.jobs.cancel(job.id)
+                    return self._send(200, self.service.job_status(job))
+            if method == "POST" and path == "/mapping/reload":
+                changes = self.service.mapping_index.refresh()
+                return self._send(200, {"reloaded": [
+                    {"path": p, "added": a, "removed": r, "changed": c} for p, a, r, c in changes
+                ], "mapping_entries": len(self.service.organizer.mapping)})
+            return self._send(404, {"error": f"Unknown endpoint: {method} {path}"})
+        except FileNotFoundError as e:
+            return self._send(404, {"error": str(e)})
+        except (ValueError, KeyError) as e:
+            return self._send(400, {"error": str(e)})
+        except Exception as e:
+            return self._send(500, {"error": str(e)})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def run_service(service: OrganizerService, port: int = SERVICE_PORT) -> ThreadingHTTPServer:
+    """Create the HTTP server for ``service`` on localhost (call serve_forever on it)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _ServiceHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
 
 
 # ------------------------------ Worker Thread ------------------------------
@@ -51,94 +4707,143 @@ class FileOrganizerWorker(QThread):
     """Worker thread for file organization"""
     progress_updated = pyqtSignal(str)
     progress_percent = pyqtSignal(int)
+    progress_count = pyqtSignal(int, int)  # files started, total
     finished = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     # Categorized result signals
-    file_completed = pyqtSignal(str, str, dict)  # filename, hierarchy_path, file_data
-    file_skipped = pyqtSignal(str, str)  # filename, reason
-    file_not_found = pyqtSignal(str)  # filename
+    file_completed = pyqtSignal(object)  # FileOutcome
+    file_skipped = pyqtSignal(object)  # FileOutcome
+    file_not_found = pyqtSignal(object)  # FileOutcome
 
-    def __init__(self, organizer, source_path, dest_root):
+    def __init__(self, organizer, source_path, dest_root, report_path=None, cancel_event=None,
+                 manifest=None, meter=None, profile_base=None, shards=1, shard_job=None):
         super().__init__()
         self.organizer = organizer
         self.source_path = source_path
         self.dest_root = dest_root
+        self.report_path = report_path
+        self.cancel_event = cancel_event
+        self.manifest = manifest
+        self.meter = meter if meter is not None else ThroughputMeter()
+        self.profile_base = profile_base
+        self.shards = shards
+        self.shard_job = shard_job
 
     def run(self):
+        if self.profile_base:
+            # cProfile only sees the thread that enables it, so profile here
+            with RunProfiler(self.profile_base):
+                self._run()
+        else:
+            self._run()
+
+    def _run(self):
+        report = None
         try:
             self.progress_updated.emit("Initializing...")
-            
-            # Validate source path exists
-            if not os.path.exists(self.source_path):
-                self.error_occurred.emit(f"Source path does not exist: {self.source_path}")
-                return
-            
-            # Handle source as file or folder
-            pdf_files = []
-            try:
-                if os.path.isfile(self.source_path):
-                    if self.source_path.lower().endswith('.pdf'):
-                        pdf_files = [(os.path.dirname(self.source_path) or ".", os.path.basename(self.source_path))]
-                elif os.path.isdir(self.source_path):
-                    files = [f for f in os.listdir(self.source_path) if os.path.isfile(os.path.join(self.source_path, f))]
-                    pdf_files = [(self.source_path, f) for f in files if f.lower().endswith('.pdf')]
-            except Exception as e:
-                self.error_occurred.emit(f"Error reading source path: {str(e)}")
-                return
-            
-            total = len(pdf_files)
-            if total == 0:
-                self.error_occurred.emit("No PDF files found in source.")
-                return
-            
-            moved = 0
-            skipped = 0
-            not_found = 0
-            
-            for idx, (source_dir, file_name) in enumerate(pdf_files, start=1):
-                percent = int((idx - 1) / total * 100)
-                self.progress_percent.emit(percent)
-                self.progress_updated.emit(f"Processing file {idx} of {total}: {file_name}")
-                
-                try:
-                    result, message = self.organizer.process_single_file(source_dir, self.dest_root, file_name)
-                    if result:
-                        moved += 1
-                        # message contains the hierarchy path
-                        self.progress_updated.emit(f"Processing file {idx} of {total}: {file_name}")
-                        # Extract file data for Excel update
-                        try:
-                            file_data = self.organizer.get_file_data_for_excel(file_name, message)
-                        except Exception as ex:
-                            # If extraction fails, use empty dict
-                            file_data = {}
-                        self.file_completed.emit(file_name, message, file_data)
-                    elif message == "not_found":
-                        not_found += 1
-                        self.progress_updated.emit(f"Processing file {idx} of {total}: {file_name}")
-                        self.file_not_found.emit(file_name)
-                    else:
-                        skipped += 1
-                        self.progress_updated.emit(f"Processing file {idx} of {total}: {file_name}")
-                        reason = "Target already exists" if message == "skipped" else str(message)
-                        self.file_skipped.emit(file_name, reason)
-                except Exception as ex:
-                    skipped += 1
-                    self.progress_updated.emit(f"Processing file {idx} of {total}: {file_name}")
-                    self.file_skipped.emit(file_name, str(ex))
-            
+            if self.report_path:
+                report = RunReportWriter(self.report_path)
+            if self.shards > 1:
+                results = run_sharded(self.organizer, self.source_path, self.dest_root, self.shard_job,
+                                      self.shards, on_progress=self._on_progress, on_result=self._on_result,
+                                      report=report, cancel_event=self.cancel_event, meter=self.meter)
+            else:
+                results = organize_files(self.organizer, self.source_path, self.dest_root,
+                                         on_progress=self._on_progress, on_result=self._on_result,
+                                         report=report, cancel_event=self.cancel_event,
+                                         manifest=self.manifest, meter=self.meter)
+            if report is not None:
+                report.close()
+                results["report"] = self.report_path
+            if self.profile_base:
+                results["profile"] = self.profile_base + "_profile.txt"
             self.progress_percent.emit(100)
-            self.finished.emit({
-                "moved": moved,
-                "skipped": skipped,
-                "not_found": not_found,
-                "total": total
-            })
-            
+            self.finished.emit(results)
+
+        except OrganizeError as e:
+            self.error_occurred.emit(str(e))
         except Exception as e:
             import traceback
             error_details = f"{str(e)}\n\n{traceback.format_exc()}"
             self.error_occurred.emit(error_details)
+        finally:
+            if report is not None:
+                report.close()
+            if self.manifest is not None and self.shards <= 1:
+                try:
+                    self.manifest.save()
+                except OSError:
+                    pass
+
+    def _on_progress(self, idx, total, file_name):
+        self.progress_percent.emit(int((idx - 1) / total * 100))
+        self.progress_count.emit(idx - 1, total)
+        self.progress_updated.emit(f"Processing file {idx} of {total}: {file_name}")
+
+    def _on_result(self, outcome):
+        if outcome.status == "moved":
+            self.file_completed.emit(outcome)
+        elif outcome.status == "not_found":
+            self.file_not_found.emit(outcome)
+        else:
+            self.file_skipped.emit(outcome)
+
+
+class CoverageWorker(QThread):
+    """Scans the destination tree for the Coverage tab"""
+    finished = pyqtSignal(object)  # CoverageMatrix
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, scanner, dest_root):
+        super().__init__()
+        self.scanner = scanner
+        self.dest_root = dest_root
+
+    def run(self):
+        try:
+            self.finished.emit(self.scanner.scan(self.dest_root))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class MappingLoadWorker(QThread):
+    """Loads mapping files into the app's MappingIndex off the GUI thread.
+
+    With ``file_paths`` it sets the index's sources. Without, it re-parses
+    the sources edited since they were loaded and emits them with
+    ``finished`` for MappingIndex.apply_reloads() on the GUI thread.
+    """
+    progress = pyqtSignal(str, int, int)  # path, rows read, rows expected
+    finished = pyqtSignal(object)  # reparsed sources when refreshing, else None
+    cancelled = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, mapping_index, file_paths=None, profile_base=None):
+        super().__init__()
+        self.mapping_index = mapping_index
+        self.file_paths = file_paths
+        self.profile_base = profile_base
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            if self.profile_base:
+                with RunProfiler(self.profile_base):
+                    result = self._load()
+            else:
+                result = self._load()
+            self.finished.emit(result)
+        except MappingLoadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def _load(self):
+        if self.file_paths is None:
+            return self.mapping_index.reparse(on_progress=self.progress.emit, cancel_event=self.cancel_event)
+        self.mapping_index.set_sources(self.file_paths, on_progress=self.progress.emit,
+                                       cancel_event=self.cancel_event)
+        return None
 
 
 # ------------------------------ Main App ------------------------------
@@ -148,15 +4853,39 @@ class AxoraApp(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self.mapping = {}
-        self.worker_thread = None
+        self.organizer = BillOrganizer(fs=self.load_io_filesystem(), rules=self.load_provider_rules())
+        self.mapping_index = MappingIndex(self.organizer.build_mapping_from_excel)
+        self.organizer.use_mapping(self.mapping_index)  # updated in place on reload
+        self.job_queue = JobQueue()
+        self.job_workers = {}  # job id -> FileOrganizerWorker
         self.is_dark = True
         self.history_items = []
-        self.completed_files_data = []  # Store completed file info for Excel update
+        self.completed_outcomes = []  # FileOutcome of each moved file, for the Excel update
+        self.result_index = SearchIndex()
+        self.result_items = []  # row id in result_index -> QListWidgetItem
+        self.hidden_results = set()  # row ids currently filtered out
+        self.history_index = None  # built over history_items on the first History search
+        self.history_rows = []  # row id in history_index -> history entry
+        self.coverage_scanner = CoverageScanner(cache_path=COVERAGE_CACHE_FILE)
+        self.source_manifest = SourceManifest(SOURCE_MANIFEST_FILE)
+        self.coverage_matrix = None
+        self.coverage_worker = None
+        self.mapping_loader = None  # MappingLoadWorker of the load in progress
+        self.mapping_refresher = None  # MappingLoadWorker re-parsing edited mapping files
+        self.stale_mapping_loaders = []  # ended or superseded loads, kept until their threads exit
 
         self.setup_ui()
         self.apply_dark_style()
         self.load_history()
+        # Start reading last session's mapping now, so it is ready before the first Execute
+        self.restore_settings()
+
+        # Pick up edits to the mapping workbooks while the app is open
+        self.reported_mapping_errors = {}
+        self.mapping_watch_timer = QTimer(self)
+        self.mapping_watch_timer.setInterval(MAPPING_WATCH_INTERVAL_MS)
+        self.mapping_watch_timer.timeout.connect(self.reload_changed_mappings)
+        self.mapping_watch_timer.start()
 
     # ---------- UI Structure ----------
 
@@ -206,14 +4935,32 @@ class AxoraApp(QMainWindow):
         excel_layout.setContentsMargins(15, 15, 15, 15)
 
         self.excel_path_edit = QLineEdit()
-        self.excel_path_edit.setPlaceholderText("Select Excel file...")
+        self.excel_path_edit.setPlaceholderText("Select Excel file(s)...")
         self.excel_browse_btn = QPushButton("Browse")
         self.excel_browse_btn.clicked.connect(self.browse_excel_file)
+        self.excel_add_btn = QPushButton("Add")
+        self.excel_add_btn.setToolTip("Add another mapping workbook (lower precedence)")
+        self.excel_add_btn.clicked.connect(self.add_excel_file)
 
         excel_input_layout = QHBoxLayout()
         excel_input_layout.addWidget(self.excel_path_edit, 1)
         excel_input_layout.addWidget(self.excel_browse_btn, 0)
+        excel_input_layout.addWidget(self.excel_add_btn, 0)
         excel_layout.addLayout(excel_input_layout)
+
+        self.mapping_progress = QProgressBar()
+        self.mapping_progress.setFixedHeight(18)
+        self.mapping_progress.setRange(0, 100)
+        self.mapping_progress.setFormat("Loading %p%")
+        self.mapping_cancel_btn = QPushButton("Cancel")
+        self.mapping_cancel_btn.setToolTip("Stop loading the mapping")
+        self.mapping_cancel_btn.clicked.connect(self.cancel_mapping_load)
+        mapping_progress_layout = QHBoxLayout()
+        mapping_progress_layout.addWidget(self.mapping_progress, 1)
+        mapping_progress_layout.addWidget(self.mapping_cancel_btn, 0)
+        excel_layout.addLayout(mapping_progress_layout)
+        self.mapping_progress.hide()
+        self.mapping_cancel_btn.hide()
         layout.addWidget(excel_group)
 
         # Source folder
@@ -299,6 +5046,33 @@ class AxoraApp(QMainWindow):
         button_progress_layout.addWidget(self.progress_bar, 1)
 
         action_layout.addLayout(button_progress_layout)
+
+        self.report_checkbox = QCheckBox(f"Save a per-file run report (CSV in {REPORTS_DIR}/)")
+        action_layout.addWidget(self.report_checkbox)
+
+        self.manifest_checkbox = QCheckBox("Skip files left unchanged since the last run")
+        self.manifest_checkbox.setChecked(True)
+        action_layout.addWidget(self.manifest_checkbox)
+
+        self.verify_checkbox = QCheckBox("Verify each move with a checksum")
+        action_layout.addWidget(self.verify_checkbox)
+
+        self.lease_checkbox = QCheckBox("Lock account folders while moving (Utilities shared with other workstations)")
+        self.lease_checkbox.setChecked(True)
+        action_layout.addWidget(self.lease_checkbox)
+
+        self.profile_checkbox = QCheckBox(f"Profile runs and Excel loads (CPU and memory, in {REPORTS_DIR}/)")
+        action_layout.addWidget(self.profile_checkbox)
+
+        shards_layout = QHBoxLayout()
+        shards_layout.addWidget(QLabel("Processes:"))
+        self.shards_spin = QSpinBox()
+        self.shards_spin.setRange(1, 64)
+        self.shards_spin.setValue(1)
+        self.shards_spin.setToolTip("Split each run by account over this many processes (1 runs in the app)")
+        shards_layout.addWidget(self.shards_spin)
+        shards_layout.addStretch()
+        action_layout.addLayout(shards_layout)
         layout.addWidget(action_group)
 
         return panel
@@ -325,6 +5099,29 @@ class AxoraApp(QMainWindow):
         results_header.setFont(header_font)
         results_layout.addWidget(results_header)
 
+        # Search box; typing is debounced so large result sets filter once per pause
+        self.results_filter_timer = QTimer(self)
+        self.results_filter_timer.setSingleShot(True)
+        self.results_filter_timer.setInterval(150)
+        self.results_filter_timer.timeout.connect(self.apply_results_filter)
+        results_search_row = QHBoxLayout()
+        self.results_search = QLineEdit()
+        self.results_search.setPlaceholderText("Search file, corp, account, provider, status (e.g. corp:1001 status:skipped)")
+        self.results_date_from = QLineEdit()
+        self.results_date_from.setPlaceholderText("From YYYY-MM-DD")
+        self.results_date_to = QLineEdit()
+        self.results_date_to.setPlaceholderText("To YYYY-MM-DD")
+        for date_edit in (self.results_date_from, self.results_date_to):
+            date_edit.setMaximumWidth(130)
+        self.results_match_label = QLabel("")
+        for edit in (self.results_search, self.results_date_from, self.results_date_to):
+            edit.textChanged.connect(self.results_filter_timer.start)
+        results_search_row.addWidget(self.results_search, 1)
+        results_search_row.addWidget(self.results_date_from)
+        results_search_row.addWidget(self.results_date_to)
+        results_search_row.addWidget(self.results_match_label)
+        results_layout.addLayout(results_search_row)
+
         # Scroll area for results sections
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -378,11 +5175,87 @@ class AxoraApp(QMainWindow):
         history_header.setFont(header_font)
         history_layout.addWidget(history_header)
 
+        history_search_row = QHBoxLayout()
+        self.history_search = QLineEdit()
+        self.history_search.setPlaceholderText("Search runs by source, destination, status or job")
+        self.history_date_from = QLineEdit()
+        self.history_date_from.setPlaceholderText("From YYYY-MM-DD")
+        self.history_date_to = QLineEdit()
+        self.history_date_to.setPlaceholderText("To YYYY-MM-DD")
+        for date_edit in (self.history_date_from, self.history_date_to):
+            date_edit.setMaximumWidth(130)
+        for edit in (self.history_search, self.history_date_from, self.history_date_to):
+            edit.textChanged.connect(self.render_history)
+        history_search_row.addWidget(self.history_search, 1)
+        history_search_row.addWidget(self.history_date_from)
+        history_search_row.addWidget(self.history_date_to)
+        history_layout.addLayout(history_search_row)
+
         self.history_list = QListWidget()
         self.history_list.setObjectName("historyList")
         history_layout.addWidget(self.history_list)
 
+        # Queue tab
+        self.queue_tab = QWidget()
+        queue_layout = QVBoxLayout(self.queue_tab)
+        queue_header = QLabel("Queue")
+        queue_header.setObjectName("queueHeader")
+        queue_header.setFont(header_font)
+        queue_layout.addWidget(queue_header)
+
+        self.queue_list = QListWidget()
+        self.queue_list.setObjectName("queueList")
+        queue_layout.addWidget(self.queue_list)
+
+        queue_buttons = QHBoxLayout()
+        for label, slot in (("▲ Up", lambda: self.move_selected_job(-1)),
+                            ("▼ Down", lambda: self.move_selected_job(1)),
+                            ("Priority +", lambda: self.change_selected_priority(1)),
+                            ("Priority −", lambda: self.change_selected_priority(-1)),
+                            ("Cancel", self.cancel_selected_job)):
+            button = QPushButton(label)
+            button.clicked.connect(slot)
+            queue_buttons.addWidget(button)
+        queue_layout.addLayout(queue_buttons)
+
+        # Coverage tab
+        self.coverage_tab = QWidget()
+        coverage_layout = QVBoxLayout(self.coverage_tab)
+        coverage_header = QLabel("Coverage")
+        coverage_header.setObjectName("coverageHeader")
+        coverage_header.setFont(header_font)
+        coverage_layout.addWidget(coverage_header)
+
+        coverage_controls = QHBoxLayout()
+        self.coverage_scan_btn = QPushButton("Scan Destination")
+        self.coverage_scan_btn.clicked.connect(self.scan_coverage)
+        self.coverage_gaps_only = QCheckBox("Only accounts with gaps")
+        self.coverage_gaps_only.setChecked(True)
+        self.coverage_gaps_only.toggled.connect(self.populate_coverage_table)
+        self.coverage_export_btn = QPushButton("Export")
+        self.coverage_export_btn.setEnabled(False)
+        self.coverage_export_btn.clicked.connect(self.export_coverage)
+        coverage_controls.addWidget(self.coverage_scan_btn)
+        coverage_controls.addWidget(self.coverage_gaps_only)
+        coverage_controls.addStretch()
+        coverage_controls.addWidget(self.coverage_export_btn)
+        coverage_layout.addLayout(coverage_controls)
+
+        self.coverage_summary = QLabel("Scan the destination folder to see which monthly bills are missing.")
+        coverage_layout.addWidget(self.coverage_summary)
+
+        self.coverage_table = QTableWidget(0, 6)
+        self.coverage_table.setObjectName("coverageTable")
+        self.coverage_table.setHorizontalHeaderLabels(
+            ["Corp", "Provider", "Account", "Bills", "First / Last", "Missing Months"])
+        self.coverage_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        self.coverage_table.verticalHeader().setVisible(False)
+        self.coverage_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        coverage_layout.addWidget(self.coverage_table)
+
         self.tabs.addTab(self.results_tab, "Results")
+        self.tabs.addTab(self.queue_tab, "Queue")
+        self.tabs.addTab(self.coverage_tab, "Coverage")
         self.tabs.addTab(self.history_tab, "History")
 
         layout.addWidget(self.tabs)
@@ -514,398 +5387,233 @@ class AxoraApp(QMainWindow):
             
             #historyList { border: 1px solid #334155; border-radius: 8px; background: #0f172a; color: #e5e7eb; }
 
-            QStatusBar { background: #0f172a; color: #e5e7eb; }
-            QStatusBar::item { border: none; }
-            
-            QRadioButton { color: #e5e7eb; spacing: 5px; }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                border: 2px solid #334155;
-                background: #111827;
-            }
-            QRadioButton::indicator:checked {
-                background: #3b82f6;
-                border: 2px solid #3b82f6;
-            }
-            
-            QTabWidget::pane { border: 1px solid #334155; background-color: #0f172a; }
-            QTabBar::tab {
-                background-color: #111827;
-                color: #e5e7eb;
-                padding: 8px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3b82f6;
-                color: #0b1220;
-            }
-            QTabBar::tab:hover {
-                background-color: #1f2937;
-            }
-        """)
-
-
-    # ---------- File pickers ----------
-
-    def browse_excel_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Excel File", "", "Excel files (*.xlsx *.xls);;All files (*.*)"
-        )
-        if file_path:
-            # Show just filename
-            self.excel_path_edit.setText(os.path.basename(file_path))
-            self.excel_path_edit.setToolTip(file_path)
-            self.load_excel_data(file_path)
-
-    def browse_source_folder(self):
-        if self.source_file_radio.isChecked():
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, "Select source file", "", "PDF Files (*.pdf);;All Files (*.*)"
-            )
-            if file_path:
-                self.source_path_edit.setText(os.path.basename(file_path))
-                self.source_path_edit.setToolTip(file_path)
-        else:
-            folder = QFileDialog.getExistingDirectory(self, "Select Source Folder")
-            if folder:
-                self.source_path_edit.setText(os.path.basename(folder) if os.path.basename(folder) else folder)
-                self.source_path_edit.setToolTip(folder)
-
-    def browse_dest_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Utilities Folder")
-        if folder:
-            self.dest_path_edit.setText(os.path.basename(folder) if os.path.basename(folder) else folder)
-            self.dest_path_edit.setToolTip(folder)
-
-    def update_execute_enabled(self):
-        self.organize_btn.setEnabled(
-            bool(self.excel_path_edit.text().strip()) and
-            bool(self.source_path_edit.text().strip()) and
-            bool(self.dest_path_edit.text().strip())
-        )
-
-    # ---------- Excel / Organizer ----------
-
-    def load_excel_data(self, file_path):
-        try:
-            excel_path = self.excel_path_edit.toolTip() or file_path
-            self.mapping = self.build_mapping_from_excel(excel_path)
-            self.statusBar().showMessage(f"✅ Excel data loaded: {len(self.mapping)} mapping entries")
-        except Exception as e:
-            error_msg = f"Error loading Excel file: {str(e)}"
-            self.statusBar().showMessage("❌ Error loading Excel file")
-            QMessageBox.critical(self, "Error", error_msg)
-
-    def build_mapping_from_excel(self, excel_path: str) -> dict:
-        df = pd.read_excel(excel_path, header=None)
-
-        mapping = {}
-        current_provider = None
-
-        for _, row in df.iterrows():
-            cell0 = str(row[0]).strip() if not pd.isna(row[0]) else ""
-            cell1 = str(row[1]).strip() if len(row) > 1 and not pd.isna(row[1]) else ""
-            cell2 = str(row[2]).strip() if len(row) > 2 and not pd.isna(row[2]) else ""
-
-            if cell0.upper() in ("BELL", "TELUS", "ROGERS"):
-                if (cell1 == "" or cell1 == "nan" or pd.isna(row[1])) and (cell2 == "" or cell2 == "nan" or pd.isna(row[2])):
-                    current_provider = cell0.upper()
-                    continue
-
-            if current_provider is None:
-                continue
-
-            if cell1 == "" or cell1 == "nan" or pd.isna(row[1]):
-                continue
-            if cell2 == "" or cell2 == "nan" or pd.isna(row[2]):
-                continue
-
-            corp = cell1
-            account_str = cell2
-
-            # First, extract extension
-            ext = ""
-            ext_match = re.search(r"\(([^)]+)\)", account_str)
-            if ext_match:
-                ext_str = ext_match.group(1).strip()
-                if re.match(r"^[\dA-Za-z]{2,6}$", ext_str):
-                    ext = ext_str
-                    account_str = re.sub(r"\([^)]+\)", "", account_str)
-            else:
-                space_ext = re.search(r"\s+(\d{3,4})\s*$", account_str)
-                if space_ext:
-                    ext = space_ext.group(1)
-                    account_str = re.sub(r"\s+" + re.escape(ext) + r"\s*$", "", account_str)
-
-            # Extract last4
-            phone_match = re.search(r"(\d{3}[-\s]?\d{3}[-\s]?\d{4})", account_str)
-            if phone_match:
-                phone_digits = re.sub(r"\D", "", phone_match.group(1))
-                if len(phone_digits) == 10:
-                    last4 = phone_digits[-4:]
-                else:
-                    all_digits = re.sub(r"\D", "", account_str)
-                    last4 = all_digits[-4:] if len(all_digits) >= 4 else ""
-            else:
-                all_digits = re.sub(r"\D", "", account_str)
-                last4 = all_digits[-4:] if len(all_digits) >= 4 else ""
-
-            entry = {
-                "provider": current_provider,
-                "corp": corp,
-                "account_last4": last4,
-                "account_ext": ext,
-            }
-
-            if last4:
-                mapping[(current_provider, last4)] = entry
-            if ext:
-                mapping[(current_provider, ext)] = entry
-
-        return mapping
-
-    # ---------- Processing ----------
-
-    def process_single_file(self, source_dir: str, dest_root: str, file_name: str) -> tuple[bool, str]:
-        """Process a single file. Returns (success: bool, skip_reason: str)"""
-        src_path = os.path.join(source_dir, file_name)
-
-        # Extract account identifiers from filename
-        last4, ext = self.extract_account_tokens(file_name)
-        if not last4 and not ext:
-            return False, "not_found"
-
-        # Try matching: first last4, then extension
-        map_entry = None
-        matched_token = None
-
-        if last4:
-            for prov in ("BELL", "TELUS", "ROGERS"):
-                key = (prov, last4)
-                if key in self.mapping:
-                    map_entry = self.mapping[key]
-                    matched_token = last4
-                    break
-
-        if map_entry is None and ext:
-            for prov in ("BELL", "TELUS", "ROGERS"):
-                key = (prov, ext)
-                if key in self.mapping:
-                    map_entry = self.mapping[key]
-                    matched_token = ext
-                    break
-
-        if map_entry is None:
-            return False, "not_found"
-
-        provider = map_entry["provider"]
-        corp = str(map_entry["corp"]).strip()
-
-        # Extract date from filename
-        date_str, year_folder, final_name = self.extract_date_targets(file_name)
-        if not date_str:
-            return False, "not_found"
-
-        # Build destination path
-        account_folder_name = matched_token
-        corp_dir = os.path.join(dest_root, corp)
-        provider_dir = os.path.join(corp_dir, provider.capitalize())
-        account_dir = os.path.join(provider_dir, account_folder_name)
-
-        os.makedirs(account_dir, exist_ok=True)
-
-        # Ensure account organized by year
-        self.ensure_year_organized(account_dir)
-
-        year_dir = os.path.join(account_dir, year_folder)
-        os.makedirs(year_dir, exist_ok=True)
-
-        dest_file_path = os.path.join(year_dir, final_name)
-        if os.path.exists(dest_file_path):
-            return False, "skipped"
-
-        shutil.move(src_path, dest_file_path)
-        # Return hierarchy path for display
-        hierarchy_path = f"{corp} -> {provider.capitalize()} -> {account_folder_name} -> {year_folder} -> {final_name}"
-        return True, hierarchy_path
-
-    def get_file_data_for_excel(self, file_name: str, hierarchy_path: str) -> dict:
-        """Extract file data needed for Excel update"""
-        # Parse hierarchy path: "Corp -> Provider -> Account -> Year -> filename"
-        parts = [p.strip() for p in hierarchy_path.split(" -> ")]
-        if len(parts) < 3:
-            return {}
-        
-        corp = parts[0]
-        account = parts[2] if len(parts) > 2 else ""
-        
-        # Extract date from filename
-        date_str, year_folder, _ = self.extract_date_targets(file_name)
-        if not date_str:
-            return {}
-        
-        # Parse date to get month
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            month_name = date_obj.strftime("%B")  # Full month name (e.g., "September")
-        except:
-            month_name = ""
-        
-        return {
-            "corp": corp,
-            "account": account,
-            "date": date_str,
-            "month": month_name,
-            "year": year_folder
-        }
-
-    def extract_account_tokens(self, file_name: str) -> tuple[str, str]:
-        base = os.path.splitext(file_name)[0]
-
-        # Extract extension first - try multiple formats
-        ext = ""
-        
-        # Format 1: Extension in parentheses (xxx)
-        ext_match = re.search(r"\(([^)]+)\)", base)
-        if ext_match:
-            ext_candidate = ext_match.group(1).strip()
-            if re.match(r"^[\dA-Za-z]{2,6}$", ext_candidate):
-                ext = ext_candidate
-        else:
-            # Format 2: Spaces + digits + dash (e.g., "   877-", "   190-")
-            space_dash_ext = re.search(r"\s+(\d{2,4})-", base)
-            if space_dash_ext:
-                ext_candidate = space_dash_ext.group(1).strip()
-                if re.match(r"^\d{2,4}$", ext_candidate):
-                    ext = ext_candidate
-            else:
-                # Format 3: Space-separated extension at end
-                space_ext = re.search(r"\s+(\d{3,4})\s*$", base)
-                if space_ext:
-                    ext = space_ext.group(1)
-
-        # Remove date patterns (including YYYYMMDD format)
-        base_for_last4 = re.sub(r"_\d{4}-\d{2}-\d{2}", "", base)
-        base_for_last4 = re.sub(r"_\d{2}-\d{2}-\d{2}", "", base_for_last4)
-        base_for_last4 = re.sub(r"\d{4}-\d{2}-\d{2}", "", base_for_last4)
-        base_for_last4 = re.sub(r"\d{2}-\d{2}-\d{2}", "", base_for_last4)
-        # Remove YYYYMMDD format (dates that start with 19 or 20)
-        base_for_last4 = re.sub(r"-(\d{4})(\d{2})(\d{2})", "", base_for_last4)  # Remove dash + YYYYMMDD
-        base_for_last4 = re.sub(r"(19|20)\d{6}", "", base_for_last4)  # Remove dates starting with 19xx or 20xx
+            QStatusBar { background: #0f172a; color: #e5e7eb; }
+            QStatusBar::item { border: none; }
+            
+            QRadioButton { color: #e5e7eb; spacing: 5px; }
+            QRadioButton::indicator {
+                width: 16px;
+                height: 16px;
+                border-radius: 8px;
+                border: 2px solid #334155;
+                background: #111827;
+            }
+            QRadioButton::indicator:checked {
+                background: #3b82f6;
+                border: 2px solid #3b82f6;
+            }
+            
+            QTabWidget::pane { border: 1px solid #334155; background-color: #0f172a; }
+            QTabBar::tab {
+                background-color: #111827;
+                color: #e5e7eb;
+                padding: 8px 20px;
+                margin-right: 2px;
+                border-top-left-radius: 4px;
+                border-top-right-radius: 4px;
+            }
+            QTabBar::tab:selected {
+                background-color: #3b82f6;
+                color: #0b1220;
+            }
+            QTabBar::tab:hover {
+                background-color: #1f2937;
+            }
+        """)
 
-        if ext:
-            base_for_last4 = re.sub(r"\([^)]+\)", "", base_for_last4)
-            # Remove extension with spaces and dash format
-            base_for_last4 = re.sub(r"\s+" + re.escape(ext) + r"-", "", base_for_last4)
-            base_for_last4 = re.sub(r"\s+" + re.escape(ext) + r"\s*", "", base_for_last4)
 
-        # Find phone numbers (10 digits or 9 digits)
-        phone_patterns = [
-            r"(\d{3}\s+\d{3}\s+\d{4})",
-            r"(\d{3}-\d{3}-\d{4})",
-            r"(\d{10})",
-            r"(\d{9})",  # Support 9-digit phone numbers
-        ]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, base_for_last4)
-            if phone_match:
-                phone_str = phone_match.group(1)
-                phone_digits = re.sub(r"\D", "", phone_str)
-                if len(phone_digits) in [9, 10]:
-                    match_start = phone_match.start()
-                    if match_start == 0 or not base_for_last4[match_start - 1].isalnum():
-                        return phone_digits[-4:], ext
+    # ---------- File pickers ----------
 
-        # Find account numbers
-        digit_sequences = re.finditer(r"(\d{7,10})", base_for_last4)
-        candidates = []
-        for match in digit_sequences:
-            seq = match.group(1)
-            start_pos = match.start()
-            if start_pos > 0 and base_for_last4[start_pos - 1].isalpha():
-                continue
-            if start_pos > 0 and base_for_last4[start_pos - 1].upper() == 'X':
-                continue
-            seq_len = len(seq)
-            if 7 <= seq_len <= 10:
-                candidates.append((seq, start_pos))
+    def browse_excel_file(self):
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select Excel File(s)", "", MAPPING_FILE_FILTER
+        )
+        if file_paths:
+            self.set_excel_sources(file_paths)
 
-        if candidates:
-            best = max(candidates, key=lambda x: (len(x[0]), x[1]))
-            return best[0][-4:], ext
+    def add_excel_file(self):
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Add Excel File(s)", "", MAPPING_FILE_FILTER
+        )
+        if file_paths:
+            self.set_excel_sources(self.excel_sources() + file_paths)
+
+    def excel_sources(self) -> list[str]:
+        """Mapping workbooks in precedence order (first wins)"""
+        tooltip = self.excel_path_edit.toolTip()
+        if tooltip:
+            return [p for p in tooltip.split("\n") if p]
+        return [p.strip() for p in self.excel_path_edit.text().split(";") if p.strip()]
+
+    def set_excel_sources(self, file_paths: list[str]):
+        file_paths = list(dict.fromkeys(file_paths))
+        # Show just filenames; the tooltip keeps the full paths in precedence order
+        self.excel_path_edit.setText("; ".join(os.path.basename(p) for p in file_paths))
+        self.excel_path_edit.setToolTip("\n".join(file_paths))
+        self.load_excel_data(file_paths)
+        self.save_settings()
 
-        # Fallback
-        digit_sequences = re.finditer(r"(\d{4,})", base_for_last4)
-        candidates = []
-        for match in digit_sequences:
-            seq = match.group(1)
-            start_pos = match.start()
-            if len(seq) == 4 and (seq.startswith("19") or seq.startswith("20")):
-                continue
-            if start_pos > 0 and base_for_last4[start_pos - 1].isalpha():
-                continue
-            candidates.append((seq, start_pos))
+    def browse_source_folder(self):
+        if self.source_file_radio.isChecked():
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "Select source file", "", "PDF Files (*.pdf);;All Files (*.*)"
+            )
+            if file_path:
+                self.source_path_edit.setText(os.path.basename(file_path))
+                self.source_path_edit.setToolTip(file_path)
+                self.save_settings()
+        else:
+            folder = QFileDialog.getExistingDirectory(self, "Select Source Folder")
+            if folder:
+                self.source_path_edit.setText(os.path.basename(folder) if os.path.basename(folder) else folder)
+                self.source_path_edit.setToolTip(folder)
+                self.save_settings()
 
-        if candidates:
-            best = max(candidates, key=lambda x: x[1])
-            return best[0][-4:], ext
+    def browse_dest_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Utilities Folder")
+        if folder:
+            self.dest_path_edit.setText(os.path.basename(folder) if os.path.basename(folder) else folder)
+            self.dest_path_edit.setToolTip(folder)
+            self.save_settings()
 
-        return "", ext
+    def update_execute_enabled(self):
+        self.organize_btn.setEnabled(
+            bool(self.excel_path_edit.text().strip()) and
+            bool(self.source_path_edit.text().strip()) and
+            bool(self.dest_path_edit.text().strip())
+        )
 
-    def extract_date_targets(self, file_name: str) -> tuple[str, str, str]:
-        name, ext = os.path.splitext(file_name)
+    # ---------- Excel / Organizer ----------
 
-        # Priority 1: Date after LAST dash in YYYYMMDD format (8 digits after dash, starting with 19 or 20)
-        # Format 1: "4163627475  136-20251025" or Format 2: "532892345-20251025"
-        # Find all matches and use the last one (date should be at the end)
-        all_dash_matches = list(re.finditer(r"-(19|20)(\d{2})(\d{2})(\d{2})", name))
-        if all_dash_matches:
-            m_dash_compact = all_dash_matches[-1]  # Use the last match (date should be at the end)
-            yyyy_prefix, yy, mm, dd = m_dash_compact.group(1), m_dash_compact.group(2), m_dash_compact.group(3), m_dash_compact.group(4)
-            yyyy = f"{yyyy_prefix}{yy}"
-        else:
-            # Priority 2: Try YYYY-MM-DD format (with dashes)
-            m_full = re.search(r"(\d{4})-(\d{2})-(\d{2})", name)
-            if m_full:
-                yyyy, mm, dd = m_full.group(1), m_full.group(2), m_full.group(3)
-            else:
-                # Priority 3: Try YY-MM-DD format
-                m_short = re.search(r"(\d{2})-(\d{2})-(\d{2})", name)
-                if m_short:
-                    yy, mm, dd = m_short.group(1), m_short.group(2), m_short.group(3)
-                    yyyy = f"20{yy}"
-                else:
-                    return "", "", ""
+    def load_excel_data(self, file_paths: list[str]):
+        """Load mapping files in the background; queued jobs start once it finishes"""
+        self.cancel_mapping_load()
+        self.retire_mapping_worker(self.mapping_loader)
+        profile = profile_base("excel_load") if self.profile_checkbox.isChecked() else None
+        loader = MappingLoadWorker(self.mapping_index, file_paths, profile)
+        loader.progress.connect(self.update_mapping_progress)
+        loader.finished.connect(lambda _, loader=loader: self.mapping_loaded(loader))
+        loader.cancelled.connect(lambda loader=loader: self.mapping_load_stopped(loader, None))
+        loader.error_occurred.connect(lambda message, loader=loader: self.mapping_load_stopped(loader, message))
+        self.mapping_loader = loader
+        self.mapping_progress.setValue(0)
+        self.mapping_progress.show()
+        self.mapping_cancel_btn.show()
+        self.statusBar().showMessage("⏳ Loading Excel data...")
+        loader.start()
+
+    def retire_mapping_worker(self, worker):
+        """Hold on to a finished or superseded mapping worker until its thread has exited"""
+        self.stale_mapping_loaders = [l for l in self.stale_mapping_loaders if l.isRunning()]
+        if worker is not None:
+            self.stale_mapping_loaders.append(worker)
+
+    def mapping_loading(self) -> bool:
+        return self.mapping_loader is not None
+
+    def cancel_mapping_load(self):
+        if self.mapping_loader is not None:
+            self.mapping_loader.cancel_event.set()
+
+    def update_mapping_progress(self, path: str, done: int, total: int):
+        if total:
+            self.mapping_progress.setValue(min(99, int(done / total * 100)))
+        self.statusBar().showMessage(f"⏳ Loading {os.path.basename(path)}: {done:,} rows")
+
+    def mapping_load_ended(self, loader) -> bool:
+        """Hide the progress row if loader is the current load; False for a superseded one"""
+        if loader is not self.mapping_loader:
+            return False
+        self.retire_mapping_worker(loader)
+        self.mapping_loader = None
+        self.mapping_progress.hide()
+        self.mapping_cancel_btn.hide()
+        return True
+
+    def mapping_loaded(self, loader):
+        if not self.mapping_load_ended(loader):
+            return
+        self.reported_mapping_errors = {}
+        workbooks = len(self.mapping_index.sources)
+        self.statusBar().showMessage(
+            f"✅ Excel data loaded: {len(self.organizer.mapping)} mapping entries"
+            + (f" from {workbooks} workbooks" if workbooks > 1 else "")
+        )
+        self.schedule_jobs()
 
-        final_name = f"{yyyy[2:]}-{mm}-{dd}{ext}"
-        return f"{yyyy}-{mm}-{dd}", yyyy, final_name
+    def mapping_load_stopped(self, loader, error):
+        """A load was cancelled (error None) or failed; jobs waiting on it are dropped"""
+        if not self.mapping_load_ended(loader):
+            return
+        if error is None:
+            self.statusBar().showMessage("Excel load cancelled")
+        else:
+            self.statusBar().showMessage("❌ Error loading Excel file")
+            QMessageBox.critical(self, "Error", f"Error loading Excel file: {error}")
+        if not self.organizer.mapping:
+            for job in list(self.job_queue.queued):
+                self.job_queue.cancel(job.id)
+            self.refresh_queue_list()
+            if self.job_queue.is_idle():
+                self.queue_drained()
+        else:
+            self.schedule_jobs()
 
-    def ensure_year_organized(self, account_dir: str) -> None:
-        entries = [e for e in os.listdir(account_dir) if os.path.isdir(os.path.join(account_dir, e))]
-        if any(re.fullmatch(r"\d{4}", e) for e in entries):
+    def reload_changed_mappings(self):
+        """Re-parse the mapping workbooks edited since they were loaded, in the background"""
+        if not self.mapping_index.sources or self.mapping_loading() or self.mapping_refresher is not None:
+            return
+        refresher = MappingLoadWorker(self.mapping_index)
+        refresher.progress.connect(self.update_mapping_progress)
+        refresher.finished.connect(lambda pending, refresher=refresher: self.mapping_refreshed(refresher, pending))
+        refresher.cancelled.connect(lambda refresher=refresher: self.mapping_refreshed(refresher, []))
+        refresher.error_occurred.connect(lambda message, refresher=refresher: self.mapping_refreshed(refresher, []))
+        self.mapping_refresher = refresher
+        refresher.start()
+
+    def mapping_refreshed(self, refresher, pending):
+        """Swap in the workbooks a refresh re-parsed and report what changed"""
+        if refresher is not self.mapping_refresher:
             return
+        self.retire_mapping_worker(refresher)
+        self.mapping_refresher = None
+        for path, added, removed, changed in self.mapping_index.apply_reloads(pending):
+            self.statusBar().showMessage(
+                f"🔄 Reloaded {os.path.basename(path)}: +{added} / -{removed} / ~{changed} entries "
+                f"({len(self.organizer.mapping)} total)"
+            )
+        errors = dict(self.mapping_index.errors)
+        for path, message in errors.items():
+            if self.reported_mapping_errors.get(path) != message:
+                self.statusBar().showMessage(f"⚠️ Could not reload {os.path.basename(path)}: {message}")
+        self.reported_mapping_errors = errors
 
-        files = [f for f in os.listdir(account_dir) if os.path.isfile(os.path.join(account_dir, f))]
-        for f in files:
-            date_str, year_folder, _ = self.extract_date_targets(f)
-            if not date_str:
-                continue
-            year_dir = os.path.join(account_dir, year_folder)
-            os.makedirs(year_dir, exist_ok=True)
-            try:
-                shutil.move(os.path.join(account_dir, f), os.path.join(year_dir, f))
-            except Exception:
-                pass
+    def load_provider_rules(self) -> ProviderRules:
+        try:
+            return load_provider_rules(PROVIDER_RULES_FILE)
+        except Exception as e:
+            QMessageBox.warning(
+                None,
+                "Provider Rules",
+                f"Could not load {PROVIDER_RULES_FILE}; using the built-in providers.\n\n{str(e)}"
+            )
+            return ProviderRules.default()
+
+    def load_io_filesystem(self) -> FileSystem:
+        try:
+            return scheduled_filesystem(LocalFileSystem(), load_io_schedule(IO_SCHEDULE_FILE))
+        except Exception as e:
+            QMessageBox.warning(
+                None,
+                "I/O Schedule",
+                f"Could not load {IO_SCHEDULE_FILE}; running without I/O limits.\n\n{str(e)}"
+            )
+            return LocalFileSystem()
 
     # ---------- Run & Progress ----------
 
     def start_organization(self):
-        excel_tooltip = self.excel_path_edit.toolTip()
-        excel_path = excel_tooltip if excel_tooltip else self.excel_path_edit.text().strip()
+        excel_paths = self.excel_sources()
 
         source_tooltip = self.source_path_edit.toolTip()
         source_path = source_tooltip if source_tooltip else self.source_path_edit.text().strip()
@@ -913,15 +5621,16 @@ class AxoraApp(QMainWindow):
         dest_tooltip = self.dest_path_edit.toolTip()
         dest_root = dest_tooltip if dest_tooltip else self.dest_path_edit.text().strip()
 
-        if not excel_path or not source_path or not dest_root:
+        if not excel_paths or not source_path or not dest_root:
             QMessageBox.warning(self, "Missing Information",
                                 "Please select Excel file, source folder, and destination folder")
             return
         
         # Validate paths exist
-        if not os.path.exists(excel_path):
-            QMessageBox.warning(self, "Invalid Path", f"Excel file not found: {excel_path}")
-            return
+        for excel_path in excel_paths:
+            if not os.path.exists(excel_path):
+                QMessageBox.warning(self, "Invalid Path", f"Excel file not found: {excel_path}")
+                return
         
         if not os.path.exists(source_path):
             QMessageBox.warning(self, "Invalid Path", f"Source path not found: {source_path}")
@@ -931,101 +5640,289 @@ class AxoraApp(QMainWindow):
             QMessageBox.warning(self, "Invalid Path", f"Destination folder not found: {dest_root}")
             return
 
-        if not self.mapping:
-            self.load_excel_data(excel_path)
-            if not self.mapping:
+        if not self.organizer.mapping and not self.mapping_loading():
+            self.load_excel_data(excel_paths)
+
+        # A fresh batch clears the results of the previous one
+        if self.job_queue.is_idle():
+            self.completed_list.clear()
+            self.skipped_list.clear()
+            self.notfound_list.clear()
+            self.completed_outcomes = []
+            self.result_index = SearchIndex()
+            self.result_items = []
+            self.hidden_results = set()
+            self.results_match_label.setText("")
+            self.progress_bar.setValue(0)
+
+        job = self.job_queue.add(source_path, dest_root)
+        if self.report_checkbox.isChecked():
+            job.report_path = default_report_path(label=f"job{job.id}")
+        self.save_settings()
+        self.statusBar().showMessage(f"Queued job #{job.id}: {source_path} → {dest_root}"
+                                     + ("  (waiting for the Excel load)" if self.mapping_loading() else ""))
+        self.schedule_jobs()
+
+    def schedule_jobs(self):
+        """Start every queued job whose destination root is free"""
+        if self.mapping_loading():
+            # Runs see the index as soon as the load finishes, so they wait for it
+            self.refresh_queue_list()
+            return
+        self.organizer.verify_moves = self.verify_checkbox.isChecked()
+        self.organizer.use_leases = self.lease_checkbox.isChecked()
+        for job in self.job_queue.take_runnable():
+            try:
+                manifest = self.source_manifest if self.manifest_checkbox.isChecked() else None
+                profile = (profile_base(f"job{job.id}", job.report_path)
+                           if self.profile_checkbox.isChecked() else None)
+                shards = self.shards_spin.value()
+                settings = shard_job(self.excel_sources(), verify=self.organizer.verify_moves,
+                                     use_leases=self.organizer.use_leases,
+                                     io={"io_config": IO_SCHEDULE_FILE}) if shards > 1 else None
+                worker = FileOrganizerWorker(self.organizer, job.source_path, job.dest_root,
+                                             job.report_path, job.cancel_event, manifest, job.meter, profile,
+                                             shards, settings)
+                worker.progress_updated.connect(self.update_progress_text)
+                worker.progress_count.connect(lambda done, total, job=job: self.update_job_progress(job, done, total))
+                worker.finished.connect(lambda results, job=job: self.job_finished(job, results))
+                worker.error_occurred.connect(lambda message, job=job: self.job_failed(job, message))
+                worker.file_completed.connect(self.add_completed_file)
+                worker.file_skipped.connect(self.add_skipped_file)
+                worker.file_not_found.connect(self.add_notfound_file)
+                self.job_workers[job.id] = worker
+                worker.start()
+            except Exception as e:
+                import traceback
+                self.job_failed(job, f"Failed to start worker thread: {str(e)}\n\n{traceback.format_exc()}")
                 return
-
-        # Stop any existing worker thread
-        if self.worker_thread and self.worker_thread.isRunning():
-            self.worker_thread.terminate()
-            self.worker_thread.wait()
-        
-        # Disable controls
-        self.organize_btn.setEnabled(False)
-        self.organize_btn.setText("Processing...")
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
-        
-        # Clear results
-        self.completed_list.clear()
-        self.skipped_list.clear()
-        self.notfound_list.clear()
-        
-        # Clear completed files data for new execution
-        self.completed_files_data = []
-
-        # Start worker thread
-        try:
-            self.worker_thread = FileOrganizerWorker(self, source_path, dest_root)
-            self.worker_thread.progress_updated.connect(self.update_progress_text)
-            self.worker_thread.progress_percent.connect(self.update_progress_bar)
-            self.worker_thread.finished.connect(self.organization_finished)
-            self.worker_thread.error_occurred.connect(self.organization_error)
-            self.worker_thread.file_completed.connect(self.add_completed_file)
-            self.worker_thread.file_skipped.connect(self.add_skipped_file)
-            self.worker_thread.file_not_found.connect(self.add_notfound_file)
-            self.worker_thread.start()
-        except Exception as e:
-            self.organize_btn.setEnabled(True)
-            self.organize_btn.setText("Execute")
-            import traceback
-            error_msg = f"Failed to start worker thread: {str(e)}\n\n{traceback.format_exc()}"
-            QMessageBox.critical(self, "Error", error_msg)
+        self.refresh_queue_list()
 
     def update_progress_text(self, message):
         # Progress messages can be shown in status bar or ignored
         if "Processing file" in message:
-            self.statusBar().showMessage(message)
+            metrics = self.running_throughput()
+            self.statusBar().showMessage(f"{message}  |  {format_throughput(metrics)}" if metrics else message)
 
-    def update_progress_bar(self, value):
-        self.progress_bar.setValue(max(0, min(100, int(value))))
-
-    def organization_finished(self, results):
-        self.organize_btn.setEnabled(True)
-        self.organize_btn.setText("Execute")
-        self.progress_bar.setValue(100)
+    def running_throughput(self) -> dict:
+        """Rates of all running jobs added up; the ETA is the slowest job's"""
+        snapshots = [job.meter.snapshot() for job in self.job_queue.running]
+        if not snapshots:
+            return {}
+        etas = [m["eta_s"] for m in snapshots]
+        metrics = {
+            "files_per_s": sum(m["files_per_s"] for m in snapshots),
+            "mb_per_s": sum(m["mb_per_s"] for m in snapshots),
+            "eta_s": None if None in etas else max(etas),
+        }
+        if any("in_flight" in m for m in snapshots):
+            metrics["in_flight"] = sum(m.get("in_flight", 0) for m in snapshots)
+        return metrics
+
+    def update_job_progress(self, job: OrganizeJob, done: int, total: int):
+        job.done, job.total = done, total
+        running = [j for j in self.job_queue.running if j.total]
+        if running:
+            value = sum(j.done for j in running) / sum(j.total for j in running) * 100
+            self.progress_bar.setValue(max(0, min(100, int(value))))
+        self.refresh_queue_list()
+
+    def job_finished(self, job: OrganizeJob, results: dict):
+        job.done = job.total = results.get("total", 0)
+        self.job_queue.complete(job, results)
+        self.job_workers.pop(job.id).wait()
 
         moved = results.get('moved', 0)
         skipped = results.get('skipped', 0)
         not_found = results.get('not_found', 0)
-        total = results.get('total', 0)
 
         # Update group box titles with counts
-        self.update_section_titles(moved, skipped, not_found)
-
-        self.statusBar().showMessage(f"Completed. Moved: {moved}, Skipped: {skipped}, Not Found: {not_found}")
-        QMessageBox.information(self, "Success", f"Files have been successfully organized!\n\nMoved: {moved}\nSkipped: {skipped}\nNot Found: {not_found}")
+        self.update_section_titles(self.completed_list.count(), self.skipped_list.count(),
+                                   self.notfound_list.count())
+
+        self.statusBar().showMessage(
+            f"Job #{job.id} {job.status}. Moved: {moved}, Skipped: {skipped}, Not Found: {not_found}"
+            + (f", Failed verification: {results['failed']}" if results.get("failed") else "")
+            + (f"  ({format_throughput(results['metrics'])})" if results.get("metrics") else "")
+            + (f" ({results['unchanged']} unchanged since last run)" if results.get("unchanged") else "")
+            + (f" ({results['retried']} needed a retry)" if results.get("retried") else "")
+            + (f" ({results['unrecorded']} checksums not recorded)" if results.get("unrecorded") else "")
+            + (f"  |  Report: {results['report']}" if results.get("report") else "")
+            + (f"  |  Profile: {results['profile']}" if results.get("profile") else "")
+            + (f"  |  {len(results['shards'])} shards" if results.get("shards") else "")
+            + (f"  |  FAILED {'; '.join(results['errors'])}" if results.get("errors") else "")
+        )
 
         # Log to history
-        self.append_history_entry(results)
-        
-        # Ask to update Excel file if there are completed files
-        if moved > 0 and self.completed_files_data:
-            self.prompt_excel_update()
-
-    def organization_error(self, error_message):
-        self.organize_btn.setEnabled(True)
-        self.organize_btn.setText("Execute")
-        self.progress_bar.setValue(0)
-
-        self.statusBar().showMessage("Organization failed")
+        self.append_history_entry(results, job)
+        self.schedule_jobs()
+        if self.job_queue.is_idle():
+            self.queue_drained()
+
+    def job_failed(self, job: OrganizeJob, error_message: str):
+        self.job_queue.complete(job, error=error_message)
+        worker = self.job_workers.pop(job.id, None)
+        if worker is not None:
+            worker.wait()
+
+        self.statusBar().showMessage(f"Job #{job.id} failed")
         # Show first 500 chars of error to avoid huge dialogs
         error_display = error_message[:500] + "..." if len(error_message) > 500 else error_message
         QMessageBox.critical(self, "Error", f"File organization failed:\n{error_display}")
+        self.schedule_jobs()
+        if self.job_queue.is_idle():
+            self.queue_drained()
+
+    def queue_drained(self):
+        """Every job has finished: summarize and offer the Excel update"""
+        self.progress_bar.setValue(100)
+        self.refresh_queue_list()
+        if self.coverage_matrix is not None:
+            self.scan_coverage()  # incremental, only changed folders are re-listed
+        moved = self.completed_list.count()
+        if moved or self.skipped_list.count() or self.notfound_list.count():
+            QMessageBox.information(
+                self, "Success",
+                f"Files have been successfully organized!\n\nMoved: {moved}\n"
+                f"Skipped: {self.skipped_list.count()}\nNot Found: {self.notfound_list.count()}"
+            )
+
+        # Ask to update Excel file if there are completed files
+        if moved > 0 and self.completed_outcomes:
+            self.prompt_excel_update()
+
+    # ---------- Job Queue ----------
+
+    def selected_job_id(self):
+        item = self.queue_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+    def refresh_queue_list(self):
+        selected = self.selected_job_id()
+        self.queue_list.clear()
+        for job in self.job_queue.jobs():
+            item = QListWidgetItem(job.describe())
+            item.setData(Qt.ItemDataRole.UserRole, job.id)
+            self.queue_list.addItem(item)
+            if job.id == selected:
+                self.queue_list.setCurrentItem(item)
+        running, queued = len(self.job_queue.running), len(self.job_queue.queued)
+        self.tabs.setTabText(self.tabs.indexOf(self.queue_tab),
+                             f"Queue ({running + queued})" if running + queued else "Queue")
+
+    def move_selected_job(self, offset: int):
+        job_id = self.selected_job_id()
+        if job_id is not None and self.job_queue.move(job_id, offset):
+            self.refresh_queue_list()
+
+    def change_selected_priority(self, delta: int):
+        job_id = self.selected_job_id()
+        job = self.job_queue.get(job_id) if job_id is not None else None
+        if job and self.job_queue.set_priority(job_id, job.priority + delta):
+            self.refresh_queue_list()
+
+    def cancel_selected_job(self):
+        job_id = self.selected_job_id()
+        if job_id is not None and self.job_queue.cancel(job_id):
+            self.refresh_queue_list()
+            if self.job_queue.is_idle():
+                self.queue_drained()
+
+    def closeEvent(self, event):
+        # Let running jobs stop cleanly after their current file
+        for job in self.job_queue.jobs():
+            self.job_queue.cancel(job.id)
+        for worker in list(self.job_workers.values()):
+            worker.wait()
+        if self.coverage_worker is not None:
+            self.coverage_worker.wait()
+        self.cancel_mapping_load()
+        if self.mapping_refresher is not None:
+            self.mapping_refresher.cancel_event.set()
+        for loader in [self.mapping_loader, self.mapping_refresher] + self.stale_mapping_loaders:
+            if loader is not None:
+                loader.wait()
+        super().closeEvent(event)
+
+    # ---------- Coverage ----------
+
+    def scan_coverage(self):
+        dest_tooltip = self.dest_path_edit.toolTip()
+        dest_root = dest_tooltip if dest_tooltip else self.dest_path_edit.text().strip()
+        if not dest_root or not os.path.isdir(dest_root):
+            QMessageBox.warning(self, "Coverage", "Select an existing destination folder to scan.")
+            return
+        if self.coverage_worker is not None and self.coverage_worker.isRunning():
+            return
+        self.coverage_scan_btn.setEnabled(False)
+        self.coverage_scan_btn.setText("Scanning...")
+        self.coverage_worker = CoverageWorker(self.coverage_scanner, dest_root)
+        self.coverage_worker.finished.connect(self.coverage_scanned)
+        self.coverage_worker.error_occurred.connect(self.coverage_failed)
+        self.coverage_worker.start()
+
+    def coverage_scanned(self, matrix: CoverageMatrix):
+        self.coverage_worker.wait()
+        self.coverage_scan_btn.setEnabled(True)
+        self.coverage_scan_btn.setText("Scan Destination")
+        self.coverage_matrix = matrix
+        self.coverage_export_btn.setEnabled(bool(matrix.accounts))
+        self.populate_coverage_table()
+
+    def coverage_failed(self, message: str):
+        self.coverage_worker.wait()
+        self.coverage_scan_btn.setEnabled(True)
+        self.coverage_scan_btn.setText("Scan Destination")
+        QMessageBox.critical(self, "Coverage", f"Could not scan the destination folder:\n{message}")
+
+    def populate_coverage_table(self):
+        matrix = self.coverage_matrix
+        if matrix is None:
+            return
+        rows = list(matrix.rows())
+        with_gaps = sum(1 for row in rows if row["missing"])
+        if self.coverage_gaps_only.isChecked():
+            rows = [row for row in rows if row["missing"]]
+        span = f"{matrix.months[0]} to {matrix.months[-1]}" if matrix.months else "no dated bills"
+        self.coverage_summary.setText(
+            f"{len(matrix.accounts)} accounts, {with_gaps} with missing months ({span})")
+
+        table = self.coverage_table
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            missing = row["missing"]
+            values = (row["corp"], row["provider"], row["account"], str(row["bills"]),
+                      f"{row['first']} / {row['last']}",
+                      f"{len(missing)}: " + ", ".join(missing) if missing else "—")
+            for c, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if c == 5 and missing:
+                    item.setToolTip("\n".join(missing))
+                table.setItem(r, c, item)
+        table.setUpdatesEnabled(True)
+
+    def export_coverage(self):
+        if self.coverage_matrix is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Coverage", "coverage.xlsx", "Excel files (*.xlsx);;CSV files (*.csv)"
+        )
+        if not path:
+            return
+        try:
+            self.coverage_matrix.export(path)
+            self.statusBar().showMessage(f"Coverage exported to {path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Could not export coverage:\n{str(e)}")
 
     # ---------- Results / History / Info ----------
 
-    def format_tree_hierarchy(self, filename: str, hierarchy_path: str) -> str:
-        """Format hierarchy path as tree-style with arrows"""
-        # hierarchy_path format: "Corp -> Provider -> Account -> Year -> filename"
-        parts = [p.strip() for p in hierarchy_path.split(" -> ")]
-        if len(parts) < 2:
-            return filename
-        
-        lines = [filename]  # Start with filename
+    def format_tree_hierarchy(self, outcome: FileOutcome) -> str:
+        """Format the target hierarchy as tree-style with arrows"""
+        lines = [outcome.file_name]  # Start with filename
         # Exclude the last part (filename) and build tree structure
-        hierarchy_parts = parts[:-1]
+        hierarchy_parts = outcome.hierarchy()[:-1]
         for i, part in enumerate(hierarchy_parts, start=1):
             if i == len(hierarchy_parts):
                 # Last item
@@ -1037,67 +5934,141 @@ class AxoraApp(QMainWindow):
         
         return "\n".join(lines)
 
-    def add_completed_file(self, filename: str, hierarchy_path: str, file_data: dict):
+    def add_completed_file(self, outcome: FileOutcome):
         """Add a completed file with tree-style hierarchy"""
         try:
-            formatted = self.format_tree_hierarchy(filename, hierarchy_path)
+            formatted = self.format_tree_hierarchy(outcome)
             item = QListWidgetItem(formatted)
             # Calculate approximate height for multi-line text (4 lines + padding)
             item.setSizeHint(QSize(-1, 80))  # -1 means use default width
             self.completed_list.addItem(item)
+            self.add_result_row(item, outcome)
             
-            # Store file data for Excel update
-            if file_data:
-                self.completed_files_data.append(file_data)
+            # Keep the outcome for the Excel update
+            self.completed_outcomes.append(outcome)
         except Exception as e:
             # Log error but don't crash
             print(f"Error adding completed file to list: {e}")
 
-    def add_skipped_file(self, filename: str, reason: str):
-        """Add a skipped file"""
+    def add_skipped_file(self, outcome: FileOutcome):
+        """Add a skipped file, or one whose verified copy failed"""
         try:
-            text = f"{filename}\n  Reason: {reason}"
+            label = "Failed" if outcome.status == "failed" else "Reason"
+            text = f"{outcome.file_name}\n  {label}: {outcome.reason}"
             item = QListWidgetItem(text)
             item.setSizeHint(QSize(-1, 50))  # -1 means use default width
             self.skipped_list.addItem(item)
+            self.add_result_row(item, outcome)
         except Exception as e:
             print(f"Error adding skipped file to list: {e}")
 
-    def add_notfound_file(self, filename: str):
+    def add_notfound_file(self, outcome: FileOutcome):
         """Add a not found file"""
         try:
-            text = f"{filename}\n  Reason: Account not found in Excel"
+            text = f"{outcome.file_name}\n  Reason: {outcome.reason or 'Account not found in Excel'}"
             item = QListWidgetItem(text)
             item.setSizeHint(QSize(-1, 50))  # -1 means use default width
             self.notfound_list.addItem(item)
+            self.add_result_row(item, outcome)
         except Exception as e:
             print(f"Error adding not found file to list: {e}")
 
+    # ---------- Search ----------
+
+    def results_filter(self) -> tuple[str, str, str]:
+        return (self.results_search.text(), self.results_date_from.text().strip(),
+                self.results_date_to.text().strip())
+
+    def add_result_row(self, item: QListWidgetItem, outcome: FileOutcome):
+        row = self.result_index.add(outcome_search_fields(outcome), outcome.date)
+        self.result_items.append(item)
+        query = self.results_filter()
+        if any(query) and not self.result_index.matches(row, *query):
+            item.setHidden(True)
+            self.hidden_results.add(row)
+
+    def apply_results_filter(self):
+        """Show only the result rows matching the search box, via the index"""
+        matches = self.result_index.search(*self.results_filter())
+        lists = (self.completed_list, self.skipped_list, self.notfound_list)
+        for list_widget in lists:
+            list_widget.setUpdatesEnabled(False)
+        # Only rows whose visibility changes are touched
+        hidden = set() if matches is None else set(range(len(self.result_items))) - matches
+        for row in hidden - self.hidden_results:
+            self.result_items[row].setHidden(True)
+        for row in self.hidden_results - hidden:
+            self.result_items[row].setHidden(False)
+        self.hidden_results = hidden
+        for list_widget in lists:
+            list_widget.setUpdatesEnabled(True)
+        self.results_match_label.setText(
+            "" if matches is None else f"{len(matches)} of {len(self.result_items)} match")
+
+    def render_history(self):
+        """Show the newest runs, or the runs matching the History search"""
+        query = (self.history_search.text(), self.history_date_from.text().strip(),
+                 self.history_date_to.text().strip())
+        if any(query):
+            if self.history_index is None:
+                self.history_index = SearchIndex()
+                self.history_rows = []
+                for entry in reversed(self.history_items):
+                    self.index_history_entry(entry)
+            # Row ids follow run order, so the highest ids are the newest runs
+            rows = sorted(self.history_index.search(*query), reverse=True)
+            entries = [self.history_rows[row] for row in rows[:HISTORY_PAGE_SIZE]]
+            total = len(rows)
+        else:
+            entries = self.history_items[:HISTORY_PAGE_SIZE]
+            total = len(self.history_items)
+        self.history_list.clear()
+        self.history_list.addItems([history_summary(entry) for entry in entries])
+        if total > len(entries):
+            self.history_list.addItem(f"… {total - len(entries)} older runs; search to find them")
+
+    def index_history_entry(self, entry: dict):
+        self.history_index.add(history_search_fields(entry), entry.get("timestamp", "")[:10])
+        self.history_rows.append(entry)
+
     def update_section_titles(self, moved: int, skipped: int, not_found: int):
         """Update group box titles with counts"""
         self.completed_group.setTitle(f"✅ Completed ({moved})")
         self.skipped_group.setTitle(f"⚠️ Skipped ({skipped})")
         self.notfound_group.setTitle(f"❌ Not Found ({not_found})")
 
-    def append_history_entry(self, results: dict):
+    def append_history_entry(self, results: dict, job: OrganizeJob = None):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         total = results.get('total', 0)
         moved = results.get('moved', 0)
         skipped = results.get('skipped', 0)
         not_found = results.get('not_found', 0)
         failed = skipped + not_found
-        summary = (f"{timestamp}  |  Total: {total}  |  "
-                   f"✓ {moved}  |  ✗ {failed}")
-        item = QListWidgetItem(summary)
-        self.history_list.insertItem(0, item)
 
         # Save to disk
-        self.history_items.insert(0, {
+        entry = {
             "timestamp": timestamp,
             "total": total,
             "successful": moved,
             "failed": failed,
-        })
+        }
+        if job is not None:
+            entry["job"] = job.id
+            entry["source"] = job.source_path
+            entry["destination"] = job.dest_root
+            entry["status"] = job.status
+        if results.get("report"):
+            entry["report"] = os.path.abspath(results["report"])
+        if results.get("metrics"):
+            entry["metrics"] = results["metrics"]
+        if results.get("profile"):
+            entry["profile"] = os.path.abspath(results["profile"])
+        if results.get("shards"):
+            entry["shards"] = results["shards"]
+        self.history_items.insert(0, entry)
+        if self.history_index is not None:
+            self.index_history_entry(entry)
+        self.render_history()
         self.save_history()
 
     def show_info(self):
@@ -1120,11 +6091,8 @@ class AxoraApp(QMainWindow):
             if os.path.exists(HISTORY_FILE):
                 with open(HISTORY_FILE, "r", encoding="utf-8") as f:
                     self.history_items = json.load(f)
-                # Populate UI
-                for rec in reversed(self.history_items):
-                    summary = (f"{rec['timestamp']}  |  Total: {rec['total']}  |  "
-                               f"✓ {rec['successful']}  |  ✗ {rec['failed']}")
-                    self.history_list.addItem(summary)
+                # Only the newest runs are rendered; the search box reaches the rest
+                self.render_history()
         except Exception:
             pass
 
@@ -1135,6 +6103,43 @@ class AxoraApp(QMainWindow):
         except Exception:
             pass
 
+    # ---------- Settings Persistence ----------
+
+    def save_settings(self):
+        """Remember the chosen paths for the next launch"""
+        settings = {
+            "excel": self.excel_sources(),
+            "source": self.source_path_edit.toolTip() or self.source_path_edit.text().strip(),
+            "source_is_file": self.source_file_radio.isChecked(),
+            "dest": self.dest_path_edit.toolTip() or self.dest_path_edit.text().strip(),
+        }
+        try:
+            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
+                json.dump(settings, f, indent=2)
+        except Exception:
+            pass
+
+    def restore_settings(self):
+        """Fill in last session's paths that still exist and start loading its mapping"""
+        try:
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+        except Exception:
+            return
+        source, dest = settings.get("source") or "", settings.get("dest") or ""
+        if source and os.path.exists(source):
+            (self.source_file_radio if settings.get("source_is_file") else self.source_folder_radio).setChecked(True)
+            self.source_path_edit.setText(os.path.basename(source) or source)
+            self.source_path_edit.setToolTip(source)
+        if dest and os.path.isdir(dest):
+            self.dest_path_edit.setText(os.path.basename(dest) or dest)
+            self.dest_path_edit.setToolTip(dest)
+        excel = [p for p in settings.get("excel") or [] if os.path.exists(p)]
+        if excel:
+            self.excel_path_edit.setText("; ".join(os.path.basename(p) for p in excel))
+            self.excel_path_edit.setToolTip("\n".join(excel))
+            self.load_excel_data(excel)
+
     # ---------- Excel Update Integration ----------
 
     def prompt_excel_update(self):
@@ -1143,7 +6148,7 @@ class AxoraApp(QMainWindow):
             self,
             "Update Excel File?",
             f"Would you like to update the Utility Excel file with 'Downloaded' status?\n\n"
-            f"{len(self.completed_files_data)} files were successfully organized.",
+            f"{len(self.completed_outcomes)} files were successfully organized.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.Yes
         )
@@ -1156,7 +6161,14 @@ class AxoraApp(QMainWindow):
                 "Excel files (*.xlsx *.xls);;All files (*.*)"
             )
             if excel_path:
-                self.update_excel_file(excel_path)
+                self.run_profiled("excel_update", self.update_excel_file, excel_path)
+
+    def run_profiled(self, label: str, func, *args):
+        """Call func, under a RunProfiler when profiling is ticked"""
+        if not self.profile_checkbox.isChecked():
+            return func(*args)
+        with RunProfiler(profile_base(label)):
+            return func(*args)
 
     def update_excel_file(self, excel_path: str):
         """Update Excel file with Downloaded status for completed files"""
@@ -1226,10 +6238,10 @@ class AxoraApp(QMainWindow):
             updated_count = 0
             data_start_row = (header_row + 1) if header_row is not None else 5  # Data starts after header
             
-            for file_data in self.completed_files_data:
-                corp = str(file_data.get("corp", "")).strip()
-                account = str(file_data.get("account", "")).strip()
-                month = file_data.get("month", "").upper()
+            for outcome in self.completed_outcomes:
+                corp = outcome.corp
+                account = outcome.token
+                month = outcome.month.upper()
                 
                 if not corp or not account or not month:
                     continue
@@ -1334,9 +6346,450 @@ class AxoraApp(QMainWindow):
             )
 
 
+# ------------------------------ Command Line ------------------------------
+
+def cmd_simulate(args) -> int:
+    latency = args.latency_ms / 1000.0
+    results = simulate_run(args.files, args.accounts, latency=latency,
+                           failure_rate=args.failure_rate, seed=args.seed)
+    elapsed = results["elapsed"]
+    rate = results["total"] / elapsed if elapsed > 0 else 0.0
+    print(f"Total: {results['total']}  Moved: {results['moved']}  "
+          f"Skipped: {results['skipped']}  Not Found: {results['not_found']}"
+          + (f"  (retried: {results['retried']})" if results.get("retried") else ""))
+    print(f"Elapsed: {elapsed:.2f}s  ({rate:,.0f} files/s)")
+    return 0
+
+
+def cmd_parser_check(args) -> int:
+    names = []
+    for path in args.corpus:
+        with open(path, "r", encoding="utf-8") as f:
+            names += [line.rstrip("\r\n") for line in f if line.strip()]
+    results = check_parser(names)
+    for name, expected, parsed in results["mismatches"][:args.show]:
+        print(f"MISMATCH {name!r}\n  reference: {expected}\n  parsed:    {parsed}")
+    for name, parsed, batch in results["batch_mismatches"][:args.show]:
+        print(f"BATCH MISMATCH {name!r}\n  parsed: {parsed}\n  batch:  {batch}")
+    speedup = results["reference_us"] / results["parsed_us"] if results["parsed_us"] else 0.0
+    print(f"Checked: {results['total']}  Mismatches: {len(results['mismatches'])}  "
+          f"Batch mismatches: {len(results['batch_mismatches'])}")
+    print(f"Reference: {results['reference_us']:.1f} us/file  "
+          f"Tokenizer: {results['parsed_us']:.1f} us/file  ({speedup:.2f}x)  "
+          f"Batch: {results['batch_us']:.1f} us/file")
+    return 1 if results["mismatches"] or results["batch_mismatches"] else 0
+
+
+def cmd_convert_mapping(args) -> int:
+    try:
+        rules = load_provider_rules(args.rules)
+    except Exception as e:
+        print(f"Could not load provider rules: {e}", file=sys.stderr)
+        return 2
+    organizer = BillOrganizer(rules=rules)
+    target = args.to or os.path.splitext(args.excel)[0] + FAST_MAPPING_EXTENSION
+    if os.path.abspath(target) == os.path.abspath(args.excel):
+        print("--to must differ from --excel", file=sys.stderr)
+        return 2
+
+    try:
+        started = time.perf_counter()
+        rows = read_mapping_rows(args.excel)
+        expected = organizer.build_mapping_from_rows(rows)
+        source_time = time.perf_counter() - started
+        written = write_mapping_rows(rows, target)
+        started = time.perf_counter()
+        converted = organizer.build_mapping_from_excel(target)
+        target_time = time.perf_counter() - started
+    except Exception as e:
+        print(f"Could not convert {args.excel}: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Wrote {written} rows to {target}")
+    print(f"Load: {source_time:.2f}s from {args.excel}, {target_time:.2f}s from {target}")
+    if converted != expected:
+        print(f"Index differs after conversion ({len(expected)} entries, {len(converted)} converted)",
+              file=sys.stderr)
+        return 1
+    print(f"Index: {len(converted)} entries, identical")
+    return 0
+
+
+def io_schedule_from_args(args):
+    """--io-config (or axora_io.json) with --max-mb-per-s / --max-ops-per-s / --low-priority on top"""
+    schedule = load_io_schedule(args.io_config)
+    if args.max_mb_per_s or args.max_ops_per_s:
+        schedule = IOSchedule(default=IOProfile(args.max_mb_per_s * 1e6, args.max_ops_per_s),
+                              low_priority=bool(schedule and schedule.low_priority))
+    if args.low_priority:
+        schedule = schedule or IOSchedule()
+        schedule.low_priority = True
+    return schedule
+
+
+def add_io_arguments(command):
+    command.add_argument("--io-config", help=f"I/O schedule JSON (default: {IO_SCHEDULE_FILE} if present)")
+    command.add_argument("--max-mb-per-s", type=float, default=0.0, help="Cap file traffic (overrides the schedule)")
+    command.add_argument("--max-ops-per-s", type=float, default=0.0,
+                         help="Cap filesystem calls (overrides the schedule)")
+    command.add_argument("--low-priority", action="store_true", help="Run at background CPU and I/O priority")
+
+
+def cmd_organize(args) -> int:
+    if not args.profile:
+        return _organize(args)
+    profiler = RunProfiler(profile_base("organize", args.report))
+    with profiler:
+        status = _organize(args)
+    print(f"Profile: {profiler.summary_path} (peak memory {profiler.peak / 1e6:.1f} MB)")
+    return status
+
+
+def _organize(args) -> int:
+    try:
+        rules = load_provider_rules(args.rules)
+    except Exception as e:
+        print(f"Could not load provider rules: {e}", file=sys.stderr)
+        return 2
+    try:
+        fs = scheduled_filesystem(LocalFileSystem(), io_schedule_from_args(args))
+    except Exception as e:
+        print(f"Could not load the I/O schedule: {e}", file=sys.stderr)
+        return 2
+    organizer = BillOrganizer(fs=fs, rules=rules)
+    organizer.verify_moves = args.verify
+    organizer.use_leases = not args.no_leases
+    index = MappingIndex(organizer.build_mapping_from_excel)
+    try:
+        index.set_sources(args.excel)
+    except Exception as e:
+        print(f"Error loading Excel file: {e}", file=sys.stderr)
+        return 2
+    organizer.use_mapping(index)
+    if not organizer.mapping:
+        print("No mapping entries found in the Excel file(s)", file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.dest):
+        print(f"Destination folder not found: {args.dest}", file=sys.stderr)
+        return 2
+
+    report = RunReportWriter(args.report) if args.report else None
+    # Shards run in other processes, which cannot share the manifest
+    manifest = None if args.no_manifest or args.shards > 1 else SourceManifest(args.manifest)
+    metrics_writer = None
+    if args.metrics_file:
+        METRICS.gauge("axora_mapping_entries", "Entries in the loaded account mapping",
+                      lambda: len(organizer.mapping))
+        metrics_writer = MetricsFileWriter(METRICS, args.metrics_file, args.metrics_interval).start()
+    try:
+        if args.shards > 1:
+            job = shard_job(args.excel, args.rules, args.verify, not args.no_leases,
+                            {"io_config": args.io_config,
+                             "max_mb_per_s": args.max_mb_per_s, "max_ops_per_s": args.max_ops_per_s,
+                             "low_priority": args.low_priority})
+            results = run_sharded(organizer, args.source, args.dest, job, args.shards, args.processes,
+                                  args.shard_dir, report=report)
+        else:
+            results = organize_files(organizer, args.source, args.dest, report=report, manifest=manifest)
+    except OrganizeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    finally:
+        if report is not None:
+            report.close()
+        if manifest is not None:
+            manifest.save()
+        if metrics_writer is not None:
+            metrics_writer.stop()
+    print(f"Total: {results['total']}  Moved: {results['moved']}  "
+          f"Skipped: {results['skipped']}  Not Found: {results['not_found']}"
+          + (f"  Failed verification: {results['failed']}" if results.get("failed") else "")
+          + (f"  (unchanged since last run: {results['unchanged']})" if results.get("unchanged") else "")
+          + (f"  (retried: {results['retried']})" if results.get("retried") else "")
+          + (f"  (checksums not recorded: {results['unrecorded']})" if results.get("unrecorded") else ""))
+    print(f"Elapsed: {results['metrics']['elapsed_s']:.2f}s  ({format_throughput(results['metrics'])})")
+    for shard in results.get("shards", ()):
+        print(f"  shard {shard['shard']}: {shard.get('total', 0)} files on {shard.get('host', '-')}"
+              f"  Moved: {shard.get('moved', 0)}" + (f"  FAILED: {shard['error']}" if shard.get("error") else ""))
+    if report is not None:
+        print(f"Report: {args.report} ({report.rows} rows)")
+    if results.get("errors"):
+        print(f"Shard jobs kept in {results['shard_dir']}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_shard_worker(args) -> int:
+    """Work through the sharded runs in a shared folder, as a helper machine"""
+    started = time.perf_counter()
+    ran = 0
+    try:
+        while True:
+            for name in sorted(os.listdir(args.dir)):
+                run_dir = os.path.join(args.dir, name)
+                if os.path.isdir(run_dir):
+                    ran += shard_worker(run_dir)
+            if not args.watch:
+                break
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    print(f"Ran {ran} shards ({time.perf_counter() - started:.2f}s)")
+    return 0
+
+
+def cmd_migrate(args) -> int:
+    fs = LocalFileSystem()
+    try:
+        if args.action == "plan":
+            if not args.dest:
+                print("--dest is required to plan a migration", file=sys.stderr)
+                return 2
+            started = time.perf_counter()
+            steps = plan_migration(fs, os.path.abspath(args.dest), args.workers)
+            save_migration_plan(args.plan, args.dest, steps)
+            counts = {}
+            for step in steps:
+                counts[step.action] = counts.get(step.action, 0) + 1
+            print(f"Planned {len(steps)} steps in {time.perf_counter() - started:.2f}s: "
+                  f"{counts.get('year', 0)} into year folders, {counts.get('rename', 0)} renames, "
+                  f"{counts.get('conflict', 0)} conflicts (left in place)")
+            print(f"Plan written to {args.plan}; run `migrate apply --plan {args.plan}` to carry it out")
+            return 0
+
+        dest_root, steps = load_migration_plan(args.plan)
+        started = time.perf_counter()
+        results = apply_migration(fs, steps, args.workers)
+    except (OrganizeError, OSError, ValueError, KeyError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    for step, reason in results["failed"][:20]:
+        print(f"FAILED {step.source} -> {step.target}: {reason}")
+    print(f"Moved: {results['moved']}  Failed: {len(results['failed'])}  "
+          f"Conflicts left in place: {results['conflicts']}  ({time.perf_counter() - started:.2f}s)")
+    return 1 if results["failed"] else 0
+
+
+def cmd_coverage(args) -> int:
+    scanner = CoverageScanner(cache_path=None if args.no_cache else args.cache)
+    started = time.perf_counter()
+    try:
+        matrix = scanner.scan(args.dest)
+    except OrganizeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    rows = list(matrix.rows())
+    with_gaps = [r for r in rows if r["missing"]]
+    for row in with_gaps[:args.show]:
+        missing = row["missing"]
+        shown = ", ".join(missing[:6]) + (f" (+{len(missing) - 6} more)" if len(missing) > 6 else "")
+        print(f"{row['corp']} / {row['provider']} / {row['account']}: missing {shown}")
+    print(f"Accounts: {len(rows)}  With gaps: {len(with_gaps)}  "
+          f"Months: {matrix.months[0] + ' to ' + matrix.months[-1] if matrix.months else 'none'}")
+    print(f"Scanned in {elapsed:.2f}s ({len(scanner.cache)} folders, {scanner.listed} re-listed)")
+    if args.export:
+        matrix.export(args.export)
+        print(f"Coverage matrix written to {args.export}")
+    return 0
+
+
+def cmd_verify(args) -> int:
+    shown = [0]
+
+    def on_problem(status, path, detail):
+        if shown[0] < args.show:
+            print(f"{status.upper():10} {path}" + (f"  ({detail})" if detail else ""))
+        shown[0] += 1
+
+    started = time.perf_counter()
+    try:
+        totals = verify_tree(LocalFileSystem(), args.dest, args.workers, args.update, on_problem)
+    except OrganizeError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    print(f"Accounts: {totals['accounts']}  Verified: {totals['verified']}  Archived: {totals['archived']}  "
+          f"Missing: {totals['missing']}  "
+          f"Mismatched: {totals['mismatch']}  Untracked: {totals['untracked']}"
+          + (f"  Recorded: {totals['recorded']}" if args.update else "")
+          + f"  ({time.perf_counter() - started:.2f}s)")
+    return 1 if totals["missing"] or totals["mismatch"] else 0
+
+
+def cmd_archive(args) -> int:
+    shown = [0]
+
+    def on_problem(status, path, detail):
+        if shown[0] < args.show:
+            print(f"{status.upper():10} {path}  ({detail})")
+        shown[0] += 1
+
+    started = time.perf_counter()
+    try:
+        totals = archive_tree(LocalFileSystem(), args.dest, args.before, args.workers,
+                              compress=args.compress, dry_run=args.dry_run, on_problem=on_problem)
+    except OrganizeError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    verb = "Would archive" if args.dry_run else "Archived"
+    print(f"{verb} {totals['files']} bills ({totals['bytes'] / 1e6:.1f} MB) from {totals['accounts']} accounts "
+          f"into {totals['archives']} archives  Conflicts: {totals['conflicts']}  Failed: {totals['failed']}  "
+          f"({time.perf_counter() - started:.2f}s)")
+    return 1 if totals["failed"] else 0
+
+
+def cmd_serve(args) -> int:
+    if not os.path.isdir(args.dest):
+        print(f"Destination folder not found: {args.dest}", file=sys.stderr)
+        return 2
+    try:
+        rules = load_provider_rules(args.rules)
+        fs = scheduled_filesystem(LocalFileSystem(), io_schedule_from_args(args))
+        service = OrganizerService(args.excel, args.dest, rules=rules, workers=args.workers, fs=fs,
+                                   use_leases=not args.no_leases)
+    except Exception as e:
+        print(f"Could not start the service: {e}", file=sys.stderr)
+        return 2
+    server = run_service(service, args.port)
+    print(f"Axora service on http://127.0.0.1:{server.server_address[1]}  "
+          f"({len(service.organizer.mapping)} mapping entries, dest {args.dest})")
+    metrics_writer = (MetricsFileWriter(METRICS, args.metrics_file, args.metrics_interval).start()
+                      if args.metrics_file else None)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if metrics_writer is not None:
+            metrics_writer.stop()
+    return 0
+
+
+def build_cli_parser():
+    """Headless commands; running with no command opens the GUI"""
+    parser = argparse.ArgumentParser(prog="axora", description="Axora - Utility Bill Organizer")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    simulate = commands.add_parser("simulate", help="Benchmark an organize run on an in-memory filesystem")
+    simulate.add_argument("--files", type=int, default=10000, help="Number of bills to generate")
+    simulate.add_argument("--accounts", type=int, default=500, help="Number of mapped accounts (max 10000)")
+    simulate.add_argument("--latency-ms", type=float, default=0.0, help="Latency added to every filesystem call")
+    simulate.add_argument("--failure-rate", type=float, default=0.0,
+                          help="Probability (0-1) that a move or makedirs fails")
+    simulate.add_argument("--seed", type=int, default=0)
+    simulate.set_defaults(handler=cmd_simulate)
+
+    organize = commands.add_parser("organize", help="Organize bills without the GUI")
+    organize.add_argument("--excel", required=True, nargs="+",
+                          help="Mapping workbook(s), first listed wins on conflicts")
+    organize.add_argument("--source", required=True, help="Source PDF or folder of PDFs")
+    organize.add_argument("--dest", required=True, help="Utilities destination folder")
+    organize.add_argument("--rules", help=f"Provider rules JSON (default: {PROVIDER_RULES_FILE})")
+    organize.add_argument("--report", help="Write a per-file report (.csv, or .jsonl for JSON lines)")
+    organize.add_argument("--manifest", default=SOURCE_MANIFEST_FILE,
+                          help="Source manifest used to skip files unchanged since the last run")
+    organize.add_argument("--no-manifest", action="store_true", help="Re-check every source file")
+    organize.add_argument("--verify", action="store_true",
+                          help="Checksum each bill before and after its move and record it per account")
+    organize.add_argument("--no-leases", action="store_true",
+                          help="Skip account lock files (only when no other workstation uses --dest)")
+    add_io_arguments(organize)
+    organize.add_argument("--profile", action="store_true",
+                          help="Profile CPU and memory; files go next to --report or under " + REPORTS_DIR)
+    organize.add_argument("--metrics-file", help="Keep OpenMetrics text for this run in this file")
+    organize.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds between metrics rewrites")
+    organize.add_argument("--shards", type=int, default=1,
+                          help="Split the run into this many jobs by account, each in its own process")
+    organize.add_argument("--processes", type=int,
+                          help="Local processes for --shards (default: one per shard up to the CPU count; "
+                               "0 leaves them all to shard-worker on other machines)")
+    organize.add_argument("--shard-dir", default=SHARDS_DIR,
+                          help="Folder for the shard job files; a shared folder lets other machines help")
+    organize.set_defaults(handler=cmd_organize)
+
+    shard = commands.add_parser("shard-worker", help="Help with the sharded runs in a shared --shard-dir")
+    shard.add_argument("--dir", required=True, help="The --shard-dir of the organizing machine")
+    shard.add_argument("--watch", type=float, default=0.0,
+                       help="Keep looking for new runs every this many seconds (default: run once)")
+    shard.set_defaults(handler=cmd_shard_worker)
+
+    verify = commands.add_parser("verify", help="Check organized bills against their checksum manifests")
+    verify.add_argument("--dest", required=True, help="Organized Utilities folder")
+    verify.add_argument("--workers", type=int, default=8, help="Files hashed in parallel")
+    verify.add_argument("--update", action="store_true", help="Record checksums for bills not yet tracked")
+    verify.add_argument("--show", type=int, default=50, help="Problems to print")
+    verify.set_defaults(handler=cmd_verify)
+
+    migrate = commands.add_parser("migrate",
+                                  help="Move every dated bill of an existing tree into year folders")
+    migrate.add_argument("action", choices=("plan", "apply"))
+    migrate.add_argument("--dest", help="Utilities folder to plan for")
+    migrate.add_argument("--plan", default="axora_migration.json", help="Plan file to write or apply")
+    migrate.add_argument("--workers", type=int, default=8, help="Accounts processed in parallel")
+    migrate.set_defaults(handler=cmd_migrate)
+
+    coverage = commands.add_parser("coverage", help="Show which months each account has bills for")
+    coverage.add_argument("--dest", required=True, help="Organized Utilities folder")
+    coverage.add_argument("--export", help="Write the account x month matrix (.csv or .xlsx)")
+    coverage.add_argument("--cache", default=COVERAGE_CACHE_FILE, help="Directory listing cache")
+    coverage.add_argument("--no-cache", action="store_true", help="Scan without reading or writing the cache")
+    coverage.add_argument("--show", type=int, default=20, help="Accounts with gaps to print")
+    coverage.set_defaults(handler=cmd_coverage)
+
+    archive = commands.add_parser("archive", help="Pack old year folders into one zip per account and year")
+    archive.add_argument("--dest", required=True, help="Organized Utilities folder")
+    archive.add_argument("--before", type=int, required=True, help="Archive year folders older than this year")
+    archive.add_argument("--workers", type=int, default=8, help="Accounts archived in parallel")
+    archive.add_argument("--compress", action="store_true", help="Deflate members (PDFs are stored as-is by default)")
+    archive.add_argument("--dry-run", action="store_true", help="Only report what would be archived")
+    archive.add_argument("--show", type=int, default=20, help="Problems to print")
+    archive.set_defaults(handler=cmd_archive)
+
+    serve = commands.add_parser("serve", help="Run the local JSON API for submitting bills")
+    serve.add_argument("--excel", required=True, nargs="+",
+                       help="Mapping workbook(s), first listed wins on conflicts")
+    serve.add_argument("--dest", required=True, help="Default Utilities destination folder")
+    serve.add_argument("--rules", help=f"Provider rules JSON (default: {PROVIDER_RULES_FILE})")
+    serve.add_argument("--port", type=int, default=SERVICE_PORT, help="Port on 127.0.0.1")
+    serve.add_argument("--workers", type=int, default=4, help="Organize jobs run at the same time")
+    serve.add_argument("--no-leases", action="store_true",
+                       help="Skip account lock files (only when no other workstation uses --dest)")
+    add_io_arguments(serve)
+    serve.add_argument("--metrics-file", help="Also keep OpenMetrics text in this file (always at GET /metrics)")
+    serve.add_argument("--metrics-interval", type=float, default=10.0, help="Seconds between metrics rewrites")
+    serve.set_defaults(handler=cmd_serve)
+
+    check = commands.add_parser("parser-check",
+                                help="Compare the filename parser with the reference parsers on your filenames")
+    check.add_argument("corpus", nargs="+", help="Text file of filenames to check, one per line")
+    check.add_argument("--show", type=int, default=20, help="Mismatches to print")
+    check.set_defaults(handler=cmd_parser_check)
+
+    convert = commands.add_parser("convert-mapping",
+                                  help="Convert a mapping workbook to a format that loads faster")
+    convert.add_argument("--excel", required=True, help="Mapping file to convert")
+    convert.add_argument("--to", help=f"Output .csv, .sqlite or .parquet "
+                                      f"(default: next to --excel as {FAST_MAPPING_EXTENSION})")
+    convert.add_argument("--rules", help=f"Provider rules JSON (default: {PROVIDER_RULES_FILE})")
+    convert.set_defaults(handler=cmd_convert_mapping)
+
+    return parser, commands
+
+
 # ------------------------------ Entry ------------------------------
 
 def main():
+    multiprocessing.freeze_support()  # shard processes of a packaged build
+    parser, commands = build_cli_parser()
+    if len(sys.argv) > 1 and sys.argv[1] in commands.choices:
+        args = parser.parse_args()
+        sys.exit(args.handler(args))
+
     app = QApplication(sys.argv)
     app.setApplicationName("Axora")
     app.setApplicationVersion("2.3")
@@ -0,0 +1,100 @@
+"""Generated bill filenames for the parser tests"""
+
+import os
+import random
+
+FILENAME_MAX_LENGTH = 255  # Longest name most filesystems accept; the reference parser is compared up to it
+
+
+def generate_filename_corpus(count: int, seed: int = 0) -> list[str]:
+    """Bill filenames in the formats seen in inboxes, a fifth of them mangled.
+
+    Covers phone/account spellings, extensions in parentheses or after a
+    double space, every supported date format, provider prefixes and copies
+    ("(1)"), then randomly edits some names to reach the parser's corner cases.
+    """
+    rng = random.Random(seed)
+
+    def digits(n):
+        return "".join(rng.choice("0123456789") for _ in range(n))
+
+    def account():
+        a, b, c = digits(3), digits(3), digits(4)
+        return rng.choice([a + b + c, f"{a} {b} {c}", f"{a}-{b}-{c}", f"({a}) {b}-{c}",
+                           digits(9), digits(rng.randint(5, 12)), f"X{digits(8)}"])
+
+    def date():
+        y, m, d = rng.randint(1995, 2029), rng.randint(1, 12), rng.randint(1, 31)
+        return rng.choice([f"_{y}-{m:02d}-{d:02d}", f"_{y % 100:02d}-{m:02d}-{d:02d}",
+                           f" {y}-{m:02d}-{d:02d}", f" {y % 100:02d}-{m:02d}-{d:02d}",
+                           f"-{y}{m:02d}{d:02d}", f"{y}-{m:02d}-{d:02d}", ""])
+
+    prefixes = ("", "", "Bell ", "TELUS_", "Rogers - ", "Invoice ", "Enbridge ", "Facture_")
+    suffixes = ("", "", "", " (1)", " copy", "_final", " (2)")
+    noise = "0123456789 -_()aX."
+    names = []
+    for _ in range(count):
+        shape = rng.random()
+        if shape < 0.2:
+            name = f"{account()}  {digits(rng.randint(2, 4))}-{digits(4)}{digits(4)}"
+        elif shape < 0.4:
+            name = f"{account()} ({rng.choice([digits(3), 'EXT ' + digits(3), 'ab12', digits(7)])}){date()}"
+        else:
+            name = f"{rng.choice(prefixes)}{account()}{date()}"
+        name += rng.choice(suffixes)
+        if rng.random() < 0.2:
+            chars = list(name)
+            for _ in range(rng.randint(1, 4)):
+                pos = rng.randrange(len(chars) + 1)
+                op = rng.random()
+                if op < 0.4:
+                    chars.insert(pos, rng.choice(noise))
+                elif chars and op < 0.7:
+                    del chars[min(pos, len(chars) - 1)]
+                elif chars:
+                    chars[min(pos, len(chars) - 1)] = rng.choice(noise)
+            name = "".join(chars)
+        names.append(name + rng.choice((".pdf", ".pdf", ".PDF")))
+    return names
+
+
+# Pieces the parser's rules react to. Long runs of them, and mixtures, are the
+# names that used to make substitution chains backtrack or copy quadratically.
+ADVERSARIAL_FRAGMENTS = (
+    "1", "0", " ", "-", "_", "(", ")", "()", "(ab)", "(12)", "19", "20", "1919", "2024",
+    "11-11-", "2024-09-15", "-20240915", "_24-09-15", " 123-", "  877-", " 1234",
+    "416 555 ", "416-555-", "4165551234", "X", "ab", "é", "\t", ".", "Bell ", "enbridge ", "hydro one",
+)
+
+
+def generate_adversarial_names(count: int, seed: int = 0, max_length: int = 1000) -> list[str]:
+    """Filenames built to hit the parser's worst cases.
+
+    Each is a long run of one fragment, a random mixture of runs, or an
+    ordinary bill name with a long run spliced in. Most stay within
+    FILENAME_MAX_LENGTH; the rest go up to ``max_length`` characters.
+    """
+    rng = random.Random(seed)
+    ordinary = generate_filename_corpus(max(count // 10, 1), seed=seed)
+    names = []
+    for _ in range(count):
+        limit = max_length if rng.random() < 0.3 else min(max_length, FILENAME_MAX_LENGTH)
+        length = rng.randint(1, max(limit, 1))
+        shape = rng.random()
+        if shape < 0.3:
+            fragment = rng.choice(ADVERSARIAL_FRAGMENTS)
+            body = fragment * (length // len(fragment) + 1)
+        elif shape < 0.7:
+            pieces, size = [], 0
+            while size < length:
+                piece = rng.choice(ADVERSARIAL_FRAGMENTS) * rng.choice((1, 2, rng.randint(3, 200)))
+                pieces.append(piece)
+                size += len(piece)
+            body = "".join(pieces)
+        else:
+            base = os.path.splitext(rng.choice(ordinary))[0]
+            run = rng.choice(ADVERSARIAL_FRAGMENTS) * rng.randint(1, length)
+            pos = rng.randint(0, len(base))
+            body = base[:pos] + run + base[pos:]
+        names.append(body[:length] + rng.choice((".pdf", ".pdf", ".PDF", "", ".pdf.pdf", ".txt")))
+    return names
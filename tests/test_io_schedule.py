@@ -0,0 +1,38 @@
+"""Choosing the I/O budget for the time of day"""
+
+from datetime import datetime
+
+import pytest
+
+import axora
+
+MONDAY = datetime(2024, 9, 16)
+
+
+def schedule(*profiles):
+    return axora.IOSchedule.from_dict({"default": {"ops_per_s": 1},
+                                       "profiles": [{"ops_per_s": 40, **p} for p in profiles]})
+
+
+def ops_at(sched, hour, minute=0, day=MONDAY):
+    return sched.current(day.replace(hour=hour, minute=minute)).ops_per_s
+
+
+def test_times_without_leading_zero():
+    sched = schedule({"days": "mon-fri", "start": "8:00", "end": "18:00"})
+    assert [ops_at(sched, h) for h in (7, 8, 9, 10, 17, 18)] == [1, 40, 40, 40, 40, 1]
+    assert sched.profiles[0][2:4] == (8 * 60, 18 * 60)
+
+
+def test_overnight_window():
+    sched = schedule({"days": "mon", "start": "22:30", "end": "6:00"})
+    assert ops_at(sched, 22, 29) == 1 and ops_at(sched, 22, 30) == 40
+    assert ops_at(sched, 5, 59, day=MONDAY.replace(day=17)) == 40
+    assert ops_at(sched, 6, 0, day=MONDAY.replace(day=17)) == 1
+    assert ops_at(sched, 5, 0) == 1  # after Sunday night, which is not in the profile
+
+
+@pytest.mark.parametrize("value", ["8", "8:0", "25:00", "24:01", "8:60", "08:00am", 800, None])
+def test_malformed_times_are_rejected_at_load(value):
+    with pytest.raises(ValueError, match="start must be a time"):
+        schedule({"start": value})
@@ -0,0 +1,59 @@
+"""Per-thread metric shards across many short-lived threads"""
+
+import threading
+
+import axora
+
+
+def registry_for():
+    registry = axora.MetricsRegistry()
+    registry.counter("axora_requests", "Requests handled")
+    registry.histogram("axora_request_seconds", "Request time", buckets=(0.1, 1.0))
+    return registry
+
+
+def record(registry):
+    registry.inc("axora_requests", labels=(("code", "200"),))
+    registry.observe("axora_request_seconds", 0.5)
+
+
+def test_exited_threads_are_folded_into_the_base_total():
+    registry = registry_for()
+    for _ in range(50):
+        threads = [threading.Thread(target=record, args=(registry,)) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(registry._shards) <= 10
+    values = registry.collect()
+    assert len(registry._shards) <= 1
+    assert values[("axora_requests", (("code", "200"),))] == 500
+    assert values[("axora_request_seconds", ())] == [0, 500, 0, 250.0]
+
+
+def test_live_thread_and_exited_threads_add_up():
+    registry = registry_for()
+    record(registry)
+    for _ in range(3):
+        thread = threading.Thread(target=record, args=(registry,))
+        thread.start()
+        thread.join()
+    assert 'axora_requests_total{code="200"} 4' in registry.render()
+
+
+def test_meter_fed_by_reports_counts_bytes_and_leaves_in_flight_out():
+    meter = axora.ThroughputMeter()
+    meter.start(3, 3000)
+    for _ in range(2):
+        meter.file_reported(1000)
+    snapshot = meter.snapshot()
+    assert (snapshot["done"], snapshot["bytes"]) == (2, 2000)
+    assert "in_flight" not in snapshot
+    assert "in progress" not in axora.format_throughput(snapshot)
+
+
+def test_report_rows_keep_the_file_size():
+    outcome = axora.FileOutcome("/inbox/4165551234_2024-09-15.pdf", "moved")
+    outcome.size = 1234
+    assert axora.FileOutcome.from_dict(outcome.as_dict()).size == 1234
@@ -0,0 +1,59 @@
+"""Bulk year reorganization of an account tree"""
+
+import os
+
+import axora
+
+ACCOUNT = os.path.abspath(os.path.join("Utilities", "1001", "Bell", "1234"))
+
+
+class LeaseCheckingFileSystem(axora.MemoryFileSystem):
+    """Records whether the account's lease was held for each bill moved"""
+
+    def __init__(self):
+        super().__init__()
+        self.moves = []
+
+    def move(self, src, dst):
+        if not os.path.basename(src).startswith(".axora"):
+            self.moves.append((os.path.basename(dst), self.exists(os.path.join(ACCOUNT, axora.LEASE_FILE_NAME))))
+        super().move(src, dst)
+
+
+def tree(fs, *names):
+    for name in names:
+        fs.write_file(os.path.join(ACCOUNT, name), b"%PDF " + name.encode())
+
+
+def test_moves_hold_the_account_lease():
+    fs = LeaseCheckingFileSystem()
+    tree(fs, "4165551234_2023-05-01.pdf", "2024/4165551234_2024-09-15.pdf")
+    results = axora.apply_migration(fs, axora.plan_migration(fs, os.path.abspath("Utilities")))
+    assert results == {"moved": 2, "failed": [], "conflicts": 0}
+    assert sorted(fs.moves) == [("23-05-01.pdf", True), ("24-09-15.pdf", True)]
+    assert not fs.exists(os.path.join(ACCOUNT, axora.LEASE_FILE_NAME))
+
+
+def test_archived_year_is_a_conflict_when_planning():
+    fs = axora.MemoryFileSystem()
+    tree(fs, "2024/24-01-15.pdf")
+    assert axora.archive_account_year(fs, ACCOUNT, "2024")["files"] == 1
+    tree(fs, "4165551234_2024-09-15.pdf", "4165551234_2023-05-01.pdf")
+    steps = axora.plan_account_migration(fs, ACCOUNT)
+    assert sorted((os.path.basename(s.target), s.action) for s in steps) == [
+        ("23-05-01.pdf", "year"), ("24-09-15.pdf", "conflict")]
+    results = axora.apply_migration(fs, steps)
+    assert (results["moved"], results["conflicts"]) == (1, 1)
+    assert fs.exists(os.path.join(ACCOUNT, "4165551234_2024-09-15.pdf"))
+    assert not fs.exists(os.path.join(ACCOUNT, "2024", "24-09-15.pdf"))
+
+
+def test_year_archived_after_planning_is_left_in_place():
+    fs = axora.MemoryFileSystem()
+    tree(fs, "4165551234_2024-09-15.pdf")
+    steps = axora.plan_account_migration(fs, ACCOUNT)
+    assert [s.action for s in steps] == ["year"]
+    fs.write_file(os.path.join(ACCOUNT, "2024.zip"), b"PK")
+    results = axora.apply_migration(fs, steps)
+    assert (results["moved"], results["failed"], results["conflicts"]) == (0, [], 1)
+    assert fs.exists(os.path.join(ACCOUNT, "4165551234_2024-09-15.pdf"))
@@ -0,0 +1,87 @@
+"""Organizing bills on an in-memory tree"""
+
+import json
+import os
+
+import axora
+
+INBOX = os.path.abspath("inbox")
+DEST = os.path.abspath("Utilities")
+BILL = "4165551234_2024-09-15.pdf"
+TARGET = os.path.join(DEST, "1001", "Bell", "1234", "2024", "24-09-15.pdf")
+
+
+class CorruptingFileSystem(axora.MemoryFileSystem):
+    """A share that flips a byte of every bill that crosses it: written copies and moves between folders"""
+
+    corrupting = False
+
+    @staticmethod
+    def _corrupt(data: bytes) -> bytes:
+        return bytes([data[0] ^ 0xFF]) + data[1:] if data else data
+
+    def write_file(self, path, data=b""):
+        if self.corrupting and not path.endswith(".json"):
+            data = self._corrupt(data)
+        super().write_file(path, data)
+
+    def move(self, src, dst):
+        super().move(src, dst)
+        if self.corrupting and os.path.dirname(self._norm(src)) != os.path.dirname(self._norm(dst)):
+            norm = self._norm(dst)
+            self._files[norm] = self._corrupt(self._files[norm])
+
+
+def organizer_for(fs):
+    fs.makedirs(DEST)
+    fs.makedirs(INBOX)
+    with fs.open(os.path.join(INBOX, BILL), "wb") as f:
+        f.write(b"%PDF-1.4 bill")
+    organizer = axora.BillOrganizer(fs=fs)
+    organizer.mapping[("BELL", "1234")] = {"provider": "BELL", "corp": "1001"}
+    organizer.verify_moves = True
+    return organizer
+
+
+def bills_under(fs, folder):
+    found = []
+    for name, is_dir in fs.scandir(folder):
+        path = os.path.join(folder, name)
+        if is_dir:
+            found += bills_under(fs, path)
+        elif not name.startswith("."):
+            found.append(path)
+    return found
+
+
+def test_verified_move_records_checksum():
+    fs = axora.MemoryFileSystem()
+    counts = axora.organize_files(organizer_for(fs), INBOX, DEST)
+    assert counts["moved"] == 1 and counts["failed"] == 0
+    assert not fs.exists(os.path.join(INBOX, BILL))
+    assert bills_under(fs, DEST) == [TARGET]
+    with fs.open(os.path.join(os.path.dirname(os.path.dirname(TARGET)), axora.CHECKSUM_MANIFEST_NAME), "r") as f:
+        assert list(json.load(f)["files"]) == ["2024/24-09-15.pdf"]
+
+
+def test_corrupted_copy_keeps_the_source():
+    fs = CorruptingFileSystem()
+    organizer = organizer_for(fs)
+    fs.corrupting = True
+    outcomes = []
+    counts = axora.organize_files(organizer, INBOX, DEST, on_result=outcomes.append)
+    assert counts["failed"] == 1 and counts["moved"] == 0
+    assert outcomes[0].status == "failed"
+    with fs.open(os.path.join(INBOX, BILL), "rb") as f:
+        assert f.read() == b"%PDF-1.4 bill"
+    assert bills_under(fs, DEST) == []
+
+
+def test_corrupting_share_without_verification_loses_the_bill():
+    fs = CorruptingFileSystem()
+    organizer = organizer_for(fs)
+    organizer.verify_moves = False
+    fs.corrupting = True
+    assert axora.organize_files(organizer, INBOX, DEST)["moved"] == 1
+    with fs.open(TARGET, "rb") as f:
+        assert f.read() != b"%PDF-1.4 bill"
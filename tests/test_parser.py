@@ -0,0 +1,90 @@
+"""The filename tokenizer against the reference parsers and a golden corpus.
+
+golden_filenames.jsonl holds [name, [last4, ext, date, year, final_name]]
+rows recorded from the reference parsers; any change to what a filename
+parses to shows up here.
+"""
+
+import json
+import os
+
+import pytest
+
+import axora
+from corpus import generate_filename_corpus
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_filenames.jsonl")
+
+
+@pytest.fixture(scope="module")
+def golden():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return [(name, tuple(expected)) for name, expected in map(json.loads, f)]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return generate_filename_corpus(20000, seed=0)
+
+
+def reference_parse(organizer, name):
+    return (*organizer.extract_account_tokens(name), *organizer.extract_date_targets(name))
+
+
+def test_tokenizer_matches_golden_corpus(golden):
+    mismatches = [(name, expected, tuple(axora.parse_filename(name))) for name, expected in golden
+                  if tuple(axora.parse_filename(name)) != expected]
+    assert mismatches == []
+
+
+def test_reference_matches_golden_corpus(golden):
+    reference = axora.BillOrganizer()
+    mismatches = [(name, expected, reference_parse(reference, name)) for name, expected in golden
+                  if reference_parse(reference, name) != expected]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("4165551234_2024-09-15.pdf", ("1234", "", "2024-09-15", "2024", "24-09-15.pdf")),
+    ("9055559876 (123)_2024-10-15.pdf", ("9876", "123", "2024-10-15", "2024", "24-10-15.pdf")),
+    ("905 555 9876  877-20241015.pdf", ("9876", "877", "2024-10-15", "2024", "24-10-15.pdf")),
+    ("TELUS_7805551234_19-12-01.pdf", ("1234", "", "2019-12-01", "2019", "19-12-01.pdf")),
+    ("4165551234.pdf", ("1234", "", "", "", "")),
+    ("no digits here.pdf", ("", "", "", "", "")),
+])
+def test_common_shapes(name, expected):
+    assert tuple(axora.parse_filename(name)) == expected
+
+
+def test_tokenizer_matches_reference(corpus):
+    reference = axora.BillOrganizer()
+    mismatches = [(name, reference_parse(reference, name), tuple(axora.parse_filename(name)))
+                  for name in corpus if reference_parse(reference, name) != tuple(axora.parse_filename(name))]
+    assert mismatches == []
+
+
+def test_batch_matches_tokenizer(corpus):
+    table = axora.parse_filenames(corpus)
+    batch = zip(*(table[field].tolist() for field in axora.ParsedFilename._fields))
+    mismatches = [(name, tuple(axora.parse_filename(name)), row) for name, row in zip(corpus, batch)
+                  if tuple(axora.parse_filename(name)) != row]
+    assert mismatches == []
+
+
+def test_parser_check_command(golden, tmp_path, capsys):
+    names = tmp_path / "names.txt"
+    names.write_text("\n".join(name for name, _ in golden) + "\n", encoding="utf-8")
+    parser, _ = axora.build_cli_parser()
+    args = parser.parse_args(["parser-check", str(names)])
+    assert args.handler(args) == 0
+    assert f"Checked: {len(golden)}  Mismatches: 0" in capsys.readouterr().out
+
+
+def test_match_batch_matches_match_account(corpus):
+    organizer = axora.BillOrganizer()
+    providers = organizer.rules.providers
+    for i in range(0, 10000, 3):
+        provider = providers[i % len(providers)]
+        organizer.mapping[(provider, f"{i:04d}")] = {"corp": str(i), "provider": provider}
+    batch = organizer.match_batch(corpus)
+    assert [name for name in corpus if batch[name] != organizer.match_account(name)] == []
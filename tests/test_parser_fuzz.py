@@ -0,0 +1,82 @@
+"""Adversarial filenames: long runs of digits, spaces, dashes, brackets and dates.
+
+Every name must parse (and go through the provider patterns) within a time
+budget, cost no more than linearly more as it gets longer, and parse exactly
+as the reference parsers do.
+"""
+
+import os
+import time
+
+import pytest
+
+import axora
+from corpus import ADVERSARIAL_FRAGMENTS, FILENAME_MAX_LENGTH, generate_adversarial_names
+
+PARSE_BUDGET_MS = 5.0  # Longest one filename may take to parse and match
+GROWTH_LENGTH = 1000
+GROWTH_FACTOR = 16  # A name this many times longer may cost at most twice as many times more
+
+
+@pytest.fixture(scope="module")
+def names():
+    return generate_adversarial_names(5000, seed=0, max_length=1000)
+
+
+@pytest.fixture(scope="module")
+def rules():
+    return axora.ProviderRules.default()
+
+
+def parse_seconds(name, rules, repeat=1):
+    """Best of ``repeat`` timings of everything a run does to one filename's text"""
+    best = float("inf")
+    base = os.path.splitext(name)[0]
+    for _ in range(repeat):
+        started = time.perf_counter()
+        axora.parse_filename(name)
+        rules.match_filename(base)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def test_every_name_within_budget(names, rules):
+    budget = PARSE_BUDGET_MS / 1000.0
+    over_budget = []
+    for name in names:
+        elapsed = parse_seconds(name, rules)
+        if elapsed > budget:
+            # Time it again so a scheduler hiccup does not count
+            elapsed = min(elapsed, parse_seconds(name, rules, repeat=2))
+        if elapsed > budget:
+            over_budget.append((round(elapsed * 1000.0, 2), len(name), name[:80]))
+    assert over_budget == []
+
+
+@pytest.mark.parametrize("fragment", ADVERSARIAL_FRAGMENTS)
+def test_cost_grows_linearly(fragment, rules):
+    short = (fragment * GROWTH_LENGTH)[:GROWTH_LENGTH] + ".pdf"
+    long = (fragment * GROWTH_LENGTH * GROWTH_FACTOR)[:GROWTH_LENGTH * GROWTH_FACTOR] + ".pdf"
+    ratio = parse_seconds(long, rules, repeat=3) / max(parse_seconds(short, rules, repeat=3), 1e-9)
+    assert ratio <= 2 * GROWTH_FACTOR
+
+
+def test_matches_reference(names):
+    reference = axora.BillOrganizer()
+    mismatches = []
+    for name in names:
+        if len(name) > FILENAME_MAX_LENGTH:
+            continue
+        expected = (*reference.extract_account_tokens(name), *reference.extract_date_targets(name))
+        parsed = tuple(axora.parse_filename(name))
+        if parsed != expected:
+            mismatches.append((name, expected, parsed))
+    assert mismatches == []
+
+
+def test_batch_matches_per_name(names):
+    table = axora.parse_filenames(names)
+    batch = zip(*(table[field].tolist() for field in axora.ParsedFilename._fields))
+    mismatches = [(name, tuple(axora.parse_filename(name)), row) for name, row in zip(names, batch)
+                  if tuple(axora.parse_filename(name)) != row]
+    assert mismatches == []
@@ -0,0 +1,67 @@
+"""Provider filename patterns combined into one matcher"""
+
+import pytest
+
+import axora
+
+
+def rules(*patterns):
+    return axora.ProviderRules({"providers": [{"name": name, "filename_patterns": [pattern]}
+                                              for name, pattern in patterns]})
+
+
+def test_group_names_may_repeat_across_rules():
+    combined = rules(("ACME", r"acme[\s_-]*(?P<account>\d{6,12})(?:[\s_-]*(?P<date>\d{4}))?"),
+                     ("BEE", r"bee[\s_-]*(?P<account>\d{6,12})[\s_-]*(?P<date>\d{4})(?P=date)?"),
+                     ("BZ", r"(?P<date>x)?bz(?(date)y|z)(?P<account>\d{6,12})"))
+    assert combined.match_filename("acme 1234567890 2024") == ("ACME", "7890", "")
+    assert combined.match_filename("bee 1234567 20242024") == ("BEE", "4567", "")
+    assert combined.match_filename("xbzy12345678") == ("BZ", "5678", "")
+    assert combined.match_filename("bzz12345678") == ("BZ", "5678", "")
+
+
+def test_escaped_parenthesis_is_not_a_group():
+    assert rules(("D", r"d\\(?P<account>\d{6})")).match_filename("d\\123456") == ("D", "3456", "")
+
+
+@pytest.mark.parametrize("pattern", [r"d(?P<account>\d{6})\1", r"d(?P<account>\d{6})(?(1)x|y)",
+                                     r"d(\d)(?P<account>\d{6})"])
+def test_numbered_groups_are_rejected(pattern):
+    with pytest.raises(ValueError, match="named groups"):
+        rules(("D", pattern))
+
+
+def test_token_length_keys_mapping_and_bill_names():
+    rules = axora.ProviderRules({"providers": [
+        {"name": "BELL"},
+        {"name": "ACME", "folder": "Acme", "filename_patterns": [r"acme[\s_-]*(?P<account>\d{6,12})"],
+         "token_length": 6},
+        {"name": "TELUS", "folder": "Telus", "token_length": 5},
+    ]})
+    fs = axora.MemoryFileSystem()
+    inbox, dest = "/inbox", "/Utilities"
+    fs.makedirs(dest)
+    fs.makedirs(inbox)
+    names = ["ACME_99123456_2024-09-15.pdf", "7805551234_2024-10-01.pdf", "4165559999_2024-11-01.pdf"]
+    for name in names:
+        fs.write_file(f"{inbox}/{name}", b"%PDF")
+    organizer = axora.BillOrganizer(fs=fs, rules=rules)
+    organizer.mapping = organizer.build_mapping_from_rows([
+        ("ACME", "", ""), ("Site", "1001", "99-123456"),
+        ("TELUS", "", ""), ("Site", "1002", "780-555-1234"),
+        ("BELL", "", ""), ("Site", "1003", "416-555-9999"),
+    ])
+    assert set(organizer.mapping) == {("ACME", "123456"), ("TELUS", "51234"), ("BELL", "9999")}
+    assert organizer.match_batch(names) == {name: organizer.match_account(name) for name in names}
+
+    counts = axora.organize_files(organizer, inbox, dest)
+    assert counts["moved"] == 3
+    assert fs.exists(f"{dest}/1001/Acme/123456/2024/24-09-15.pdf")
+    assert fs.exists(f"{dest}/1002/Telus/51234/2024/24-10-01.pdf")
+    assert fs.exists(f"{dest}/1003/Bell/9999/2024/24-11-01.pdf")
+
+
+@pytest.mark.parametrize("token_length", [0, -3, "four"])
+def test_token_length_must_be_positive(token_length):
+    with pytest.raises(ValueError, match="token_length"):
+        axora.ProviderRules({"providers": [{"name": "D", "token_length": token_length}]})